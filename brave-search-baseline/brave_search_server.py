@@ -21,6 +21,7 @@ class SearchRequest(BaseModel):
     query: str
     limit: Optional[int] = 5
     timeout: Optional[float] = 2.0
+    extra_snippets: Optional[bool] = False
 
 class SearchResponse(BaseModel):
     query: str
@@ -37,7 +38,7 @@ class BraveSearchClient:
         self.min_request_interval = 2.0
         self.last_request_time = 0
     
-    async def search(self, query: str, limit: int = 5) -> List[Dict]:
+    async def search(self, query: str, limit: int = 5, extra_snippets: bool = False) -> List[Dict]:
         """Search using Brave Search API - NO MOCK MODE"""
         if not self.api_key or self.api_key == "your_brave_api_key_here":
             raise ValueError("Brave Search API key is required. Please set BRAVE_SEARCH_API_KEY environment variable.")
@@ -60,6 +61,9 @@ class BraveSearchClient:
                 "text_decorations": "false",
                 "safesearch": "moderate"
             }
+            if extra_snippets:
+                # Up to 5 additional excerpts per result
+                params["extra_snippets"] = "true"
             
             async with aiohttp.ClientSession() as session:
                 async with session.get(
@@ -99,6 +103,8 @@ class BraveSearchClient:
                     "published_date": item.get("age", ""),
                     "language": "vi"
                 })
+                if item.get("extra_snippets"):
+                    results[-1]["extra_snippets"] = item["extra_snippets"]
         
         return results
 
@@ -121,7 +127,8 @@ async def search(request: SearchRequest):
     
     results = await search_client.search(
         query=request.query,
-        limit=request.limit or 5
+        limit=request.limit or 5,
+        extra_snippets=bool(request.extra_snippets)
     )
     
     processing_time = asyncio.get_event_loop().time() - start_time
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Benchmark: dynamic batching of concurrent /verify requests
+
+Sends N concurrent verify requests (claim + 5 evidence texts from
+test_50_cases.csv) through the scheduler and compares:
+  - unbatched: max_batch_size=1, one forward pass per pair
+  - batched:   pairs of all concurrent requests share padded forward passes
+
+Uses the CPU stand-in model unless --real is given.
+
+Usage:
+    python benchmark_batching.py --concurrency 16
+    python benchmark_batching.py --real --concurrency 8
+"""
+
+import argparse
+import asyncio
+import csv
+import os
+import statistics
+import time
+
+from config import BATCH_MAX_SIZE, BATCH_MAX_WAIT_MS, BATCH_TOKEN_BUDGET
+from models import create_model
+from scheduler import BatchScheduler
+
+DATASET = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "test_50_cases.csv")
+
+
+def load_requests(path: str, count: int, evidence_per_claim: int = 5):
+    """(claim, evidence list) per request; evidence = sentences-ish slices of the article"""
+    requests = []
+    with open(path, encoding="utf-8-sig") as f:
+        for row in csv.DictReader(f):
+            context = row["Context"]
+            step = max(1, len(context) // evidence_per_claim)
+            evidence = [context[i:i + 400] for i in range(0, step * evidence_per_claim, step)]
+            requests.append((row["Statement"], evidence))
+    return requests[:count]
+
+
+async def run(name: str, scheduler: BatchScheduler, requests):
+    async def one(claim, evidence):
+        start = time.perf_counter()
+        await scheduler.score([(claim, text) for text in evidence])
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    latencies = await asyncio.gather(*[one(claim, evidence) for claim, evidence in requests])
+    wall = time.perf_counter() - start
+    stats = scheduler.get_stats()
+    return {
+        "mode": name,
+        "wall": wall,
+        "pairs_per_sec": stats["scored_pairs"] / wall,
+        "p50": statistics.median(latencies),
+        "batches": stats["batches"],
+        "avg_batch_size": stats["avg_batch_size"],
+        "padding_efficiency": stats["padding_efficiency"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark MiniCheck dynamic batching")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--real", action="store_true", help="Use MiniCheck-RoBERTa-Large instead of the stand-in")
+    parser.add_argument("--csv", default=DATASET)
+    args = parser.parse_args()
+
+    model = create_model(standin=not args.real)
+    model.load()
+    requests = load_requests(args.csv, args.concurrency)
+    print(f"{model.name}: {len(requests)} concurrent requests, {sum(len(e) for _, e in requests)} pairs")
+
+    results = []
+    for name, max_batch_size in (("unbatched", 1), ("batched", BATCH_MAX_SIZE)):
+        scheduler = BatchScheduler(model, max_batch_size=max_batch_size, max_wait=BATCH_MAX_WAIT_MS / 1000,
+                                   token_budget=BATCH_TOKEN_BUDGET)
+        results.append(asyncio.run(run(name, scheduler, requests)))
+        scheduler.stop()
+
+    print(f"\n{'mode':<11}{'wall (s)':>10}{'pairs/s':>10}{'p50 (s)':>10}{'batches':>9}{'avg size':>10}{'padding':>9}")
+    for r in results:
+        print(f"{r['mode']:<11}{r['wall']:>10.2f}{r['pairs_per_sec']:>10.1f}{r['p50']:>10.2f}"
+              f"{r['batches']:>9}{r['avg_batch_size']:>10}{r['padding_efficiency']:>9}")
+    print(f"\nThroughput gain: {results[1]['pairs_per_sec'] / results[0]['pairs_per_sec']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark: full scoring vs early exit under "best" (max) aggregation
+
+Replays test_50_cases.csv one claim at a time through the server's scoring
+path. Evidence per claim, in rank order as the fact checker sends it: the
+search snippet (Evidence column) followed by slices of the article (Context).
+  - full:       every evidence item is scored
+  - early exit: EARLY_EXIT_BATCH_SIZE items per round, stop at SUPPORT_THRESHOLD
+
+Verdicts are identical by construction (the max can only stay above the
+threshold); reported are pairs scored/skipped and per-claim latency.
+Uses the CPU stand-in model unless --real is given. Early exit trades extra
+forward passes for fewer pairs: it pays off when the per-token cost dominates
+the fixed cost of a pass (--batch-cost-ms / --token-cost-us tune the stand-in).
+
+Usage:
+    python benchmark_early_exit.py
+    python benchmark_early_exit.py --batch-cost-ms 5 --token-cost-us 1000   # CPU-like costs
+    python benchmark_early_exit.py --real --evidence 8
+"""
+
+import argparse
+import asyncio
+import csv
+import os
+import statistics
+import sys
+import time
+
+DATASET = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "test_50_cases.csv")
+
+
+def load_cases(path: str, evidence_per_claim: int):
+    cases = []
+    with open(path, encoding="utf-8-sig") as f:
+        for row in csv.DictReader(f):
+            context = row["Context"]
+            step = max(1, len(context) // (evidence_per_claim - 1))
+            slices = [context[i:i + 400] for i in range(0, step * (evidence_per_claim - 1), step)]
+            cases.append((row["Statement"], [row["Evidence"]] + slices))
+    return cases
+
+
+async def run(server, cases, early_exit: bool):
+    latencies, scored, skipped, exited, labels = [], 0, 0, 0, []
+    for claim, evidence in cases:
+        request = server.VerifyRequest(claim=claim, evidence=evidence, early_exit=early_exit)
+        start = time.perf_counter()
+        response = await server.verify(request)
+        latencies.append(time.perf_counter() - start)
+        scored += response.pairs_scored
+        skipped += response.pairs_skipped
+        exited += response.pairs_skipped > 0
+        labels.append(response.label)
+    return {
+        "mode": "early exit" if early_exit else "full",
+        "scored": scored,
+        "skipped": skipped,
+        "exited": exited,
+        "mean": statistics.mean(latencies),
+        "p50": statistics.median(latencies),
+        "total": sum(latencies),
+        "labels": labels,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark MiniCheck early exit")
+    parser.add_argument("--real", action="store_true", help="Use MiniCheck-RoBERTa-Large instead of the stand-in")
+    parser.add_argument("--evidence", type=int, default=6, help="Evidence items per claim")
+    parser.add_argument("--batch-cost-ms", type=float, help="Stand-in fixed cost per forward pass")
+    parser.add_argument("--token-cost-us", type=float, help="Stand-in cost per padded token")
+    parser.add_argument("--csv", default=DATASET)
+    args = parser.parse_args()
+
+    if not args.real:
+        os.environ["MINICHECK_STANDIN"] = "1"
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import minicheck_server as server
+
+    if not args.real and args.batch_cost_ms is not None:
+        server.model.batch_cost = args.batch_cost_ms / 1000
+    if not args.real and args.token_cost_us is not None:
+        server.model.token_cost = args.token_cost_us / 1_000_000
+    server.model.load()
+    server.scheduler.start()
+    cases = load_cases(args.csv, args.evidence)
+    print(f"{server.model.name}: {len(cases)} claims x {args.evidence} evidence, "
+          f"early-exit batch {server.EARLY_EXIT_BATCH_SIZE}")
+    if not args.real:
+        print(f"Stand-in cost: {server.model.batch_cost * 1000:g} ms per pass + "
+              f"{server.model.token_cost * 1_000_000:g} us per padded token")
+
+    full, early = [asyncio.run(run(server, cases, early_exit)) for early_exit in (False, True)]
+    server.scheduler.stop()
+
+    print(f"\n{'mode':<12}{'scored':>8}{'skipped':>9}{'mean (ms)':>11}{'p50 (ms)':>10}{'total (s)':>11}")
+    for r in (full, early):
+        print(f"{r['mode']:<12}{r['scored']:>8}{r['skipped']:>9}{r['mean'] * 1000:>11.1f}"
+              f"{r['p50'] * 1000:>10.1f}{r['total']:>11.2f}")
+    print(f"\nClaims decided early: {early['exited']}/{len(cases)}, verdicts identical: {full['labels'] == early['labels']}")
+    print(f"Latency saved: {1 - early['total'] / full['total']:.1%}")
+
+
+if __name__ == "__main__":
+    main()
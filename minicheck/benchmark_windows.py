@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Benchmark: truncated vs sentence-windowed scoring of long evidence
+
+Scores every claim of test_50_cases.csv against its full article (Context
+column, usually far longer than MAX_LENGTH tokens):
+  - truncated: one pair per article, the tokenizer keeps the first ~500 tokens
+  - windowed:  sentence-aligned windows of the whole article, best window wins
+
+Reports windows scored, time, mean score and accuracy against the labels
+(0 = supported). Uses the CPU stand-in model unless --real is given.
+
+Usage:
+    python benchmark_windows.py
+    python benchmark_windows.py --real
+"""
+
+import argparse
+import asyncio
+import csv
+import os
+import time
+
+import numpy as np
+
+from config import BATCH_MAX_SIZE, BATCH_MAX_WAIT_MS, BATCH_TOKEN_BUDGET, SUPPORT_THRESHOLD
+from models import create_model
+from scheduler import BatchScheduler
+from windows import max_over_windows, window_pairs
+
+DATASET = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "test_50_cases.csv")
+
+
+def load_cases(path: str):
+    with open(path, encoding="utf-8-sig") as f:
+        return [(row["Statement"], row["Context"], row["labels"].strip() == "0") for row in csv.DictReader(f)]
+
+
+async def run(name: str, model, cases, windowed: bool):
+    scheduler = BatchScheduler(model, max_batch_size=BATCH_MAX_SIZE, max_wait=BATCH_MAX_WAIT_MS / 1000,
+                               token_budget=BATCH_TOKEN_BUDGET)
+    pairs = [(claim, article) for claim, article, _ in cases]
+
+    start = time.perf_counter()
+    windows, offsets = window_pairs(model, pairs) if windowed else (pairs, np.arange(len(pairs)))
+    window_scores = np.asarray(await scheduler.score(windows), dtype=np.float64)
+    scores = max_over_windows(window_scores, offsets)
+    elapsed = time.perf_counter() - start
+    scheduler.stop()
+
+    supported = np.array([label for _, _, label in cases])
+    return {
+        "mode": name,
+        "windows": len(windows),
+        "time": elapsed,
+        "mean_score": float(scores.mean()),
+        "accuracy": float(((scores >= SUPPORT_THRESHOLD) == supported).mean()),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark MiniCheck evidence windows")
+    parser.add_argument("--real", action="store_true", help="Use MiniCheck-RoBERTa-Large instead of the stand-in")
+    parser.add_argument("--csv", default=DATASET)
+    args = parser.parse_args()
+
+    model = create_model(standin=not args.real)
+    model.load()
+    cases = load_cases(args.csv)
+    tokens = model.count_text_tokens([article for _, article, _ in cases])
+    print(f"{model.name}: {len(cases)} claims, article tokens mean {np.mean(tokens):.0f}, max {max(tokens)}")
+
+    results = [asyncio.run(run(name, model, cases, windowed)) for name, windowed in (("truncated", False), ("windowed", True))]
+
+    print(f"\n{'mode':<11}{'windows':>9}{'time (s)':>10}{'mean score':>12}{'accuracy':>10}")
+    for r in results:
+        print(f"{r['mode']:<11}{r['windows']:>9}{r['time']:>10.2f}{r['mean_score']:>12.3f}{r['accuracy']:>10.1%}")
+
+
+if __name__ == "__main__":
+    main()
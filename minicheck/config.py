@@ -0,0 +1,44 @@
+"""
+Configuration for the MiniCheck verification service
+"""
+
+import os
+
+# Server Configuration
+HOST = "0.0.0.0"
+PORT = 8002
+
+# Model Configuration
+MODEL_NAME = "MiniCheck-roberta-large"
+MODEL_PATH = "lytang/MiniCheck-RoBERTa-Large"
+TOKENIZER_PATH = "roberta-large"
+CACHE_DIR = "D:/huggingface_cache/minicheck"
+MAX_LENGTH = 512
+
+# Verdict: a pair is SUPPORTED when its support probability reaches the threshold
+SUPPORT_THRESHOLD = 0.5
+EVIDENCE_PREVIEW_CHARS = 100
+
+# Evidence windows: evidence longer than fits next to the claim is split into
+# sentence-aligned windows; an evidence text scores as its best window.
+WINDOW_EVIDENCE = os.getenv("MINICHECK_WINDOWS", "1") == "1"
+WINDOW_TOKENS = 400             # evidence tokens per window (the claim fills the rest of MAX_LENGTH)
+WINDOW_OVERLAP_SENTENCES = 1    # sentences shared by consecutive windows
+MAX_WINDOWS_PER_EVIDENCE = 32
+
+# Early exit (request option, "best" aggregation): evidence is scored in rank
+# order, this many items in the first round (doubling after), until one reaches
+# the support threshold
+EARLY_EXIT_BATCH_SIZE = 2
+
+# CPU stand-in model for tests and benchmarks (no torch / weights needed).
+# Simulated cost of one forward pass: fixed overhead + per padded token.
+USE_STANDIN_MODEL = os.getenv("MINICHECK_STANDIN", "0") == "1"
+STANDIN_BATCH_COST_MS = 20
+STANDIN_TOKEN_COST_US = 20
+
+# Dynamic batching: pairs of concurrent requests share one padded forward pass
+BATCH_MAX_SIZE = 32
+BATCH_MAX_WAIT_MS = 5
+BATCH_TOKEN_BUDGET = 8192  # padded tokens per forward pass
+BATCH_HISTORY = 100        # recent batches kept for /stats/batching
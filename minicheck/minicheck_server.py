@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+MiniCheck Verification Server - claim verification against evidence (port 8002)
+
+POST /verify scores the claim against every evidence text and aggregates with
+max: the claim is SUPPORTED when its best evidence supports it. POST
+/verify_many does the same for many claims in one call. Long evidence is split
+into sentence-aligned windows (an evidence text scores as its best window), and
+the windows of concurrent requests are scored together by the batching scheduler.
+With early_exit, evidence (in rank order) is scored a few items at a time and
+scoring stops once the best score reaches the threshold: the max verdict is fixed.
+
+Set MINICHECK_STANDIN=1 to run with the CPU stand-in model (no torch needed).
+"""
+
+import asyncio
+import time
+from typing import List, Optional, Tuple
+
+import numpy as np
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+from pydantic import BaseModel, Field
+
+from config import (
+    BATCH_HISTORY, BATCH_MAX_SIZE, BATCH_MAX_WAIT_MS, BATCH_TOKEN_BUDGET, CACHE_DIR, EARLY_EXIT_BATCH_SIZE,
+    EVIDENCE_PREVIEW_CHARS, HOST, MODEL_NAME, PORT, SUPPORT_THRESHOLD, USE_STANDIN_MODEL, WINDOW_EVIDENCE
+)
+from models import Pair, create_model
+from scheduler import BatchScheduler
+from windows import max_over_windows, window_counts, window_pairs
+
+app = FastAPI(title="MiniCheck Verification Server", version="1.1.0")
+
+# Enable CORS for all origins
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+class VerifyRequest(BaseModel):
+    claim: str
+    evidence: List[str]
+    # Stop once an evidence item reaches early_exit_threshold (evidence in rank order)
+    early_exit: bool = False
+    early_exit_threshold: Optional[float] = Field(None, ge=0.0, le=1.0)
+    early_exit_batch_size: Optional[int] = Field(None, ge=1)
+
+class EvidenceScore(BaseModel):
+    evidence_index: int
+    evidence_preview: str
+    label: str
+    score: float
+    windows: int = 1
+
+class VerifyResponse(BaseModel):
+    label: str
+    score: float
+    avg_score: float
+    explanation: str
+    processing_time: float
+    model: str
+    all_scores: List[EvidenceScore]
+    aggregation: str = "max"
+    evidence_count: int
+    windows_scored: int = 0
+    window_time: float = 0.0
+    pairs_scored: int = 0
+    pairs_skipped: int = 0
+    early_exit: bool = False
+
+class VerifyManyRequest(BaseModel):
+    items: List[VerifyRequest]
+
+class PairScore(BaseModel):
+    claim_index: int
+    evidence_index: int
+    score: float
+
+class VerifyManyResponse(BaseModel):
+    results: List[VerifyResponse]
+    pair_scores: List[PairScore]
+    claim_count: int
+    pair_count: int
+    unique_pairs: int
+    pairs_skipped: int
+    windows_scored: int
+    window_time: float
+    processing_time: float
+    model: str
+
+# Global model and scheduler (created on startup)
+model = create_model(USE_STANDIN_MODEL)
+scheduler = BatchScheduler(
+    model,
+    max_batch_size=BATCH_MAX_SIZE,
+    max_wait=BATCH_MAX_WAIT_MS / 1000,
+    token_budget=BATCH_TOKEN_BUDGET,
+    history=BATCH_HISTORY
+)
+
+# Evidence windowing and early-exit totals for /stats/batching
+window_stats = {"requests": 0, "pairs": 0, "windows": 0, "window_time": 0.0, "pairs_skipped": 0}
+
+def pair_label(score: float) -> str:
+    return "SUPPORTED" if score >= SUPPORT_THRESHOLD else "REFUTED"
+
+def record_request(pairs: int, windows: int, window_time: float, skipped: int = 0):
+    window_stats["requests"] += 1
+    window_stats["pairs"] += pairs
+    window_stats["windows"] += windows
+    window_stats["window_time"] += window_time
+    window_stats["pairs_skipped"] += skipped
+
+async def score_windows(pairs: List[Pair]) -> Tuple[np.ndarray, np.ndarray, float]:
+    """Best-window score and window count of every pair, all windows in one pass
+    
+    Returns (scores, windows per pair, seconds spent windowing and scoring).
+    """
+    if not pairs:
+        return np.empty(0), np.empty(0, dtype=np.int64), 0.0
+
+    start = time.perf_counter()
+    if WINDOW_EVIDENCE:
+        windows, offsets = window_pairs(model, pairs)
+    else:
+        windows, offsets = list(pairs), np.arange(len(pairs))
+
+    # Identical windows are scored once; similar lengths are queued together
+    unique = sorted(dict.fromkeys(windows), key=lambda pair: len(pair[0]) + len(pair[1]))
+    scored = dict(zip(unique, await scheduler.score(unique)))
+    window_scores = np.fromiter((scored[window] for window in windows), dtype=np.float64, count=len(windows))
+    return max_over_windows(window_scores, offsets), window_counts(offsets, len(windows)), time.perf_counter() - start
+
+async def score_early_exit(items: List[VerifyRequest]) -> Tuple[List[np.ndarray], List[np.ndarray], float]:
+    """Score the evidence of every item in rank order, a few items per round
+    
+    An item stops once its best score reaches its threshold; the open items of
+    a round are scored together. Rounds double in size (batch, 2x, 4x ...) so an
+    item that never reaches the threshold costs only a few extra passes.
+    Returns the scores and window counts of the scored prefix of every item,
+    and the total time.
+    """
+    start = time.perf_counter()
+    scores = [np.empty(0) for _ in items]
+    windows = [np.empty(0, dtype=np.int64) for _ in items]
+    thresholds = [SUPPORT_THRESHOLD if item.early_exit_threshold is None else item.early_exit_threshold
+                  for item in items]
+    open_items = [k for k, item in enumerate(items) if item.evidence]
+    growth = 1
+    while open_items:
+        pairs, owners = [], []
+        for k in open_items:
+            done = len(scores[k])
+            batch = items[k].evidence[done:done + (items[k].early_exit_batch_size or EARLY_EXIT_BATCH_SIZE) * growth]
+            pairs.extend((items[k].claim, text) for text in batch)
+            owners.extend([k] * len(batch))
+
+        round_scores, round_windows, _ = await score_windows(pairs)
+        owners = np.array(owners)
+        for k in open_items:
+            mask = owners == k
+            scores[k] = np.concatenate([scores[k], round_scores[mask]])
+            windows[k] = np.concatenate([windows[k], round_windows[mask]])
+        open_items = [k for k in open_items
+                      if scores[k].max() < thresholds[k] and len(scores[k]) < len(items[k].evidence)]
+        growth *= 2
+    return scores, windows, time.perf_counter() - start
+
+def build_response(evidence: List[str], scores: np.ndarray, windows: np.ndarray,
+                   window_time: float, processing_time: float, early_exit: bool = False) -> VerifyResponse:
+    """Aggregate per-evidence scores with max into the /verify response
+    
+    With early exit `scores` covers the scored prefix of the evidence only.
+    """
+    if not len(scores):
+        return VerifyResponse(
+            label="ERROR", score=0.0, avg_score=0.0, explanation="No evidence provided",
+            processing_time=0.0, model=MODEL_NAME, all_scores=[], evidence_count=0, early_exit=early_exit
+        )
+
+    best = float(scores.max())
+    avg = float(scores.mean())
+    windows_scored = int(windows.sum())
+    skipped = len(evidence) - len(scores)
+    return VerifyResponse(
+        label=pair_label(best),
+        score=best,
+        avg_score=avg,
+        explanation=f"MiniCheck verified {len(scores)} evidence(s)"
+                    + (f" of {len(evidence)} (early exit)" if skipped else "")
+                    + f". Best score: {best:.3f} ({pair_label(best)}), Avg score: {avg:.3f}"
+                    + (f" ({windows_scored} windows)" if windows_scored > len(scores) else ""),
+        processing_time=processing_time,
+        model=MODEL_NAME,
+        all_scores=[
+            EvidenceScore(
+                evidence_index=i,
+                evidence_preview=text[:EVIDENCE_PREVIEW_CHARS],
+                label=pair_label(score),
+                score=score,
+                windows=count
+            )
+            for i, (text, score, count) in enumerate(zip(evidence, scores.tolist(), windows.tolist()))
+        ],
+        evidence_count=len(evidence),
+        windows_scored=windows_scored,
+        window_time=window_time,
+        pairs_scored=len(scores),
+        pairs_skipped=skipped,
+        early_exit=early_exit
+    )
+
+@app.on_event("startup")
+async def startup_event():
+    """Load the model and start the batching worker"""
+    model.load()
+    scheduler.start()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    scheduler.stop()
+
+@app.get("/")
+async def root():
+    return {
+        "status": "healthy",
+        "model": model.name,
+        "cache_dir": CACHE_DIR,
+        "model_loaded": model.is_loaded,
+        "device": model.device,
+        "standin_model": USE_STANDIN_MODEL
+    }
+
+@app.get("/health")
+async def health():
+    return await root()
+
+@app.post("/verify", response_model=VerifyResponse)
+async def verify(request: VerifyRequest):
+    """Verify a claim against a list of evidence texts (max aggregation)"""
+    start_time = time.time()
+    if not request.evidence:
+        return build_response([], np.empty(0), np.empty(0, dtype=np.int64), 0.0, 0.0, request.early_exit)
+
+    if request.early_exit:
+        (scores,), (windows,), window_time = await score_early_exit([request])
+    else:
+        scores, windows, window_time = await score_windows([(request.claim, text) for text in request.evidence])
+    record_request(len(scores), int(windows.sum()), window_time, len(request.evidence) - len(scores))
+    return build_response(request.evidence, scores, windows, window_time, time.time() - start_time, request.early_exit)
+
+@app.post("/verify_many", response_model=VerifyManyResponse)
+async def verify_many(request: VerifyManyRequest):
+    """Verify many claims, each against its own evidence list, in one call
+    
+    Every unique (claim, evidence) pair is windowed and scored once, all in
+    one pass; results come back per claim (max aggregation) and per pair.
+    Items with early_exit are scored round by round alongside.
+    """
+    start_time = time.time()
+    items = request.items
+    ranked = [k for k, item in enumerate(items) if item.early_exit]
+    unique = list(dict.fromkeys(
+        (item.claim, text) for item in items if not item.early_exit for text in item.evidence
+    ))
+    (scores, windows, window_time), (ranked_scores, ranked_windows, ranked_time) = await asyncio.gather(
+        score_windows(unique), score_early_exit([items[k] for k in ranked])
+    )
+    index = {pair: i for i, pair in enumerate(unique)}
+    ranked_index = {k: j for j, k in enumerate(ranked)}
+    window_time = max(window_time, ranked_time)  # both ran concurrently
+    processing_time = time.time() - start_time
+
+    per_item = []
+    for k, item in enumerate(items):
+        if item.early_exit:
+            per_item.append((ranked_scores[ranked_index[k]], ranked_windows[ranked_index[k]]))
+        else:
+            rows = np.array([index[(item.claim, text)] for text in item.evidence], dtype=np.int64)
+            per_item.append((scores[rows], windows[rows]))
+
+    pair_count = sum(len(item.evidence) for item in items)
+    skipped = pair_count - sum(len(item_scores) for item_scores, _ in per_item)
+    windows_scored = int(windows.sum()) + sum(int(w.sum()) for w in ranked_windows)
+    record_request(pair_count - skipped, windows_scored, window_time, skipped)
+    return VerifyManyResponse(
+        results=[
+            build_response(item.evidence, item_scores, item_windows, window_time, processing_time, item.early_exit)
+            for item, (item_scores, item_windows) in zip(items, per_item)
+        ],
+        pair_scores=[
+            PairScore(claim_index=claim_index, evidence_index=evidence_index, score=score)
+            for claim_index, (item_scores, _) in enumerate(per_item)
+            for evidence_index, score in enumerate(item_scores.tolist())
+        ],
+        claim_count=len(items),
+        pair_count=pair_count,
+        unique_pairs=len(unique) + sum(len(s) for s in ranked_scores),
+        pairs_skipped=skipped,
+        windows_scored=windows_scored,
+        window_time=window_time,
+        processing_time=processing_time,
+        model=MODEL_NAME
+    )
+
+@app.get("/stats/batching")
+async def batching_stats():
+    """Per-batch throughput: batch sizes, padding efficiency, pairs/sec"""
+    requests = window_stats["requests"] or 1
+    return {
+        **scheduler.get_stats(),
+        "windows": {
+            "enabled": WINDOW_EVIDENCE,
+            "requests": window_stats["requests"],
+            "pairs": window_stats["pairs"],
+            "windows_scored": window_stats["windows"],
+            "avg_windows_per_request": round(window_stats["windows"] / requests, 2),
+            "avg_window_time_ms": round(window_stats["window_time"] / requests * 1000, 2),
+        },
+        "early_exit": {
+            "batch_size": EARLY_EXIT_BATCH_SIZE,
+            "pairs_skipped": window_stats["pairs_skipped"],
+        }
+    }
+
+if __name__ == "__main__":
+    import uvicorn
+    print(" Starting MiniCheck Verification Server")
+    print(f" Model: {model.name}")
+    print(f" Cache directory: {CACHE_DIR}")
+    uvicorn.run(app, host=HOST, port=PORT)
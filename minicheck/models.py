@@ -0,0 +1,122 @@
+"""
+Scoring models for the MiniCheck service.
+
+Both models score (claim, evidence) pairs in one padded forward pass and return
+the probability that the evidence supports the claim:
+  - RobertaMiniCheckModel: MiniCheck-RoBERTa-Large (torch + transformers)
+  - StandInModel: dependency-free CPU stand-in for tests and benchmarks
+"""
+
+import re
+import time
+from typing import List, Tuple
+
+from config import (
+    CACHE_DIR, MAX_LENGTH, MODEL_NAME, MODEL_PATH, STANDIN_BATCH_COST_MS,
+    STANDIN_TOKEN_COST_US, TOKENIZER_PATH
+)
+
+Pair = Tuple[str, str]  # (claim, evidence)
+
+
+class RobertaMiniCheckModel:
+    """MiniCheck-RoBERTa-Large sequence classifier (label 1 = supported)"""
+
+    def __init__(self, model_path: str = MODEL_PATH, cache_dir: str = CACHE_DIR):
+        self.name = MODEL_NAME
+        self.model_path = model_path
+        self.cache_dir = cache_dir
+        self.model = None
+        self.tokenizer = None
+        self.device = "cpu"
+        self.is_loaded = False
+
+    def load(self):
+        if self.is_loaded:
+            return
+        import torch
+        from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+        print(f" Loading MiniCheck model: {self.model_path}")
+        start_time = time.time()
+        self.device = "cuda" if torch.cuda.is_available() else "cpu"
+        self.tokenizer = AutoTokenizer.from_pretrained(TOKENIZER_PATH, cache_dir=self.cache_dir)
+        self.model = AutoModelForSequenceClassification.from_pretrained(self.model_path, cache_dir=self.cache_dir)
+        self.model.to(self.device)
+        self.model.eval()
+        self.is_loaded = True
+        print(f" MiniCheck model loaded on {self.device.upper()} in {time.time() - start_time:.2f} seconds")
+
+    def count_tokens(self, claim: str, evidence: str) -> int:
+        """Tokens of the (evidence, claim) input after truncation"""
+        return len(self.tokenizer(evidence, claim, truncation="only_first", max_length=MAX_LENGTH)["input_ids"])
+
+    def count_text_tokens(self, texts: List[str]) -> List[int]:
+        """Tokens of every text on its own, without special tokens"""
+        return [len(ids) for ids in self.tokenizer(texts, add_special_tokens=False)["input_ids"]]
+
+    def score(self, pairs: List[Pair]) -> List[float]:
+        """Support probability of every pair, one padded forward pass"""
+        import torch
+
+        inputs = self.tokenizer(
+            [evidence for _, evidence in pairs],
+            [claim for claim, _ in pairs],
+            return_tensors="pt",
+            truncation="only_first",
+            max_length=MAX_LENGTH,
+            padding=True
+        ).to(self.device)
+        with torch.no_grad():
+            logits = self.model(**inputs).logits
+        return torch.softmax(logits, dim=-1)[:, 1].tolist()
+
+
+_WORD = re.compile(r"\w+", re.UNICODE)
+
+
+class StandInModel:
+    """CPU stand-in with the same interface as RobertaMiniCheckModel.
+
+    The score is the share of the claim's words found in the evidence, truncated
+    to MAX_LENGTH like the real tokenizer input; a forward pass sleeps for a
+    fixed overhead plus a cost per padded token, so batching behaves like it
+    does on the real model.
+    """
+
+    def __init__(self, batch_cost_ms: float = STANDIN_BATCH_COST_MS, token_cost_us: float = STANDIN_TOKEN_COST_US):
+        self.name = f"{MODEL_NAME} (stand-in)"
+        self.device = "cpu"
+        self.batch_cost = batch_cost_ms / 1000
+        self.token_cost = token_cost_us / 1_000_000
+        self.is_loaded = False
+
+    def load(self):
+        self.is_loaded = True
+
+    @staticmethod
+    def _words(text: str) -> List[str]:
+        return _WORD.findall(text.lower())
+
+    def count_tokens(self, claim: str, evidence: str) -> int:
+        return min(MAX_LENGTH, len(self._words(claim)) + len(self._words(evidence)) + 3)
+
+    def count_text_tokens(self, texts: List[str]) -> List[int]:
+        return [len(self._words(text)) for text in texts]
+
+    def score(self, pairs: List[Pair]) -> List[float]:
+        padded = len(pairs) * max(self.count_tokens(claim, evidence) for claim, evidence in pairs)
+        time.sleep(self.batch_cost + padded * self.token_cost)
+
+        scores = []
+        for claim, evidence in pairs:
+            claim_words = self._words(claim)
+            kept = max(0, MAX_LENGTH - len(claim_words) - 3)  # truncation="only_first"
+            evidence_words = set(self._words(evidence)[:kept])
+            claim_words = set(claim_words)
+            scores.append(len(claim_words & evidence_words) / len(claim_words) if claim_words else 0.0)
+        return scores
+
+
+def create_model(standin: bool):
+    return StandInModel() if standin else RobertaMiniCheckModel()
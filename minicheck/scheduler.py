@@ -0,0 +1,185 @@
+"""
+Dynamic batching scheduler for MiniCheck inference.
+
+(claim, evidence) pairs from concurrent /verify requests go into one queue. A
+dedicated worker thread takes the first waiting pair and keeps collecting until
+the batch holds max_batch_size unique pairs, its padded size would exceed the
+token budget, or the wait budget runs out. The batch is scored in one padded
+forward pass and every waiting request is resolved.
+"""
+
+import asyncio
+import collections
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict, List, Optional
+
+from models import Pair
+
+
+class BatchScheduler:
+    """Packs pairs of concurrent requests into shared forward passes"""
+
+    def __init__(self, model, max_batch_size: int = 32, max_wait: float = 0.005,
+                 token_budget: int = 8192, history: int = 100):
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.token_budget = token_budget
+
+        self._queue: "queue.Queue" = queue.Queue()
+        self._carry = None  # item that did not fit the previous batch
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+        # Metrics
+        self.submitted_pairs = 0
+        self.batches = 0
+        self.scored_pairs = 0
+        self.deduplicated_pairs = 0
+        self.padded_tokens = 0
+        self.real_tokens = 0
+        self.total_batch_time = 0.0
+        self.total_queue_wait = 0.0
+        self.max_queue_depth = 0
+        self.recent_batches = collections.deque(maxlen=history)
+
+    def start(self):
+        """Start the worker thread (idempotent)"""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="minicheck-batcher", daemon=True)
+                self._thread.start()
+
+    def stop(self):
+        """Stop the worker thread once the queued pairs are scored"""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def submit(self, pair: Pair) -> Future:
+        """Queue one pair; the future resolves to its support probability"""
+        self.start()
+        future: Future = Future()
+        self._queue.put((pair, future, time.perf_counter()))
+        self.submitted_pairs += 1
+        self.max_queue_depth = max(self.max_queue_depth, self._queue.qsize())
+        return future
+
+    async def score(self, pairs: List[Pair]) -> List[float]:
+        """Score pairs through the shared batches, keeping their order"""
+        futures = [asyncio.wrap_future(self.submit(pair)) for pair in pairs]
+        return list(await asyncio.gather(*futures))
+
+    def _next(self, timeout: Optional[float]):
+        if self._carry is not None:
+            item, self._carry = self._carry, None
+            return item
+        if timeout is None:
+            return self._queue.get()
+        return self._queue.get(timeout=timeout) if timeout > 0 else self._queue.get_nowait()
+
+    def _collect(self, first) -> Dict:
+        """Group waiting pairs until the batch is full, over budget or max_wait has passed"""
+        pending: Dict[Pair, List[Future]] = {}
+        lengths: Dict[Pair, int] = {}
+        longest = 0
+        item = first
+        deadline = time.perf_counter() + self.max_wait
+        while True:
+            pair, future, enqueued_at = item
+            if pair not in pending:
+                tokens = self.model.count_tokens(*pair)
+                if pending and (len(pending) + 1) * max(longest, tokens) > self.token_budget:
+                    self._carry = item  # starts the next batch
+                    break
+            # Skip requests that were cancelled while queued (e.g. client disconnected)
+            if future.set_running_or_notify_cancel():
+                self.total_queue_wait += time.perf_counter() - enqueued_at
+                if pair not in pending:
+                    lengths[pair] = tokens
+                    longest = max(longest, tokens)
+                pending.setdefault(pair, []).append(future)
+            if len(pending) >= self.max_batch_size:
+                break
+            try:
+                item = self._next(deadline - time.perf_counter())
+            except queue.Empty:
+                break
+            if item is None:
+                self._queue.put(None)  # stop after this batch
+                break
+        return {"pending": pending, "lengths": lengths, "longest": longest}
+
+    def _run(self):
+        while True:
+            first = self._next(None)
+            if first is None:
+                break
+
+            batch = self._collect(first)
+            pending = batch["pending"]
+            if not pending:
+                continue
+
+            pairs = list(pending)
+            start = time.perf_counter()
+            try:
+                scores = self.model.score(pairs)
+                if len(scores) != len(pairs):
+                    raise RuntimeError(f"Model returned {len(scores)} scores for {len(pairs)} pairs")
+            except Exception as e:
+                for futures in pending.values():
+                    for future in futures:
+                        future.set_exception(e)
+                continue
+            elapsed = time.perf_counter() - start
+
+            for pair, score in zip(pairs, scores):
+                for future in pending[pair]:
+                    future.set_result(score)
+
+            self._record(batch, elapsed)
+
+    def _record(self, batch: Dict, elapsed: float):
+        pending = batch["pending"]
+        waiting = sum(len(futures) for futures in pending.values())
+        padded = len(pending) * batch["longest"]
+        real = sum(batch["lengths"].values())
+
+        self.batches += 1
+        self.scored_pairs += len(pending)
+        self.deduplicated_pairs += waiting - len(pending)
+        self.padded_tokens += padded
+        self.real_tokens += real
+        self.total_batch_time += elapsed
+        self.recent_batches.append({
+            "pairs": len(pending),
+            "padded_tokens": padded,
+            "padding_efficiency": round(real / padded, 3) if padded else 1.0,
+            "time_ms": round(elapsed * 1000, 2),
+            "pairs_per_sec": round(len(pending) / elapsed, 1) if elapsed else 0.0,
+        })
+
+    def get_stats(self) -> Dict:
+        batches = self.batches or 1
+        return {
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait * 1000,
+            "token_budget": self.token_budget,
+            "queue_depth": self._queue.qsize(),
+            "max_queue_depth": self.max_queue_depth,
+            "submitted_pairs": self.submitted_pairs,
+            "batches": self.batches,
+            "scored_pairs": self.scored_pairs,
+            "deduplicated_pairs": self.deduplicated_pairs,
+            "avg_batch_size": round(self.scored_pairs / batches, 2),
+            "avg_batch_time_ms": round(self.total_batch_time / batches * 1000, 2),
+            "avg_queue_wait_ms": round(self.total_queue_wait / max(1, self.submitted_pairs) * 1000, 2),
+            "pairs_per_sec": round(self.scored_pairs / self.total_batch_time, 1) if self.total_batch_time else 0.0,
+            "padding_efficiency": round(self.real_tokens / self.padded_tokens, 3) if self.padded_tokens else 1.0,
+            "recent_batches": list(self.recent_batches),
+        }
@@ -0,0 +1,104 @@
+"""
+Sentence-aligned evidence windows for MiniCheck scoring.
+
+The tokenizer truncates (evidence, claim) inputs to MAX_LENGTH, so anything
+past the first ~500 tokens of a long evidence text was never scored. Long
+evidence is split into windows of whole sentences that fit next to the claim
+(consecutive windows share WINDOW_OVERLAP_SENTENCES sentences so a fact split
+across a boundary is still seen whole). The windows of all pairs are scored
+in one pass and reduced back with a vectorized max: an evidence text scores
+as its best window.
+"""
+
+import math
+import re
+from typing import List, Tuple
+
+import numpy as np
+
+from config import MAX_LENGTH, MAX_WINDOWS_PER_EVIDENCE, WINDOW_OVERLAP_SENTENCES, WINDOW_TOKENS
+from models import Pair
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])[\"')\]]*\s+(?=[\"'(\[]?[A-Z0-9])")
+_SPECIAL_TOKENS = 4  # <s> evidence </s></s> claim </s>
+_MIN_WINDOW_TOKENS = 64
+
+
+def split_sentences(text: str) -> List[str]:
+    """Split English evidence text into sentences"""
+    return [sentence.strip() for sentence in _SENTENCE_END.split(text) if sentence.strip()]
+
+
+def _split_long_sentence(sentence: str, tokens: int, budget: int) -> List[str]:
+    """Cut a sentence longer than the budget into roughly equal word runs"""
+    words = sentence.split()
+    pieces = math.ceil(tokens / budget)
+    size = math.ceil(len(words) / pieces)
+    return [" ".join(words[i:i + size]) for i in range(0, len(words), size)]
+
+
+def evidence_windows(sentences: List[str], lengths: List[int], budget: int) -> List[str]:
+    """Greedily pack sentences into windows of at most budget tokens"""
+    units, unit_lengths = [], []
+    for sentence, tokens in zip(sentences, lengths):
+        if tokens > budget:
+            pieces = _split_long_sentence(sentence, tokens, budget)
+            units.extend(pieces)
+            unit_lengths.extend([math.ceil(tokens / len(pieces))] * len(pieces))
+        else:
+            units.append(sentence)
+            unit_lengths.append(tokens)
+
+    windows = []
+    start = 0
+    while start < len(units) and len(windows) < MAX_WINDOWS_PER_EVIDENCE:
+        end, used = start, 0
+        while end < len(units) and (end == start or used + unit_lengths[end] <= budget):
+            used += unit_lengths[end]
+            end += 1
+        windows.append(" ".join(units[start:end]))
+        if end >= len(units):
+            break
+        start = max(start + 1, end - WINDOW_OVERLAP_SENTENCES)
+    return windows
+
+
+def window_pairs(model, pairs: List[Pair]) -> Tuple[List[Pair], np.ndarray]:
+    """Windows of every pair, flattened, plus the offset of each pair's first window
+
+    Evidence that already fits next to its claim stays a single, unchanged window.
+    """
+    claims = list(dict.fromkeys(claim for claim, _ in pairs))
+    claim_budget = {
+        claim: max(_MIN_WINDOW_TOKENS, min(WINDOW_TOKENS, MAX_LENGTH - tokens - _SPECIAL_TOKENS))
+        for claim, tokens in zip(claims, model.count_text_tokens(claims))
+    }
+
+    split = {evidence: split_sentences(evidence) for evidence in dict.fromkeys(evidence for _, evidence in pairs)}
+    sentences = list(dict.fromkeys(sentence for parts in split.values() for sentence in parts))
+    sentence_tokens = dict(zip(sentences, model.count_text_tokens(sentences))) if sentences else {}
+
+    windows: List[Pair] = []
+    offsets = np.empty(len(pairs), dtype=np.int64)
+    for i, (claim, evidence) in enumerate(pairs):
+        offsets[i] = len(windows)
+        parts = split[evidence]
+        lengths = [sentence_tokens[sentence] for sentence in parts]
+        budget = claim_budget[claim]
+        if sum(lengths) <= budget:
+            windows.append((claim, evidence))
+        else:
+            windows.extend((claim, window) for window in evidence_windows(parts, lengths, budget))
+    return windows, offsets
+
+
+def max_over_windows(scores: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """Per-pair max of the flattened window scores (every pair has >= 1 window)"""
+    if not len(offsets):
+        return np.empty(0, dtype=scores.dtype)
+    return np.maximum.reduceat(scores, offsets)
+
+
+def window_counts(offsets: np.ndarray, total: int) -> np.ndarray:
+    """Number of windows of every pair"""
+    return np.diff(np.append(offsets, total))
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Benchmark /check throughput with N concurrent claims.
+
+Runs the real /check handler in-process against local stub downstream services
+(Brave proxy, translation, MiniCheck) with a fixed simulated latency, and compares:
+  - blocking: old path, synchronous requests.post translation on the event loop
+  - async:    pooled aiohttp translation client (does not block the event loop)
+
+Usage:
+    python tests/benchmark_check_throughput.py --concurrency 20 --translation-latency 0.5
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import sys
+import threading
+import time
+
+from aiohttp import web
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "vietnamese-fact-checker", "src"))
+
+CLAIMS = [
+    "Hà Nội là thủ đô của Việt Nam",
+    "Việt Nam giành độc lập năm 1945",
+    "Phở là món ăn truyền thống của Việt Nam",
+    "Đội tuyển Việt Nam vô địch AFF Cup năm 2018",
+    "Trái đất quay quanh mặt trời",
+]
+
+
+def start_stub_services(port: int, search_latency: float, translation_latency: float, minicheck_latency: float):
+    """Start stub downstream services on a background thread with its own event loop"""
+
+    async def search(request):
+        await asyncio.sleep(search_latency)
+        body = await request.json()
+        return web.json_response({"results": [
+            {
+                "title": f"Result {i}",
+                "url": f"https://vnexpress.net/article-{i}.html",
+                "snippet": f"{body['query'][:60]} - bài viết số {i}",
+            }
+            for i in range(5)
+        ]})
+
+    async def translate_batch(request):
+        await asyncio.sleep(translation_latency)
+        body = await request.json()
+        return web.json_response({"translations": [
+            {"vietnamese": t, "english": f"EN: {t}"} for t in body["texts"]
+        ]})
+
+    async def verify(request):
+        await asyncio.sleep(minicheck_latency)
+        body = await request.json()
+        scores = [{"evidence_index": i, "label": "SUPPORTED", "score": 0.9} for i, _ in enumerate(body["evidence"])]
+        return web.json_response({"label": "SUPPORTED", "score": 0.9, "all_scores": scores})
+
+    app = web.Application()
+    app.router.add_post("/search", search)
+    app.router.add_post("/translate_batch", translate_batch)
+    app.router.add_post("/verify", verify)
+
+    ready = threading.Event()
+
+    def run():
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        runner = web.AppRunner(app)
+        loop.run_until_complete(runner.setup())
+        loop.run_until_complete(web.TCPSite(runner, "127.0.0.1", port).start())
+        ready.set()
+        loop.run_forever()
+
+    threading.Thread(target=run, daemon=True).start()
+    ready.wait()
+
+
+def configure(port: int):
+    """Point all service configs at the stub services and disable noisy logging"""
+    from core.system_config import system_config
+
+    base = f"http://127.0.0.1:{port}"
+    system_config.brave_search.proxy_url = base
+    system_config.translation.api_url = base
+    system_config.minicheck.api_url = base
+    system_config.evidence.fetch_full_content = False
+    # Every request must run the full pipeline
+    system_config.verdict_cache.enabled = False
+    system_config.translation.cache_translations = False
+    system_config.minicheck.cache_scores = False
+    for field in ("log_service_io", "log_translation_details", "log_minicheck_all_scores", "log_search_results"):
+        setattr(system_config.logging, field, False)
+
+
+async def run_round(mode: str, concurrency: int) -> dict:
+    """Run one round of `concurrency` simultaneous /check calls"""
+    from api import main
+    from api.schemas import ClaimRequest
+
+    client = main.fact_checker.translation_client
+    async_impl = type(client).translate_multiple_vi_to_en_async
+
+    if mode == "blocking":
+        async def blocking_translate(texts, timeout=None, profile=None):
+            return client.translate_multiple_vi_to_en(texts, profile)
+        client.translate_multiple_vi_to_en_async = blocking_translate
+    else:
+        client.translate_multiple_vi_to_en_async = async_impl.__get__(client)
+
+    # Distinct claims so identical in-flight requests are not coalesced
+    requests_ = [ClaimRequest(claim=f"{CLAIMS[i % len(CLAIMS)]} ({mode} #{i})") for i in range(concurrency)]
+
+    latencies = []
+
+    async def one(req):
+        t0 = time.perf_counter()
+        await main.check_claim(req)
+        latencies.append(time.perf_counter() - t0)
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        await asyncio.gather(*[one(r) for r in requests_])
+    wall = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "mode": mode,
+        "concurrency": concurrency,
+        "wall_time": round(wall, 3),
+        "throughput_rps": round(concurrency / wall, 2),
+        "latency_p50": round(latencies[len(latencies) // 2], 3),
+        "latency_max": round(latencies[-1], 3),
+    }
+
+
+async def main_async(args) -> list:
+    from api import main
+
+    results = []
+    for mode in ("blocking", "async"):
+        result = await run_round(mode, args.concurrency)
+        # Cumulative per-downstream reuse stats of the shared sessions
+        result["connection_reuse"] = {
+            name: round(stats["reuse_rate"], 2) for name, stats in main.http_session_manager.get_stats().items()
+        }
+        results.append(result)
+    await main.http_session_manager.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--port", type=int, default=18090)
+    parser.add_argument("--search-latency", type=float, default=0.2)
+    parser.add_argument("--translation-latency", type=float, default=0.5)
+    parser.add_argument("--minicheck-latency", type=float, default=0.3)
+    parser.add_argument("--output", type=str, default=None, help="Optional JSON output file")
+    args = parser.parse_args()
+
+    start_stub_services(args.port, args.search_latency, args.translation_latency, args.minicheck_latency)
+    configure(args.port)
+
+    results = asyncio.run(main_async(args))
+
+    print("=" * 80)
+    print(f" /check throughput - {args.concurrency} concurrent claims")
+    print(f" Simulated latency: search={args.search_latency}s translation={args.translation_latency}s minicheck={args.minicheck_latency}s")
+    print("=" * 80)
+    for r in results:
+        print(f" {r['mode']:<10} wall={r['wall_time']:>7.3f}s  throughput={r['throughput_rps']:>7.2f} req/s  "
+              f"p50={r['latency_p50']:.3f}s  max={r['latency_max']:.3f}s  reuse={r['connection_reuse']}")
+    if len(results) == 2 and results[0]["wall_time"] > 0:
+        print(f" Speedup: {results[0]['wall_time'] / results[1]['wall_time']:.1f}x")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f" Results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
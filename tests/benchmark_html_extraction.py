@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for evidence page extraction (pages per second per core).
+
+Compares, on synthetic news-article pages of realistic size:
+  - html.parser inline: the original path (BeautifulSoup on the event loop thread)
+  - lxml inline:        native lxml parser on the calling thread
+  - <parser> pool:      EvidenceFetcher extraction through the process pool
+
+Also reports how long the event loop is blocked per page in each mode.
+
+Usage:
+    python tests/benchmark_html_extraction.py --pages 200 --workers 2
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "vietnamese-fact-checker", "src"))
+
+PARAGRAPH = (
+    "Theo báo cáo của Tổng cục Thống kê, tăng trưởng kinh tế Việt Nam năm 2023 đạt 5,05%, "
+    "trong đó khu vực công nghiệp và xây dựng tăng 3,74%, khu vực dịch vụ tăng 6,82%. "
+)
+
+
+def make_page(i: int, paragraphs: int = 60) -> str:
+    """A news-like page: navigation, scripts, article body, sidebar and footer"""
+    nav = "".join(f'<li><a href="/muc-{k}">Chuyên mục {k}</a></li>' for k in range(40))
+    scripts = "".join(f"<script>var tracking{k} = {{id: {k}, page: {i}}};</script>" for k in range(20))
+    body = "".join(f"<p class='Normal'>{PARAGRAPH * 2} ({k})</p>" for k in range(paragraphs))
+    sidebar = "".join(f'<div class="item"><a href="/tin-{k}.html">Tin liên quan {k}</a></div>' for k in range(50))
+    return (
+        f"<html><head><title>Bài viết {i} - VnExpress</title>"
+        f"<meta property='og:title' content='Bài viết {i}'><style>.a{{color:red}}</style>{scripts}</head>"
+        f"<body><nav><ul>{nav}</ul></nav><article class='fck_detail'><h1>Bài viết {i}</h1>{body}</article>"
+        f"<aside>{sidebar}</aside><footer>© VnExpress</footer></body></html>"
+    )
+
+
+def bench_inline(pages, parser: str) -> dict:
+    from services.html_extractor import extract_page, resolve_parser
+
+    start = time.perf_counter()
+    for i, html in enumerate(pages):
+        extract_page(html, f"https://vnexpress.net/bai-{i}.html", parser)
+    elapsed = time.perf_counter() - start
+    return {
+        "mode": f"{resolve_parser(parser)} inline",
+        "pages": len(pages),
+        "wall_time": round(elapsed, 3),
+        "pages_per_sec_per_core": round(len(pages) / elapsed, 1),
+        "loop_blocked_ms_per_page": round(elapsed / len(pages) * 1000, 2),
+    }
+
+
+async def bench_pool(pages, parser: str, workers: int) -> dict:
+    from core.system_config import system_config
+    from services.evidence_fetcher import EvidenceFetcher
+    from services.html_extractor import resolve_parser
+
+    system_config.evidence.extraction_workers = workers
+    system_config.evidence.html_parser = parser
+    fetcher = EvidenceFetcher()
+
+    # Warm up the worker processes so start-up is not measured
+    await asyncio.gather(*[fetcher._extract_content_async(pages[0], "https://vnexpress.net/") for _ in range(workers)])
+
+    # Measure how long the loop stalls while extraction is in flight
+    max_stall = 0.0
+    done = False
+
+    async def watchdog():
+        nonlocal max_stall
+        while not done:
+            t0 = time.perf_counter()
+            await asyncio.sleep(0.001)
+            max_stall = max(max_stall, time.perf_counter() - t0 - 0.001)
+
+    watcher = asyncio.ensure_future(watchdog())
+    start = time.perf_counter()
+    await asyncio.gather(*[
+        fetcher._extract_content_async(html, f"https://vnexpress.net/bai-{i}.html") for i, html in enumerate(pages)
+    ])
+    elapsed = time.perf_counter() - start
+    done = True
+    await watcher
+    fetcher.close()
+
+    cores = min(workers, os.cpu_count() or 1)
+    return {
+        "mode": f"{resolve_parser(parser)} pool x{workers}",
+        "pages": len(pages),
+        "wall_time": round(elapsed, 3),
+        "pages_per_sec_per_core": round(len(pages) / elapsed / cores, 1),
+        "loop_max_stall_ms": round(max_stall * 1000, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark evidence HTML extraction")
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--paragraphs", type=int, default=60, help="Article paragraphs per page")
+    parser.add_argument("--workers", type=int, default=2)
+    args = parser.parse_args()
+
+    pages = [make_page(i, args.paragraphs) for i in range(args.pages)]
+    avg_kb = sum(len(p.encode()) for p in pages) / len(pages) / 1024
+    print(f"Synthetic pages: {len(pages)} x {avg_kb:.0f} KB, cores available: {os.cpu_count()}")
+
+    results = [
+        bench_inline(pages, "html.parser"),
+        bench_inline(pages, "lxml"),
+        asyncio.run(bench_pool(pages, "html.parser", args.workers)),
+        asyncio.run(bench_pool(pages, "lxml", args.workers)),
+    ]
+
+    print(f"\n{'mode':<24}{'wall (s)':>10}{'pages/s/core':>15}{'loop blocked (ms)':>20}")
+    for r in results:
+        blocked = r.get("loop_blocked_ms_per_page", r.get("loop_max_stall_ms"))
+        print(f"{r['mode']:<24}{r['wall_time']:>10}{r['pages_per_sec_per_core']:>15}{blocked:>20}")
+
+    baseline = results[0]["pages_per_sec_per_core"]
+    print(f"\nlxml vs html.parser (per core): {results[1]['pages_per_sec_per_core'] / baseline:.1f}x")
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Benchmark claim-aware passage selection on the labelled claim datasets.
+
+For every claim (Statement) the full article (Context) is treated as fetched
+evidence, and the text that would go to /translate_batch and MiniCheck is
+compared between:
+  - full:      the whole article
+  - truncated: the first max_text_length characters (selection disabled)
+  - selected:  top-k BM25 passages within the token budget
+
+Tokens are syllables. Claim coverage (share of the claim's syllable bigrams that
+appear in the text sent) is reported as a cheap proxy for evidence quality.
+
+Usage:
+    python tests/benchmark_passage_selection.py --csv test_50_cases.csv
+"""
+
+import argparse
+import csv
+import io
+import contextlib
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "vietnamese-fact-checker", "src"))
+
+
+def load_cases(path: str):
+    with open(path, encoding="utf-8-sig") as f:
+        return [row for row in csv.DictReader(f) if row.get("Statement") and row.get("Context")]
+
+
+def claim_coverage(claim: str, text: str) -> float:
+    from services.passage_selector import syllables
+
+    claim_tokens = syllables(claim)
+    bigrams = {f"{a} {b}" for a, b in zip(claim_tokens, claim_tokens[1:])}
+    if not bigrams:
+        return 0.0
+    text_tokens = syllables(text)
+    present = {f"{a} {b}" for a, b in zip(text_tokens, text_tokens[1:])}
+    return len(bigrams & present) / len(bigrams)
+
+
+def run(path: str) -> dict:
+    from core.system_config import system_config
+    from services.evidence_fetcher import EvidenceFetcher
+    from services.passage_selector import count_tokens
+
+    system_config.content_cache.enabled = False
+    system_config.logging.log_service_io = False
+    fetcher = EvidenceFetcher()
+    cases = load_cases(path)
+
+    totals = {"full": 0, "truncated": 0, "selected": 0}
+    coverage = {"full": 0.0, "truncated": 0.0, "selected": 0.0}
+    selection_time = 0.0
+
+    for case in cases:
+        claim, article = case["Statement"], case["Context"]
+        doc = {"url": case.get("Url", ""), "title": "", "content": article, "source": "web_fetch"}
+
+        truncated = " ".join(c["text"] for c in fetcher.prepare_content_chunks([doc]))
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            selected = " ".join(c["text"] for c in fetcher.prepare_content_chunks([doc], claim))
+        selection_time += time.perf_counter() - start
+
+        for mode, text in (("full", article), ("truncated", truncated), ("selected", selected)):
+            totals[mode] += count_tokens(text)
+            coverage[mode] += claim_coverage(claim, text)
+
+    n = len(cases)
+    return {
+        "dataset": os.path.basename(path),
+        "claims": n,
+        "translated_tokens": totals,
+        "reduction_vs_full": round(1 - totals["selected"] / totals["full"], 3),
+        "reduction_vs_truncated": round(1 - totals["selected"] / totals["truncated"], 3),
+        "avg_claim_coverage": {mode: round(value / n, 3) for mode, value in coverage.items()},
+        "selection_ms_per_article": round(selection_time / n * 1000, 2),
+        "config": {
+            "passage_max_tokens": system_config.evidence.passage_max_tokens,
+            "passage_top_k": system_config.evidence.passage_top_k,
+            "passage_token_budget": system_config.evidence.passage_token_budget,
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark claim-aware passage selection")
+    parser.add_argument("--csv", nargs="+", default=["test_10_cases.csv", "test_50_cases.csv"])
+    args = parser.parse_args()
+
+    for path in args.csv:
+        if not os.path.isabs(path):
+            path = os.path.join(ROOT, path)
+        result = run(path)
+        tokens = result["translated_tokens"]
+        print(f"\n{result['dataset']} ({result['claims']} claims)")
+        print(f"  translated tokens: full={tokens['full']}  truncated={tokens['truncated']}  selected={tokens['selected']}")
+        print(f"  reduction: {result['reduction_vs_full']:.1%} vs full article, "
+              f"{result['reduction_vs_truncated']:.1%} vs truncated")
+        print(f"  claim coverage: {result['avg_claim_coverage']}")
+        print(f"  selection time: {result['selection_ms_per_article']} ms/article")
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Replay benchmark: whole-text vs sentence-level translation memoization.
+
+Replays the translation traffic of the labelled claim datasets through the real
+TranslationClient (persistent cache on, fresh cache per run) against a local
+stub /translate_batch that counts what it receives. Per claim the orchestrator
+translates:
+  - the claim
+  - the search snippet (Evidence column, a prefix of the article)
+  - the claim-relevant passages of the fetched article (Context column)
+
+Snippets and passages of the same article overlap at sentence level but rarely
+as whole texts. Reported per mode: cache hit rate and tokens (syllables) sent
+to the translation backend against the tokens requested.
+
+Usage:
+    python tests/benchmark_translation_memo.py --csv test_10_cases.csv test_50_cases.csv
+"""
+
+import argparse
+import asyncio
+import contextlib
+import csv
+import io
+import os
+import sys
+import tempfile
+import threading
+
+from aiohttp import web
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "vietnamese-fact-checker", "src"))
+
+
+def start_stub_translation(port: int, received: dict):
+    """Stub /translate_batch on a background thread that counts texts and tokens"""
+    from services.passage_selector import count_tokens
+
+    async def translate_batch(request):
+        body = await request.json()
+        received["calls"] += 1
+        received["texts"] += len(body["texts"])
+        received["tokens"] += sum(count_tokens(t) for t in body["texts"])
+        return web.json_response({"translations": [
+            {"vietnamese": t, "english": f"EN: {t}"} for t in body["texts"]
+        ]})
+
+    app = web.Application()
+    app.router.add_post("/translate_batch", translate_batch)
+    ready = threading.Event()
+
+    def run():
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        runner = web.AppRunner(app)
+        loop.run_until_complete(runner.setup())
+        loop.run_until_complete(web.TCPSite(runner, "127.0.0.1", port).start())
+        ready.set()
+        loop.run_forever()
+
+    threading.Thread(target=run, daemon=True).start()
+    ready.wait()
+
+
+def load_traffic(path: str):
+    """(claim, evidence texts) per claim, as the orchestrator would translate them"""
+    from services.evidence_fetcher import EvidenceFetcher
+
+    fetcher = EvidenceFetcher()
+    traffic = []
+    with open(path, encoding="utf-8-sig") as f:
+        for row in csv.DictReader(f):
+            claim = row["Statement"]
+            doc = {"url": row.get("Url", ""), "title": "", "content": row["Context"], "source": "web_fetch"}
+            with contextlib.redirect_stdout(io.StringIO()):
+                passages = [chunk["text"] for chunk in fetcher.prepare_content_chunks([doc], claim)]
+            traffic.append((claim, [row["Evidence"]] + passages))
+    return traffic
+
+
+def replay(traffic, sentence_memoization: bool, port: int, received: dict) -> dict:
+    from core.system_config import system_config
+    from services.passage_selector import count_tokens
+    from services.translation_client import TranslationClient
+
+    config = system_config.translation
+    config.sentence_memoization = sentence_memoization
+    config.cache_translations = True
+    config.cache_sqlite_path = os.path.join(tempfile.mkdtemp(), "translation_cache.db")
+
+    client = TranslationClient()
+    client.batch_translation_api_url = f"http://127.0.0.1:{port}/translate_batch"
+    for key in received:
+        received[key] = 0
+
+    requested = 0
+    for claim, evidence in traffic:
+        client.translate_multiple_vi_to_en([claim], profile=config.claim_profile)
+        client.translate_multiple_vi_to_en(evidence, profile=config.evidence_profile)
+        requested += count_tokens(claim) + sum(count_tokens(text) for text in evidence)
+
+    stats = client.get_cache_stats()
+    client.close()
+    return {
+        "mode": "sentence" if sentence_memoization else "whole-text",
+        "lookups": stats["hits"] + stats["misses"],
+        "hit_rate": stats["hit_rate"],
+        "backend_calls": received["calls"],
+        "texts_sent": received["texts"],
+        "tokens_requested": requested,
+        "tokens_sent": received["tokens"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark sentence-level translation memoization")
+    parser.add_argument("--csv", nargs="+", default=["test_10_cases.csv", "test_50_cases.csv"])
+    parser.add_argument("--port", type=int, default=9620)
+    args = parser.parse_args()
+
+    from core.system_config import system_config
+    system_config.content_cache.enabled = False
+    system_config.logging.log_translation_details = False
+    system_config.logging.log_service_io = False
+
+    received = {"calls": 0, "texts": 0, "tokens": 0}
+    start_stub_translation(args.port, received)
+
+    for path in args.csv:
+        if not os.path.isabs(path):
+            path = os.path.join(ROOT, path)
+        traffic = load_traffic(path)
+        print(f"\n{os.path.basename(path)} ({len(traffic)} claims)")
+        print(f"{'mode':<12}{'lookups':>9}{'hit rate':>10}{'calls':>7}{'sent':>7}{'tokens req':>12}{'tokens sent':>13}{'saved':>8}")
+        results = [replay(traffic, mode, args.port, received) for mode in (False, True)]
+        for r in results:
+            saved = 1 - r["tokens_sent"] / r["tokens_requested"]
+            print(f"{r['mode']:<12}{r['lookups']:>9}{r['hit_rate']:>10.1%}{r['backend_calls']:>7}{r['texts_sent']:>7}"
+                  f"{r['tokens_requested']:>12}{r['tokens_sent']:>13}{saved:>8.1%}")
+        whole, sentence = results
+        print(f"Translated-token reduction vs whole-text cache: {1 - sentence['tokens_sent'] / whole['tokens_sent']:.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""
+Extra Snippets vs Page Fetching - Accuracy / Latency Evaluation
+================================================================
+Runs the labelled claims of test_50_cases.csv through a running fact checker
+(8005) in several evidence modes, switched through the config API:
+
+  snippets        main Brave snippet only, no page fetches
+  extra_snippets  main snippet + Brave extra_snippets as passages, no page fetches
+  page_fetch      main snippet + full page fetching
+  extra+fetch     everything
+
+Verdict, content and translation caches are turned off for the run so every mode does the
+full work. Requires Brave Search (8004), Translation (8003) and MiniCheck (8002).
+
+Usage:
+    python tests/evaluate_extra_snippets.py [--csv test_50_cases.csv] [--limit 20]
+"""
+
+import argparse
+import csv
+import json
+import os
+import statistics
+import time
+from datetime import datetime
+from typing import Dict, List
+
+import requests
+
+FACT_CHECKER_URL = "http://localhost:8005"
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# ViFactCheck labels: 0 = supported, 1 = refuted
+LABEL_TO_VERDICT = {"0": "SUPPORTED", "1": "REFUTED"}
+
+MODES = {
+    "snippets": {
+        "brave_search": {"extra_snippets": False},
+        "evidence": {"use_extra_snippets": False, "fetch_full_content": False},
+    },
+    "extra_snippets": {
+        "brave_search": {"extra_snippets": True},
+        "evidence": {"use_extra_snippets": True, "fetch_full_content": False},
+    },
+    "page_fetch": {
+        "brave_search": {"extra_snippets": False},
+        "evidence": {"use_extra_snippets": False, "fetch_full_content": True},
+    },
+    "extra+fetch": {
+        "brave_search": {"extra_snippets": True},
+        "evidence": {"use_extra_snippets": True, "fetch_full_content": True},
+    },
+}
+
+
+def update_config(section: str, updates: Dict):
+    response = requests.post(f"{FACT_CHECKER_URL}/config/{section}", json={"section": section, "updates": updates})
+    response.raise_for_status()
+
+
+def load_claims(path: str, limit: int) -> List[Dict]:
+    with open(path, encoding="utf-8-sig") as f:
+        rows = [row for row in csv.DictReader(f) if row.get("labels") in LABEL_TO_VERDICT]
+    return rows[:limit] if limit else rows
+
+
+def run_mode(name: str, claims: List[Dict]) -> Dict:
+    for section, updates in MODES[name].items():
+        update_config(section, updates)
+
+    correct = 0
+    errors = 0
+    latencies = []
+    page_fetches = 0
+    evidence_counts = []
+    details = []
+
+    for i, row in enumerate(claims, 1):
+        expected = LABEL_TO_VERDICT[row["labels"]]
+        start = time.time()
+        try:
+            response = requests.post(f"{FACT_CHECKER_URL}/check", json={"claim": row["Statement"]}, timeout=120)
+            result = response.json()
+        except Exception as e:
+            result = {"verdict": "ERROR", "error": str(e)}
+        latency = time.time() - start
+
+        verdict = result.get("verdict", "ERROR")
+        stages = (result.get("stage_timings") or {}).get("stages", {})
+        fetched = sum(1 for stage in stages if stage.startswith("fetch[page"))
+
+        correct += verdict == expected
+        errors += verdict == "ERROR"
+        latencies.append(latency)
+        page_fetches += fetched
+        evidence_counts.append(result.get("evidence_count", 0))
+        details.append({
+            "claim": row["Statement"],
+            "expected": expected,
+            "verdict": verdict,
+            "confidence": result.get("confidence", 0.0),
+            "latency": round(latency, 3),
+            "pages_fetched": fetched,
+            "evidence_count": result.get("evidence_count", 0),
+        })
+        print(f"   [{name}] {i}/{len(claims)} {verdict:<10} expected {expected:<10} {latency:.2f}s")
+
+    latencies.sort()
+    return {
+        "mode": name,
+        "claims": len(claims),
+        "accuracy": round(correct / len(claims), 3),
+        "errors": errors,
+        "latency_mean": round(statistics.mean(latencies), 3),
+        "latency_p50": round(latencies[len(latencies) // 2], 3),
+        "latency_p90": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.9))], 3),
+        "pages_fetched": page_fetches,
+        "avg_evidence_count": round(statistics.mean(evidence_counts), 2),
+        "details": details,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluate Brave extra_snippets against page fetching")
+    parser.add_argument("--csv", default=os.path.join(ROOT, "test_50_cases.csv"))
+    parser.add_argument("--limit", type=int, default=0, help="Only the first N claims")
+    parser.add_argument("--modes", nargs="+", default=list(MODES), choices=list(MODES))
+    args = parser.parse_args()
+
+    claims = load_claims(args.csv, args.limit)
+    print(f"Evaluating {len(claims)} claims in modes: {', '.join(args.modes)}")
+
+    original = requests.get(f"{FACT_CHECKER_URL}/config").json()["config"]
+    update_config("verdict_cache", {"enabled": False})
+    update_config("content_cache", {"enabled": False})
+    update_config("translation", {"cache_translations": False})
+    update_config("minicheck", {"cache_scores": False})
+
+    results = []
+    try:
+        for name in args.modes:
+            print(f"\n[MODE] {name}")
+            results.append(run_mode(name, claims))
+    finally:
+        # Restore the settings this script touched
+        update_config("verdict_cache", {"enabled": original["verdict_cache"]["enabled"]})
+        update_config("content_cache", {"enabled": original["content_cache"]["enabled"]})
+        update_config("translation", {"cache_translations": original["translation"]["cache_translations"]})
+        update_config("minicheck", {"cache_scores": original["minicheck"]["cache_scores"]})
+        update_config("brave_search", {"extra_snippets": original["brave_search"]["extra_snippets"]})
+        update_config("evidence", {
+            key: original["evidence"][key] for key in ("use_extra_snippets", "fetch_full_content")
+        })
+
+    print(f"\n{'mode':<16}{'accuracy':>10}{'mean (s)':>10}{'p50 (s)':>10}{'p90 (s)':>10}{'pages':>8}{'evidence':>10}")
+    for r in results:
+        print(f"{r['mode']:<16}{r['accuracy']:>10}{r['latency_mean']:>10}{r['latency_p50']:>10}"
+              f"{r['latency_p90']:>10}{r['pages_fetched']:>8}{r['avg_evidence_count']:>10}")
+
+    output = f"extra_snippets_eval_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), output), "w", encoding="utf-8") as f:
+        json.dump({"timestamp": datetime.now().isoformat(), "results": results}, f, ensure_ascii=False, indent=2)
+    print(f"\nResults saved to tests/{output}")
+
+
+if __name__ == "__main__":
+    main()
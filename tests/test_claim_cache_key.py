@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""Offline test: canonical claim forms used as verdict cache keys (no services needed)"""
+
+import os
+import sys
+import unicodedata
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "vietnamese-fact-checker", "src"))
+
+from services.normalizer import VietnameseNormalizer
+
+normalizer = VietnameseNormalizer()
+
+
+def test_equivalent_claims_share_a_key():
+    claim = "Hà Nội là thủ đô của Việt Nam"
+    for variant in (
+        "  HÀ NỘI   là thủ đô của Việt Nam.",
+        unicodedata.normalize("NFD", claim),
+        "“Hà Nội là thủ đô của Việt Nam”!",
+        "(Hà Nội là thủ đô của Việt Nam?)",
+    ):
+        assert normalizer.canonicalize(variant) == normalizer.canonicalize(claim), variant
+
+
+def test_meaningful_characters_keep_keys_apart():
+    for a, b in (
+        ("GDP tăng 5%", "GDP tăng 5"),
+        ("-5 là số âm", "5 là số âm"),
+        ("+5 độ C", "5 độ C"),
+        ("Giá vàng là $100", "Giá vàng là 100"),
+        ("Giá là 100€", "Giá là 100"),
+        ("Lạm phát 1.5", "Lạm phát 1,5"),
+        ("Đà Nẵng", "Da Nang"),
+    ):
+        assert normalizer.canonicalize(a) != normalizer.canonicalize(b), (a, b)
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f" [OK] {name}")
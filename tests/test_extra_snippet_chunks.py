@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""Offline test: Brave extra_snippets are ranked and capped as evidence chunks (no services needed)"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "vietnamese-fact-checker", "src"))
+
+from core.system_config import content_cache_config, evidence_config
+from services.evidence_fetcher import EvidenceFetcher
+
+CLAIM = "Hà Nội là thủ đô của Việt Nam"
+
+
+def search_results(count: int, extras: int):
+    return [{
+        "url": f"https://example{i}.vn/article",
+        "title": f"Bài viết {i}",
+        "snippet": f"Tin tức số {i} về thời tiết hôm nay.",
+        "extra_snippets": [f"Đoạn phụ {j} của bài {i} nói về giá vàng." for j in range(extras - 1)]
+                          + [f"Hà Nội là thủ đô của Việt Nam, bài {i}."],
+    } for i in range(count)]
+
+
+def prepare(claim=CLAIM, **settings):
+    saved = {key: getattr(evidence_config, key) for key in settings}
+    for key, value in settings.items():
+        setattr(evidence_config, key, value)
+    cache_enabled = content_cache_config.enabled
+    content_cache_config.enabled = False
+    try:
+        fetcher = EvidenceFetcher()
+        return fetcher.prepare_evidence_chunks(search_results(5, 5), [], claim=claim)
+    finally:
+        content_cache_config.enabled = cache_enabled
+        for key, value in saved.items():
+            setattr(evidence_config, key, value)
+
+
+def test_extra_snippets_capped_without_passage_selection():
+    chunks = prepare(passage_selection=False, use_extra_snippets=True, max_chunks=5,
+                     max_extra_snippets=5, max_extra_chunks=3, dedup_enabled=False)
+    extras = [chunk for chunk in chunks if chunk["source"] == "web_search_extra"]
+    assert len([chunk for chunk in chunks if chunk["source"] == "web_search"]) == 5
+    assert len(extras) == 3
+
+
+def test_extra_snippets_ranked_against_claim():
+    chunks = prepare(passage_selection=False, use_extra_snippets=True, max_chunks=5,
+                     max_extra_snippets=5, max_extra_chunks=3, dedup_enabled=False)
+    extras = [chunk["text"] for chunk in chunks if chunk["source"] == "web_search_extra"]
+    assert all(text.startswith("Hà Nội là thủ đô") for text in extras), extras
+
+
+def test_extra_snippets_in_search_order_without_claim():
+    chunks = prepare(claim=None, passage_selection=False, use_extra_snippets=True, max_chunks=5,
+                     max_extra_snippets=5, max_extra_chunks=2, dedup_enabled=False)
+    extras = [chunk["text"] for chunk in chunks if chunk["source"] == "web_search_extra"]
+    assert extras == ["Đoạn phụ 0 của bài 0 nói về giá vàng.", "Đoạn phụ 1 của bài 0 nói về giá vàng."]
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f" [OK] {name}")
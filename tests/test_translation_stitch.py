@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""Offline test: stitching sentence translations back into texts (no services needed)"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "vietnamese-fact-checker", "src"))
+
+from services.translation_client import TranslationClient, is_translation_failure
+
+
+def test_stitch_joins_sentences():
+    assert TranslationClient._stitch([[0, 1], [2]], ["Good.", "Fine.", "ok"]) == ["Good. Fine.", "ok"]
+
+
+def test_failed_sentence_fails_whole_text():
+    for failure in ("[API error 500: x]", "[Translation timeout: x]", ""):
+        for translations in (["Good.", failure, "ok"], [failure, "Good.", "ok"]):
+            stitched = TranslationClient._stitch([[0, 1], [2]], translations)
+            assert is_translation_failure(stitched[0]), stitched
+            assert "Good." not in stitched[0]
+            assert stitched[1] == "ok"
+
+
+def test_missing_sentence_fails_whole_text():
+    stitched = TranslationClient._stitch([[0], [1, 2]], ["Good.", "Fine."])
+    assert stitched[0] == "Good."
+    assert is_translation_failure(stitched[1])
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f" [OK] {name}")
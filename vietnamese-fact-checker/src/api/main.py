@@ -1,24 +1,38 @@
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import Dict, Any, Optional
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from api.schemas import ClaimRequest, ClaimResponse, HealthResponse
+from api.schemas import ClaimRequest, ClaimResponse, HealthResponse, BatchClaimRequest, BatchClaimResponse
 from services.fact_checker import VietnameseFactChecker
+from services.http_session import http_session_manager
 from core.system_config import system_config, reload_config
+from contextlib import asynccontextmanager
 import asyncio
+import json
+import time
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """App lifespan: shared downstream HTTP sessions, extraction workers and caches are closed on shutdown"""
+    yield
+    await http_session_manager.close()
+    fact_checker.evidence_fetcher.close()
+    fact_checker.translation_client.close()
 
 app = FastAPI(
     title="Vietnamese Fact Checker API",
     description="Vietnamese fact-checking system using MiniCheck and web search. Includes configuration API for future Web UI.",
-    version="2.0.0"
+    version="2.0.0",
+    lifespan=lifespan
 )
 
 # Config update request model
 class ConfigUpdateRequest(BaseModel):
-    section: str  # brave_search, translation, minicheck, evidence, logging, performance, response, error_handling
+    section: str  # brave_search, translation, minicheck, evidence, logging, performance, verdict_cache, content_cache, response, error_handling
     updates: Dict[str, Any]
 
 # CORS middleware
@@ -45,6 +59,80 @@ async def check_claim(request: ClaimRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
+@app.post("/check/stream")
+async def check_claim_stream(request: ClaimRequest):
+    """
+    Check a Vietnamese claim and stream stage results as NDJSON lines.
+    Events: search_results, translated_claim, translated_evidence, minicheck_scores,
+    then final (the ClaimResponse) or error. Closing the connection cancels the check.
+    """
+    if not request.claim or len(request.claim.strip()) < 10:
+        raise HTTPException(status_code=400, detail="Claim too short (minimum 10 characters)")
+    
+    queue: asyncio.Queue = asyncio.Queue()
+    
+    def on_event(event: str, data: Dict[str, Any]):
+        queue.put_nowait({"event": event, "data": data})
+    
+    async def run():
+        try:
+            result = await fact_checker.check_claim(request.claim, on_event=on_event)
+            on_event("final", ClaimResponse(**result).model_dump())
+        except Exception as e:
+            on_event("error", {"detail": f"Internal server error: {str(e)}"})
+        finally:
+            queue.put_nowait(None)
+    
+    async def stream():
+        task = asyncio.ensure_future(run())
+        try:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    break
+                yield json.dumps(item, ensure_ascii=False) + "\n"
+        finally:
+            # Client went away (or stream finished): stop the pipeline
+            if not task.done():
+                task.cancel()
+    
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+@app.post("/check_batch", response_model=BatchClaimResponse)
+async def check_batch(request: BatchClaimRequest):
+    """Check many Vietnamese claims with cross-claim batching (results in input order)"""
+    if not request.claims:
+        raise HTTPException(status_code=400, detail="No claims provided")
+    
+    max_claims = system_config.performance.batch_max_claims
+    if len(request.claims) > max_claims:
+        raise HTTPException(status_code=400, detail=f"Too many claims (maximum {max_claims})")
+    
+    start_time = time.time()
+    try:
+        # Invalid claims get a per-claim error instead of failing the whole batch
+        valid_indices = [i for i, claim in enumerate(request.claims) if claim and len(claim.strip()) >= 10]
+        checked = await fact_checker.check_claims_batch([request.claims[i] for i in valid_indices])
+        
+        results = [
+            fact_checker._build_error_response(claim or "", "Claim too short (minimum 10 characters)", "INVALID_CLAIM", 0.0)
+            for claim in request.claims
+        ]
+        for i, result in zip(valid_indices, checked):
+            results[i] = result
+        
+        responses = [ClaimResponse(**result) for result in results]
+        failed = sum(1 for r in responses if r.error)
+        return BatchClaimResponse(
+            results=responses,
+            total=len(responses),
+            succeeded=len(responses) - failed,
+            failed=failed,
+            processing_time=time.time() - start_time
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
     """Health check endpoint"""
@@ -66,13 +154,46 @@ async def root():
         "version": "2.0.0",
         "endpoints": {
             "check": "/check - Check a Vietnamese claim",
+            "check/stream": "/check/stream - Check a claim, streaming stage results as NDJSON",
+            "check_batch": "/check_batch - Check many Vietnamese claims in one request",
             "health": "/health - Health check",
             "config": "/config - Get all configurations",
             "config/{section}": "/config/{section} - Get specific config section",
+            "stats/connections": "/stats/connections - Per-downstream connection reuse stats",
+            "stats/cache": "/stats/cache - Verdict, content, translation and MiniCheck score cache stats",
+            "stats/coalescing": "/stats/coalescing - Single-flight coalescing counters",
             "docs": "/docs - API documentation"
         }
     }
 
+@app.get("/stats/connections")
+async def get_connection_stats():
+    """Per-downstream connection reuse statistics of the shared HTTP sessions"""
+    return {
+        "status": "success",
+        "connections": http_session_manager.get_stats()
+    }
+
+@app.get("/stats/cache")
+async def get_cache_stats():
+    """Verdict, evidence content, translation and MiniCheck score cache statistics"""
+    content_cache = fact_checker.evidence_fetcher.content_cache
+    return {
+        "status": "success",
+        "verdict_cache": fact_checker.verdict_cache.get_stats(),
+        "content_cache": content_cache.get_stats() if content_cache else None,
+        "translation_cache": fact_checker.translation_client.get_cache_stats(),
+        "minicheck_score_cache": fact_checker.minicheck.get_cache_stats()
+    }
+
+@app.get("/stats/coalescing")
+async def get_coalescing_stats():
+    """Single-flight coalescing counters for identical concurrent claims"""
+    return {
+        "status": "success",
+        "coalescing": fact_checker.single_flight.get_stats()
+    }
+
 # ==================== CONFIG API ENDPOINTS ====================
 # These endpoints are for future Web UI configuration management
 
@@ -89,6 +210,8 @@ async def get_all_config():
             "evidence",
             "logging",
             "performance",
+            "verdict_cache",
+            "content_cache",
             "api",
             "response",
             "error_handling"
@@ -151,6 +274,8 @@ async def update_config_section(section: str, request: ConfigUpdateRequest):
         "evidence": system_config.evidence,
         "logging": system_config.logging,
         "performance": system_config.performance,
+        "verdict_cache": system_config.verdict_cache,
+        "content_cache": system_config.content_cache,
         "api": system_config.api,
         "response": system_config.response,
         "error_handling": system_config.error_handling,
@@ -8,6 +8,7 @@ class Evidence(BaseModel):
     text: str
     url: str
     title: Optional[str] = None
+    duplicate_urls: List[str] = []  # Sources carrying a near-identical copy of this text
 
 class ClaimResponse(BaseModel):
     claim: str
@@ -20,8 +21,24 @@ class ClaimResponse(BaseModel):
     method: str
     error: Optional[str] = None
     sources: List[str] = []
+    stage_timings: Optional[dict] = None  # Per-stage wall time and critical path
+    cache_hit: bool = False  # Served from the verdict cache
+    coalesced: bool = False  # Shared the result of an identical in-flight request
+    partial: bool = False  # Some stages ran out of their deadline budget
+    timed_out_stages: List[str] = []
+    deduplicated_count: int = 0  # Near-duplicate evidence texts collapsed before translation
     debug_info: Optional[dict] = None  # Contains translation, minicheck I/O for debugging
 
+class BatchClaimRequest(BaseModel):
+    claims: List[str]
+
+class BatchClaimResponse(BaseModel):
+    results: List[ClaimResponse]  # Same order as the request claims
+    total: int
+    succeeded: int
+    failed: int
+    processing_time: float
+
 class HealthResponse(BaseModel):
     status: str
     method: str
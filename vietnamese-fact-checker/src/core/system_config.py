@@ -20,6 +20,10 @@ class BraveSearchConfig(BaseSettings):
     timeout: int = 15
     max_results: int = 5
     
+    # Connection pooling
+    connection_limit: int = 10
+    keepalive_timeout: int = 30
+    
     # Localization
     country: str = "VN"
     language: str = "vi"
@@ -89,13 +93,27 @@ class TranslationConfig(BaseSettings):
     batch_size: int = 10
     timeout: int = 45
     
+    # Connection pooling (async client)
+    connection_limit: int = 10
+    keepalive_timeout: int = 30
+    
     # GPU Settings
     use_gpu: bool = True
     gpu_device: str = "cuda:0"
     
-    # Caching
-    cache_translations: bool = False
-    cache_ttl: int = 3600
+    # Decoding profiles (fast = greedy, balanced = small beam, accurate = full beam)
+    claim_profile: str = "accurate"
+    evidence_profile: str = "fast"
+    
+    # Caching: SQLite (WAL) file shared by all workers, LRU-evicted above cache_max_bytes
+    cache_translations: bool = True
+    cache_ttl: int = 604800
+    cache_sqlite_path: str = "data/translation_cache.db"
+    cache_max_bytes: int = 50_000_000
+    
+    # Split texts into sentences before /translate_batch so overlapping snippets
+    # reuse cached sentence translations; only new sentences are translated
+    sentence_memoization: bool = True
     
     class Config:
         env_prefix = "TRANSLATION_"
@@ -107,8 +125,21 @@ class MiniCheckConfig(BaseSettings):
     # API Settings
     api_url: str = "http://localhost:8002"
     verify_endpoint: str = "/verify"
+    verify_many_endpoint: str = "/verify_many"
     timeout: int = 60
     
+    # verify_many: claims are sent in requests of at most this many pairs
+    verify_many_max_pairs: int = 512
+    
+    # Pair score cache: (claim, evidence, model) scores already seen are not re-sent
+    cache_scores: bool = True
+    score_cache_max_entries: int = 50000
+    score_cache_ttl: int = 86400
+    
+    # Connection pooling
+    connection_limit: int = 10
+    keepalive_timeout: int = 30
+    
     # Model Settings
     model_name: str = "roberta-large"
     
@@ -120,6 +151,11 @@ class MiniCheckConfig(BaseSettings):
     # Aggregation Strategy: "best", "average", "majority", "weighted"
     aggregation_strategy: str = "best"
     
+    # Early exit ("best" only): evidence is scored in rank order, early_exit_batch_size
+    # items at a time, and scoring stops once one reaches threshold_supported
+    early_exit: bool = False
+    early_exit_batch_size: int = 2
+    
     # Minimum confidence to consider evidence
     min_evidence_confidence: float = 0.1
     
@@ -139,10 +175,44 @@ class EvidenceConfig(BaseSettings):
     fetch_full_content: bool = True
     content_fetch_timeout: int = 15
     
+    # Connection pooling for page fetches (many hosts)
+    connection_limit: int = 20
+    connection_limit_per_host: int = 2
+    keepalive_timeout: int = 15
+    
+    # Concurrent page fetching
+    max_inflight_fetches: int = 10
+    max_page_bytes: int = 1500000
+    
+    # HTML extraction: worker processes (0 = extract on the event loop) and parser ("html.parser" or "lxml")
+    extraction_workers: int = 2
+    html_parser: str = "lxml"
+    
     # Evidence quality
     min_text_length: int = 50
     max_text_length: int = 1000
     
+    # Claim-aware passage selection: only the best passages (BM25 vs the claim)
+    # of each evidence group are translated and verified. Tokens = syllables.
+    passage_selection: bool = True
+    passage_max_tokens: int = 48
+    passage_top_k: int = 3
+    passage_token_budget: int = 144
+    
+    # Article text kept after extraction (passages are selected from it)
+    max_article_chars: int = 20000
+    
+    # Brave extra_snippets used as additional snippet passages (no page fetch needed)
+    use_extra_snippets: bool = True
+    max_extra_snippets: int = 5  # per search result
+    max_extra_chunks: int = 5  # in total without passage selection, best for the claim first
+    
+    # Near-duplicate evidence (syndicated copies) collapsed before translation
+    dedup_enabled: bool = True
+    dedup_threshold: float = 0.8  # estimated Jaccard similarity of syllable shingles
+    dedup_shingle_size: int = 3
+    dedup_num_perm: int = 64
+    
     class Config:
         env_prefix = "EVIDENCE_"
 
@@ -181,14 +251,58 @@ class PerformanceConfig(BaseSettings):
     # Batch processing
     batch_translation: bool = True
     
-    # Timeouts
+    # /check_batch cross-claim batching
+    batch_max_claims: int = 500
+    batch_search_concurrency: int = 8
+    batch_translation_chunk_size: int = 64
+    batch_minicheck_concurrency: int = 4
+    
+    # Timeouts - the request deadline is min(max_total_time, request_timeout)
     request_timeout: int = 120
     max_total_time: float = 60.0
     
+    # Stage budgets: a stage may use the time left on the request deadline minus
+    # this fraction of the deadline for every dependent stage still to run
+    stage_reserve: float = 0.15
+    
+    # Shared HTTP sessions
+    dns_cache_ttl: int = 300
+    
     class Config:
         env_prefix = "PERF_"
 
 
+class VerdictCacheConfig(BaseSettings):
+    """Verdict Cache Configuration (responses keyed by canonical claim)"""
+    
+    enabled: bool = True
+    max_entries: int = 10000
+    ttl: int = 3600
+    
+    # SQLite file for persistence across restarts (None = memory only)
+    sqlite_path: Optional[str] = None
+    
+    class Config:
+        env_prefix = "VERDICT_CACHE_"
+
+
+class ContentCacheConfig(BaseSettings):
+    """Content Cache Configuration (extracted page text of fetched evidence)"""
+    
+    enabled: bool = True
+    
+    # SQLite file; extracted text is stored content-addressed (sha256 of the text)
+    sqlite_path: str = "data/evidence_content_cache.db"
+    max_bytes: int = 100_000_000
+    
+    # Entries newer than fresh_ttl are served without contacting the site;
+    # older ones are revalidated with ETag / Last-Modified
+    fresh_ttl: int = 3600
+    
+    class Config:
+        env_prefix = "CONTENT_CACHE_"
+
+
 class APIConfig(BaseSettings):
     """API Endpoints Configuration"""
     
@@ -248,6 +362,8 @@ class SystemConfig(BaseSettings):
     evidence: EvidenceConfig = Field(default_factory=EvidenceConfig)
     logging: LoggingConfig = Field(default_factory=LoggingConfig)
     performance: PerformanceConfig = Field(default_factory=PerformanceConfig)
+    verdict_cache: VerdictCacheConfig = Field(default_factory=VerdictCacheConfig)
+    content_cache: ContentCacheConfig = Field(default_factory=ContentCacheConfig)
     api: APIConfig = Field(default_factory=APIConfig)
     response: ResponseConfig = Field(default_factory=ResponseConfig)
     error_handling: ErrorHandlingConfig = Field(default_factory=ErrorHandlingConfig)
@@ -265,6 +381,8 @@ class SystemConfig(BaseSettings):
             "evidence": self.evidence.model_dump(),
             "logging": self.logging.model_dump(),
             "performance": self.performance.model_dump(),
+            "verdict_cache": self.verdict_cache.model_dump(),
+            "content_cache": self.content_cache.model_dump(),
             "api": self.api.model_dump(),
             "response": self.response.model_dump(),
             "error_handling": self.error_handling.model_dump(),
@@ -293,6 +411,8 @@ class SystemConfig(BaseSettings):
                 evidence=EvidenceConfig(**data.get('evidence', {})),
                 logging=LoggingConfig(**data.get('logging', {})),
                 performance=PerformanceConfig(**data.get('performance', {})),
+                verdict_cache=VerdictCacheConfig(**data.get('verdict_cache', {})),
+                content_cache=ContentCacheConfig(**data.get('content_cache', {})),
                 api=APIConfig(**data.get('api', {})),
                 response=ResponseConfig(**data.get('response', {})),
                 error_handling=ErrorHandlingConfig(**data.get('error_handling', {})),
@@ -310,6 +430,8 @@ minicheck_config = system_config.minicheck
 evidence_config = system_config.evidence
 logging_config = system_config.logging
 performance_config = system_config.performance
+verdict_cache_config = system_config.verdict_cache
+content_cache_config = system_config.content_cache
 api_config = system_config.api
 response_config = system_config.response
 error_config = system_config.error_handling
@@ -323,7 +445,8 @@ def get_config() -> SystemConfig:
 def reload_config():
     """Reload configuration from environment"""
     global system_config, brave_config, translation_config, minicheck_config
-    global evidence_config, logging_config, performance_config, api_config
+    global evidence_config, logging_config, performance_config, verdict_cache_config, content_cache_config
+    global api_config
     global response_config, error_config
     
     system_config = SystemConfig()
@@ -333,6 +456,8 @@ def reload_config():
     evidence_config = system_config.evidence
     logging_config = system_config.logging
     performance_config = system_config.performance
+    verdict_cache_config = system_config.verdict_cache
+    content_cache_config = system_config.content_cache
     api_config = system_config.api
     response_config = system_config.response
     error_config = system_config.error_handling
@@ -12,6 +12,7 @@ import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from core.system_config import brave_config, logging_config
+from services.http_session import http_session_manager
 
 class BraveSearchClient:
     """Client for Brave Search Baseline API with source filtering"""
@@ -23,15 +24,27 @@ class BraveSearchClient:
         self.health_check_url = f"{self.config.proxy_url}/"
         self.timeout = float(self.config.timeout)
         
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared pooled keep-alive session for this service"""
+        return http_session_manager.get_session(
+            "brave_search",
+            limit=self.config.connection_limit,
+            limit_per_host=self.config.connection_limit,
+            keepalive_timeout=self.config.keepalive_timeout
+        )
+    
     async def check_health(self) -> bool:
         """Check if Brave Search baseline is running"""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.health_check_url, timeout=5) as response:
-                    return response.status == 200
+            session = self._get_session()
+            async with session.get(self.health_check_url, timeout=aiohttp.ClientTimeout(total=5)) as response:
+                return response.status == 200
         except:
             return False
     
+    def _effective_timeout(self, timeout: Optional[float]) -> float:
+        return self.timeout if timeout is None else min(self.timeout, timeout)
+    
     def _build_filtered_query(self, query: str) -> str:
         """Build query with source filtering based on config"""
         if self.config.source_filter_mode == "exclude":
@@ -82,8 +95,11 @@ class BraveSearchClient:
         
         return "\n".join(rules)
     
-    async def search_vietnamese(self, query: str) -> List[Dict]:
-        """Search for Vietnamese content using Brave Search baseline API"""
+    async def search_vietnamese(self, query: str, timeout: Optional[float] = None) -> List[Dict]:
+        """Search for Vietnamese content using Brave Search baseline API
+        
+        `timeout` (seconds) caps the configured timeout, e.g. with a deadline budget.
+        """
         try:
             # Apply source filtering
             filtered_query = self._build_filtered_query(query)
@@ -108,29 +124,34 @@ class BraveSearchClient:
             if self.config.extra_snippets:
                 request_data["extra_snippets"] = True
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.api_url,
-                    json=request_data,
-                    timeout=aiohttp.ClientTimeout(total=self.timeout)
-                ) as response:
+            session = self._get_session()
+            async with session.post(
+                self.api_url,
+                json=request_data,
+                timeout=aiohttp.ClientTimeout(total=self._effective_timeout(timeout))
+            ) as response:
+                
+                if response.status == 200:
+                    result = await response.json()
+                    parsed = self._parse_search_results(result)
                     
-                    if response.status == 200:
-                        result = await response.json()
-                        parsed = self._parse_search_results(result)
-                        
-                        if self.log_config.log_search_results:
-                            print(f"   [OK] Retrieved {len(parsed)} results")
-                            for i, r in enumerate(parsed, 1):
-                                domain = r.get('url', '').split('/')[2] if '/' in r.get('url', '') else 'unknown'
-                                print(f"      {i}. [{domain}] {r.get('title', '')[:50]}...")
-                        
-                        return parsed
-                    else:
-                        error_text = await response.text()
-                        print(f"[ERROR] Brave Search API error: {response.status} - {error_text}")
-                        return []
-                        
+                    if self.log_config.log_search_results:
+                        print(f"   [OK] Retrieved {len(parsed)} results")
+                        for i, r in enumerate(parsed, 1):
+                            domain = r.get('url', '').split('/')[2] if '/' in r.get('url', '') else 'unknown'
+                            print(f"      {i}. [{domain}] {r.get('title', '')[:50]}...")
+                    
+                    return parsed
+                else:
+                    error_text = await response.text()
+                    print(f"[ERROR] Brave Search API error: {response.status} - {error_text}")
+                    return []
+                    
+        except asyncio.TimeoutError:
+            if timeout is not None:
+                raise  # Deadline budget exhausted: the caller builds a partial result
+            print(f"[ERROR] Brave Search timeout after {self.timeout}s")
+            return []
         except aiohttp.ClientError as e:
             print(f"[ERROR] Brave Search network error: {str(e)}")
             return []
@@ -0,0 +1,217 @@
+"""
+Content Cache - Persistent cache of extracted evidence page text
+Pages map to content-addressed text (sha256 of the extracted text), so a hit
+skips both the network and HTML parsing. Stale pages are revalidated with
+ETag / Last-Modified; total stored text is bounded by size (LRU eviction).
+The byte total is kept in a meta row by triggers and access times are written
+in batches, so neither a lookup nor a store scans or commits per call.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+# Pages evicted per DELETE while the cache is over its size bound
+_EVICT_BATCH = 100
+# Pending access times written in one UPDATE batch
+_TOUCH_BATCH = 100
+
+
+class ContentCache:
+    """SQLite-backed cache of extracted page text keyed by URL and content hash"""
+
+    def __init__(self, sqlite_path: str, max_bytes: int = 100_000_000, fresh_ttl: float = 3600):
+        self.sqlite_path = sqlite_path
+        self.max_bytes = max_bytes
+        self.fresh_ttl = fresh_ttl
+        self.hits = 0
+        self.stale = 0
+        self.revalidated = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()  # one statement sequence at a time on the shared connection
+        self._touched: Dict[str, float] = {}  # url -> access time not yet written
+
+        directory = os.path.dirname(sqlite_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # timeout: wait for another worker's write transaction instead of failing
+        self._db = sqlite3.connect(sqlite_path, timeout=5, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript("""
+            CREATE TABLE IF NOT EXISTS contents (
+                hash TEXT PRIMARY KEY,
+                content TEXT NOT NULL,
+                size INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS pages (
+                url TEXT PRIMARY KEY,
+                hash TEXT NOT NULL,
+                title TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                validated_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS pages_accessed ON pages (accessed_at);
+            CREATE INDEX IF NOT EXISTS pages_hash ON pages (hash);
+            CREATE TABLE IF NOT EXISTS cache_meta (name TEXT PRIMARY KEY, value INTEGER NOT NULL);
+            CREATE TRIGGER IF NOT EXISTS contents_bytes_insert AFTER INSERT ON contents BEGIN
+                UPDATE cache_meta SET value = value + NEW.size WHERE name = 'total_bytes';
+            END;
+            CREATE TRIGGER IF NOT EXISTS contents_bytes_delete AFTER DELETE ON contents BEGIN
+                UPDATE cache_meta SET value = value - OLD.size WHERE name = 'total_bytes';
+            END;
+        """)
+        # Seeds the total once for a cache file created before the meta row existed
+        self._db.execute(
+            "INSERT OR IGNORE INTO cache_meta (name, value) "
+            "SELECT 'total_bytes', COALESCE(SUM(size), 0) FROM contents"
+        )
+        self._db.commit()
+
+    def lookup(self, url: str) -> Optional[Dict]:
+        """Return the cached entry for a URL with a `fresh` flag, or None.
+
+        A fresh entry can be used as is; a stale one carries the validators
+        (`etag`, `last_modified`) for a conditional request.
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT p.etag, p.last_modified, p.validated_at, p.title, c.content "
+                "FROM pages p JOIN contents c ON c.hash = p.hash WHERE p.url = ?", (url,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            now = time.time()
+            self._touched[url] = now
+            if len(self._touched) >= _TOUCH_BATCH:
+                self._flush_touched()
+                self._db.commit()
+
+        etag, last_modified, validated_at, title, content = row
+        fresh = now - validated_at < self.fresh_ttl
+        if fresh:
+            self.hits += 1
+        else:
+            self.stale += 1
+        return {
+            "evidence": {"title": title, "url": url, "content": content, "source": "web_fetch"},
+            "etag": etag,
+            "last_modified": last_modified,
+            "fresh": fresh
+        }
+
+    def mark_revalidated(self, url: str):
+        """The site answered 304 Not Modified: the cached text is fresh again"""
+        now = time.time()
+        with self._lock:
+            self._touched.pop(url, None)
+            self._db.execute("UPDATE pages SET validated_at = ?, accessed_at = ? WHERE url = ?", (now, now, url))
+            self._db.commit()
+        self.revalidated += 1
+
+    def store(self, url: str, evidence: Dict, etag: Optional[str] = None, last_modified: Optional[str] = None):
+        """Store the extracted text of a page, evicting least recently used pages over the size bound"""
+        content = evidence.get("content", "")
+        title = evidence.get("title", "")
+        content_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        now = time.time()
+        with self._lock:
+            self._touched.pop(url, None)
+            previous = self._db.execute("SELECT hash FROM pages WHERE url = ?", (url,)).fetchone()
+
+            self._db.execute(
+                "INSERT OR IGNORE INTO contents (hash, content, size) VALUES (?, ?, ?)",
+                (content_hash, content, len(content.encode("utf-8")))
+            )
+            self._db.execute(
+                "INSERT OR REPLACE INTO pages (url, hash, title, etag, last_modified, validated_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (url, content_hash, title, etag, last_modified, now, now)
+            )
+            if previous and previous[0] != content_hash:
+                # The page changed: drop its old text unless another URL shares it
+                self._delete_orphans([previous[0]])
+            self._evict()
+            self._db.commit()
+
+    def _flush_touched(self):
+        """Write the pending access times (caller holds the lock and commits)"""
+        if self._touched:
+            self._db.executemany("UPDATE pages SET accessed_at = ? WHERE url = ?",
+                                 [(accessed_at, url) for url, accessed_at in self._touched.items()])
+            self._touched.clear()
+
+    def _delete_orphans(self, hashes):
+        """Delete the given contents that no page refers to any more"""
+        self._db.executemany(
+            "DELETE FROM contents WHERE hash = ? AND NOT EXISTS (SELECT 1 FROM pages WHERE pages.hash = contents.hash)",
+            [(content_hash,) for content_hash in set(hashes)]
+        )
+
+    def _total_bytes(self) -> int:
+        return self._db.execute("SELECT value FROM cache_meta WHERE name = 'total_bytes'").fetchone()[0]
+
+    def _evict(self):
+        """Drop least recently used pages in batches until under the size bound (caller holds the lock)"""
+        if self._total_bytes() <= self.max_bytes:
+            return
+        # Access order must be current before choosing victims
+        self._flush_touched()
+        while self._total_bytes() > self.max_bytes:
+            excess = self._total_bytes() - self.max_bytes
+            oldest = self._db.execute(
+                "SELECT p.url, p.hash, c.size FROM pages p JOIN contents c ON c.hash = p.hash "
+                "ORDER BY p.accessed_at LIMIT ?", (_EVICT_BATCH,)
+            ).fetchall()
+            if not oldest:
+                break
+            victims = []
+            for url, content_hash, size in oldest:
+                if excess <= 0:
+                    break
+                victims.append((url, content_hash))
+                excess -= size
+            self._db.executemany("DELETE FROM pages WHERE url = ?", [(url,) for url, _ in victims])
+            self._delete_orphans([content_hash for _, content_hash in victims])
+            self.evictions += len(victims)
+
+    def clear(self):
+        with self._lock:
+            self._touched.clear()
+            self._db.execute("DELETE FROM pages")
+            self._db.execute("DELETE FROM contents")
+            self._db.commit()
+
+    def close(self):
+        with self._lock:
+            self._flush_touched()
+            self._db.commit()
+            self._db.close()
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            pages = self._db.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+            contents = self._db.execute("SELECT COUNT(*) FROM contents").fetchone()[0]
+            total_bytes = self._total_bytes()
+        lookups = self.hits + self.stale + self.misses
+        return {
+            "pages": pages,
+            "unique_contents": contents,
+            "bytes": total_bytes,
+            "max_bytes": self.max_bytes,
+            "fresh_ttl": self.fresh_ttl,
+            "hits": self.hits,
+            "stale": self.stale,
+            "revalidated": self.revalidated,
+            "misses": self.misses,
+            "hit_rate": (self.hits + self.revalidated) / lookups if lookups else 0.0,
+            "evictions": self.evictions
+        }
@@ -0,0 +1,46 @@
+"""
+Deadline - End-to-end request deadline split into per-stage budgets
+A stage may use all the time that is left except a reserve for the stages that
+still have to run after it.
+"""
+
+import asyncio
+import time
+from typing import Awaitable, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class Deadline:
+    """Request-level deadline; stages get the time left minus a reserve for later stages"""
+
+    def __init__(self, total: float, stage_reserve: float = 0.0):
+        self.total = total
+        self.stage_reserve = stage_reserve  # fraction of the total kept per later stage
+        self._expires_at = time.monotonic() + total
+
+    def remaining(self) -> float:
+        return max(0.0, self._expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0.0
+
+    def budget(self, stages_after: int = 0) -> float:
+        """Time budget of a stage followed by `stages_after` dependent stages
+        
+        The time left minus their reserve; when little time is left, at least an
+        even share of it, so a stage is never starved outright.
+        """
+        remaining = self.remaining()
+        reserve = self.total * self.stage_reserve * stages_after
+        return max(remaining - reserve, remaining / (stages_after + 1))
+
+    async def run(self, stage: str, coro: Awaitable[T], budget: float,
+                  timed_out: List[str]) -> Optional[T]:
+        """Await `coro` within `budget` seconds; on timeout record the stage and return None"""
+        try:
+            return await asyncio.wait_for(coro, timeout=max(budget, 0.001))
+        except asyncio.TimeoutError:
+            print(f"[DEADLINE] Stage '{stage}' exceeded its {budget:.2f}s budget")
+            timed_out.append(stage)
+            return None
@@ -1,14 +1,20 @@
 import aiohttp
 import asyncio
-from bs4 import BeautifulSoup
-from typing import List, Dict, Optional
-import re
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import AsyncIterator, List, Dict, Optional
+from urllib.parse import urlparse
 import time
 import sys
 import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from core.system_config import evidence_config, logging_config
+from core.system_config import evidence_config, logging_config, content_cache_config
+from services.http_session import http_session_manager
+from services.html_extractor import extract_page
+from services.content_cache import ContentCache
+from services.passage_selector import bm25_scores, split_passages, select_passages, selection_stats, syllables
+from services.near_duplicate import NearDuplicateIndex
 
 class EvidenceFetcher:
     def __init__(self):
@@ -17,100 +23,167 @@ class EvidenceFetcher:
         self.timeout = float(self.config.content_fetch_timeout)
         self.max_content_length = self.config.max_length
         
-    async def fetch_evidence(self, urls: List[str]) -> List[Dict]:
-        """Fetch evidence from URLs with improved error handling"""
+        # Shared across requests: global in-flight limit and per-host limits (created lazily on the loop)
+        self._inflight: Optional[asyncio.Semaphore] = None
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
         
-        evidence_list = []
+        # HTML extraction runs in a bounded process pool (created on first use)
+        self._extraction_pool: Optional[ProcessPoolExecutor] = None
+        
+        # Extracted page text persisted across claims and restarts
+        self.cache_config = content_cache_config
+        self.content_cache: Optional[ContentCache] = None
+        if self.cache_config.enabled:
+            self.content_cache = ContentCache(
+                self.cache_config.sqlite_path,
+                max_bytes=self.cache_config.max_bytes,
+                fresh_ttl=self.cache_config.fresh_ttl
+            )
+        
+    async def fetch_evidence(self, urls: List[str], timeout: Optional[float] = None) -> List[Dict]:
+        """Fetch and extract evidence pages concurrently, returned in URL order
+        
+        `timeout` (seconds) caps the per-page fetch timeout, e.g. with a deadline budget.
+        """
+        
+        evidence_list = [evidence async for evidence in self.iter_evidence(urls, timeout)]
+        order = {url: i for i, url in enumerate(urls)}
+        evidence_list.sort(key=lambda evidence: order.get(evidence['url'], len(order)))
+        return evidence_list
+    
+    async def iter_evidence(self, urls: List[str], timeout: Optional[float] = None) -> AsyncIterator[Dict]:
+        """Fetch and extract evidence pages concurrently, yielding each page as it completes
+        
+        Fetches are bounded by a global in-flight limit and a per-host limit shared by
+        all requests; failed or empty pages are skipped.
+        """
         
         # Limit URLs based on config
         max_urls = self.config.max_chunks
-        limited_urls = urls[:max_urls]
+        limited_urls = [url for url in urls[:max_urls] if url and url.startswith('http')]
         
         if self.log_config.log_service_io:
-            print(f"   [INFO] Fetching {len(limited_urls)} URLs (max: {max_urls})")
+            print(f"   [INFO] Fetching {len(limited_urls)} URLs concurrently (max: {max_urls})")
         
-        for url in limited_urls:
-            try:
-                # Skip if URL is invalid
-                if not url or not url.startswith('http'):
+        tasks = [asyncio.ensure_future(self._fetch_one(url, timeout)) for url in limited_urls]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    evidence = await next_done
+                except Exception as e:
+                    print(f"Error fetching evidence: {e}")
                     continue
-                    
-                # Use snippet instead of full content fetching
-                evidence = await self._fetch_snippet_only(url)
                 if evidence:
-                    evidence_list.append(evidence)
-                    
-                # Add small delay between requests
-                await asyncio.sleep(0.1)
-                
-            except Exception as e:
-                print(f"Error fetching {url}: {e}")
-                continue
-        
-        return evidence_list
+                    yield evidence
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
     
-    async def _fetch_snippet_only(self, url: str) -> Optional[Dict]:
-        """Fetch only snippet without full content to avoid timeouts"""
+    async def _fetch_one(self, url: str, timeout: Optional[float] = None) -> Optional[Dict]:
+        """Fetch and extract a single page within the global and per-host limits"""
         
-        try:
-            # For now, return basic info without fetching
-            # This avoids the timeout issues
-            return {
-                "title": self._extract_title_from_url(url),
-                "url": url,
-                "snippet": f"Content from {url}",
-                "content": f"Content from {url}",
-                "source": "web_search",
-                "fetch_method": "snippet_only"
-            }
-            
-        except Exception as e:
-            print(f"Error in _fetch_snippet_only: {e}")
+        if self._inflight is None:
+            self._inflight = asyncio.Semaphore(self.config.max_inflight_fetches)
+        host = urlparse(url).netloc.lower()
+        host_limit = self._host_limits.get(host)
+        if host_limit is None:
+            host_limit = self._host_limits[host] = asyncio.Semaphore(self.config.connection_limit_per_host)
+        
+        content_cache = self.content_cache if self.cache_config.enabled else None
+        # SQLite work runs on a worker thread so it never blocks the event loop
+        cached = await asyncio.to_thread(content_cache.lookup, url) if content_cache else None
+        if cached and cached['fresh']:
+            return cached['evidence']
+        
+        async with self._inflight, host_limit:
+            start_time = time.time()
+            page = await self._fetch_with_timeout(url, timeout, cached)
+        if not page:
+            # Site unreachable: stale text is better than none
+            return cached['evidence'] if cached else None
+        
+        if page['status'] == 304:
+            # Not modified since it was cached: no parsing needed
+            await asyncio.to_thread(content_cache.mark_revalidated, url)
+            if self.log_config.log_service_io:
+                print(f"   [CACHE] Revalidated {host} (304) in {time.time() - start_time:.2f}s")
+            return cached['evidence']
+        
+        evidence = await self._extract_content_async(page['html'], url)
+        if evidence.get('source') != 'web_fetch' or not evidence.get('content'):
             return None
+        
+        if content_cache:
+            await asyncio.to_thread(content_cache.store, url, evidence, page['etag'], page['last_modified'])
+        
+        if self.log_config.log_service_io:
+            print(f"   [OK] Fetched {host} ({len(evidence['content'])} chars) in {time.time() - start_time:.2f}s")
+        return evidence
     
-    def _extract_title_from_url(self, url: str) -> str:
-        """Extract title from URL"""
-        try:
-            # Remove protocol and www
-            clean_url = url.replace('https://', '').replace('http://', '').replace('www.', '')
-            
-            # Split by / and take first part
-            parts = clean_url.split('/')
-            if parts:
-                domain = parts[0]
-                # Convert domain to readable title
-                title = domain.replace('-', ' ').replace('_', ' ').title()
-                return title
-            
-            return "Web Source"
-            
-        except Exception:
-            return "Web Source"
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared pooled session for web page fetches"""
+        return http_session_manager.get_session(
+            "web_fetch",
+            limit=self.config.connection_limit,
+            limit_per_host=self.config.connection_limit_per_host,
+            keepalive_timeout=self.config.keepalive_timeout
+        )
     
-    async def _fetch_with_timeout(self, url: str) -> Optional[str]:
-        """Fetch content with timeout protection"""
+    async def _fetch_with_timeout(self, url: str, timeout: Optional[float] = None,
+                                  cached: Optional[Dict] = None) -> Optional[Dict]:
+        """Fetch content with timeout protection
+        
+        With a `cached` entry the request is conditional (If-None-Match / If-Modified-Since).
+        Returns {'status', 'html', 'etag', 'last_modified'}, status 304 meaning not modified.
+        """
         
         try:
-            timeout = aiohttp.ClientTimeout(total=self.timeout)
+            total = self.timeout if timeout is None else min(self.timeout, timeout)
+            client_timeout = aiohttp.ClientTimeout(total=total)
+            session = self._get_session()
+            headers = {
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            }
+            if cached:
+                if cached.get('etag'):
+                    headers['If-None-Match'] = cached['etag']
+                if cached.get('last_modified'):
+                    headers['If-Modified-Since'] = cached['last_modified']
             
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-                }
+            async with session.get(url, headers=headers, timeout=client_timeout) as response:
+                if response.status == 304 and cached:
+                    return {'status': 304, 'html': None, 'etag': None, 'last_modified': None}
+                if response.status != 200:
+                    print(f"HTTP {response.status} for {url}")
+                    return None
+                
+                content_type = response.headers.get('Content-Type', '')
+                if content_type and 'html' not in content_type.lower():
+                    print(f"Skipping non-HTML content ({content_type}) for {url}")
+                    return None
+                
+                # Enforce the byte cap while streaming so huge pages are never fully read
+                body = bytearray()
+                async for chunk in response.content.iter_chunked(16384):
+                    body.extend(chunk)
+                    if len(body) >= self.config.max_page_bytes:
+                        del body[self.config.max_page_bytes:]
+                        break
                 
-                async with session.get(url, headers=headers) as response:
-                    if response.status == 200:
-                        content = await response.text()
-                        
-                        # Limit content length to avoid memory issues
-                        if len(content) > self.max_content_length:
-                            content = content[:self.max_content_length]
-                        
-                        return content
-                    else:
-                        print(f"HTTP {response.status} for {url}")
-                        return None
-                        
+                encoding = response.charset or 'utf-8'
+                try:
+                    html = body.decode(encoding, errors='replace')
+                except LookupError:
+                    html = body.decode('utf-8', errors='replace')
+                
+                return {
+                    'status': 200,
+                    'html': html,
+                    'etag': response.headers.get('ETag'),
+                    'last_modified': response.headers.get('Last-Modified')
+                }
+                    
         except asyncio.TimeoutError:
             print(f"Timeout fetching {url}")
             return None
@@ -119,128 +192,69 @@ class EvidenceFetcher:
             return None
     
     def _extract_content(self, html: str, url: str) -> Dict:
-        """Extract content from HTML"""
+        """Extract content from HTML on the calling thread"""
+        return extract_page(html, url, self.config.html_parser, self.config.max_article_chars)
+    
+    async def _extract_content_async(self, html: str, url: str) -> Dict:
+        """Extract content in the worker process pool so parsing never blocks the event loop"""
+        if self.config.extraction_workers <= 0:
+            return self._extract_content(html, url)
         
-        try:
-            soup = BeautifulSoup(html, 'html.parser')
-            
-            # Remove script and style elements
-            for script in soup(["script", "style"]):
-                script.decompose()
-            
-            # Extract title
-            title = self._get_title(soup, url)
-            
-            # Extract main content
-            content = self._get_main_content(soup)
-            
-            # Clean content
-            content = self._clean_text(content)
-            
-            return {
-                "title": title,
-                "url": url,
-                "content": content,
-                "source": "web_fetch"
-            }
-            
-        except Exception as e:
-            print(f"Error extracting content from {url}: {e}")
-            return {
-                "title": self._extract_title_from_url(url),
-                "url": url,
-                "content": f"Error extracting content from {url}",
-                "source": "error"
-            }
+        if self._extraction_pool is None:
+            # spawn: forking a process that runs an event loop and session threads is unsafe
+            self._extraction_pool = ProcessPoolExecutor(
+                max_workers=self.config.extraction_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._extraction_pool, extract_page, html, url, self.config.html_parser,
+            self.config.max_article_chars
+        )
     
-    def _get_title(self, soup: BeautifulSoup, url: str) -> str:
-        """Extract title from HTML"""
-        
-        # Try title tag first
-        title_tag = soup.find('title')
-        if title_tag:
-            title = title_tag.get_text().strip()
-            if title:
-                return title
-        
-        # Try h1 tag
-        h1_tag = soup.find('h1')
-        if h1_tag:
-            title = h1_tag.get_text().strip()
-            if title:
-                return title
-        
-        # Try meta title
-        meta_title = soup.find('meta', property='og:title')
-        if meta_title:
-            title = meta_title.get('content', '').strip()
-            if title:
-                return title
-        
-        # Fallback to URL-based title
-        return self._extract_title_from_url(url)
+    def close(self):
+        """Shut down the extraction worker processes and the content cache"""
+        if self._extraction_pool is not None:
+            self._extraction_pool.shutdown(cancel_futures=True)
+            self._extraction_pool = None
+        if self.content_cache is not None:
+            self.content_cache.close()
+            self.content_cache = None
     
-    def _get_main_content(self, soup: BeautifulSoup) -> str:
-        """Extract main content from HTML"""
-        
-        # Try common content containers
-        content_selectors = [
-            'article',
-            'main',
-            '.content',
-            '#content',
-            '.post-content',
-            '.entry-content',
-            '.article-content'
-        ]
-        
-        for selector in content_selectors:
-            content_element = soup.select_one(selector)
-            if content_element:
-                return content_element.get_text()
-        
-        # Fallback to body text
-        body = soup.find('body')
-        if body:
-            return body.get_text()
-        
-        # Last resort
-        return soup.get_text()
+    def new_dedup_index(self) -> Optional[NearDuplicateIndex]:
+        """Near-duplicate index for one request (None when disabled)"""
+        if not self.config.dedup_enabled:
+            return None
+        return NearDuplicateIndex(
+            threshold=self.config.dedup_threshold,
+            num_perm=self.config.dedup_num_perm,
+            shingle_size=self.config.dedup_shingle_size
+        )
     
-    def _clean_text(self, text: str) -> str:
-        """Clean extracted text"""
-        
-        if not text:
-            return ""
-        
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
+    def prepare_evidence_chunks(self, search_results: List[Dict], full_contents: List[Dict],
+                                claim: Optional[str] = None,
+                                dedup: Optional[NearDuplicateIndex] = None) -> List[Dict]:
+        """Prepare evidence chunks from search results and full contents
         
-        # Remove special characters
-        text = re.sub(r'[\n\r\t]', ' ', text)
-        
-        # Remove extra spaces
-        text = re.sub(r' +', ' ', text)
-        
-        # Limit length
-        if len(text) > 1000:
-            text = text[:1000] + "..."
-        
-        return text.strip()
-    
-    def prepare_evidence_chunks(self, search_results: List[Dict], full_contents: List[Dict]) -> List[Dict]:
-        """Prepare evidence chunks from search results and full contents"""
+        With a `claim`, snippets are split into passages and only the best ones are kept.
+        Without passage selection, extra snippets are capped at max_extra_chunks in total
+        (ranked against the claim when given). With a `dedup` index, near-duplicates of
+        each other or of evidence already sent in the request are dropped (their URLs are
+        kept on the surviving chunk).
+        """
         
         evidence_chunks = []
+        extra_chunks = []
+        select = claim is not None and self.config.passage_selection
         
-        for i, result in enumerate(search_results):
+        for result in search_results[:self.config.max_chunks]:
             # Use snippet from search result as primary evidence
             text = result.get('snippet', '')
             if not text:
                 text = result.get('title', '')
             
-            # Limit text length
-            if len(text) > 400:
+            # Limit text length (passage selection applies its own token budget)
+            if len(text) > 400 and not select:
                 text = text[:400] + "..."
             
             evidence_chunks.append({
@@ -250,10 +264,115 @@ class EvidenceFetcher:
                 'source': 'web_search'
             })
             
-            # Limit to max chunks from config
-            if len(evidence_chunks) >= self.config.max_chunks:
-                break
+            # Extra snippets of the same result are further passages of the page
+            if self.config.use_extra_snippets:
+                extra_chunks.extend(self._extra_snippet_chunks(result, text, truncate=not select))
+        
+        if select:
+            evidence_chunks = self.select_passages(claim, evidence_chunks + extra_chunks, dedup)
+        else:
+            evidence_chunks += self._rank_extra_chunks(claim, extra_chunks)
+            if dedup is not None:
+                evidence_chunks = dedup.collapse(evidence_chunks)
+                dedup.add(evidence_chunks)
         
         if self.log_config.log_service_io:
-            print(f"[INFO] Prepared {len(evidence_chunks)} evidence chunks (max: {self.config.max_chunks})")
+            print(f"[INFO] Prepared {len(evidence_chunks)} evidence chunks from {min(len(search_results), self.config.max_chunks)} results")
         return evidence_chunks
+    
+    def _extra_snippet_chunks(self, result: Dict, main_text: str, truncate: bool) -> List[Dict]:
+        """Chunks for a result's Brave extra_snippets, skipping text the main snippet
+        already contains. Near-duplicates are collapsed later by the request's dedup index."""
+        
+        main_key = ' '.join(syllables(main_text))
+        seen = set()
+        chunks = []
+        for extra in result.get('extra_snippets', [])[:self.config.max_extra_snippets]:
+            key = ' '.join(syllables(extra or ''))
+            if not key or key in seen or key in main_key:
+                continue
+            seen.add(key)
+            if truncate and len(extra) > 400:
+                extra = extra[:400] + "..."
+            chunks.append({
+                'text': extra,
+                'url': result.get('url', ''),
+                'title': result.get('title', ''),
+                'source': 'web_search_extra'
+            })
+        return chunks
+    
+    def _rank_extra_chunks(self, claim: Optional[str], chunks: List[Dict]) -> List[Dict]:
+        """The max_extra_chunks best extra snippet chunks: by BM25 against the claim when
+        given (stable, so ties keep search rank), otherwise in search rank order"""
+        
+        if claim and chunks:
+            scores = bm25_scores(claim, [chunk['text'] for chunk in chunks])
+            order = sorted(range(len(chunks)), key=lambda i: -scores[i])
+            chunks = [chunks[i] for i in order]
+        return chunks[:self.config.max_extra_chunks]
+    
+    def prepare_content_chunks(self, full_contents: List[Dict], claim: Optional[str] = None,
+                               dedup: Optional[NearDuplicateIndex] = None) -> List[Dict]:
+        """Prepare evidence chunks from fetched page contents (placeholders are skipped)
+        
+        `claim` and `dedup` work as in prepare_evidence_chunks.
+        """
+        
+        content_chunks = []
+        select = claim is not None and self.config.passage_selection
+        
+        for doc in full_contents:
+            if not doc or doc.get('source') != 'web_fetch' or not doc.get('content'):
+                continue
+            
+            text = doc['content']
+            if len(text) > self.config.max_text_length and not select:
+                text = text[:self.config.max_text_length] + "..."
+            
+            content_chunks.append({
+                'text': text,
+                'url': doc.get('url', ''),
+                'title': doc.get('title', ''),
+                'source': 'web_fetch'
+            })
+        
+        if select and content_chunks:
+            content_chunks = self.select_passages(claim, content_chunks, dedup)
+        elif dedup is not None:
+            content_chunks = dedup.collapse(content_chunks)
+            dedup.add(content_chunks)
+        
+        return content_chunks
+    
+    def select_passages(self, claim: str, chunks: List[Dict],
+                        dedup: Optional[NearDuplicateIndex] = None) -> List[Dict]:
+        """Split chunks into sentence-aligned passages and keep the top-k passages for the
+        claim within the token budget, the best passage of each source URL first; passages
+        unrelated to the claim are dropped. Each passage keeps the URL and title of its chunk.
+        Near-duplicate passages are collapsed before ranking when `dedup` is given."""
+        
+        candidates = []
+        for chunk in chunks:
+            for passage in split_passages(chunk['text'], self.config.passage_max_tokens):
+                candidates.append({**chunk, 'text': passage})
+        if dedup is not None:
+            candidates = dedup.collapse(candidates)
+        if not candidates:
+            return [] if dedup is not None else chunks
+        
+        passages = [candidate['text'] for candidate in candidates]
+        selected = select_passages(
+            claim, passages, self.config.passage_top_k, self.config.passage_token_budget,
+            sources=[candidate['url'] for candidate in candidates]
+        )
+        
+        if self.log_config.log_service_io:
+            stats = selection_stats(passages, selected)
+            print(f"   [PASSAGES] Selected {stats['selected']}/{stats['passages']} passages, "
+                  f"{stats['selected_tokens']}/{stats['input_tokens']} tokens")
+        
+        passages_out = [{**candidates[i], 'passage_score': round(score, 4)} for i, score in selected]
+        if dedup is not None:
+            dedup.add(passages_out)
+        return passages_out
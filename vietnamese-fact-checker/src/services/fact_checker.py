@@ -5,26 +5,35 @@ Now with comprehensive configuration support.
 
 import time
 import asyncio
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from services.translation_client import translation_client
+from services.translation_client import translation_client, is_translation_failure
 from services.evidence_fetcher import EvidenceFetcher
 from services.minicheck_client import minicheck_client
 from services.brave_search_client import brave_search_client
+from services.pipeline_timer import PipelineTimer
+from services.normalizer import VietnameseNormalizer
+from services.verdict_cache import VerdictCache
+from services.single_flight import SingleFlight
+from services.deadline import Deadline
 from core.system_config import (
     system_config, evidence_config, logging_config, 
-    performance_config, response_config, error_config
+    performance_config, response_config, error_config, verdict_cache_config
 )
 from api.schemas import Evidence
 
+# Receives (event_name, payload) as pipeline stages complete
+EventCallback = Callable[[str, Dict], None]
+
 class VietnameseFactChecker:
     def __init__(self):
         self.translation_client = translation_client
         self.evidence_fetcher = EvidenceFetcher()
         self.minicheck = minicheck_client
         self.web_search = brave_search_client
+        self.normalizer = VietnameseNormalizer()
         
         # Load configs
         self.evidence_cfg = evidence_config
@@ -32,20 +41,125 @@ class VietnameseFactChecker:
         self.perf_cfg = performance_config
         self.response_cfg = response_config
         self.error_cfg = error_config
+        self.cache_cfg = verdict_cache_config
+        
+        self.verdict_cache = VerdictCache(
+            max_entries=self.cache_cfg.max_entries,
+            ttl=self.cache_cfg.ttl,
+            sqlite_path=self.cache_cfg.sqlite_path
+        )
+        self.single_flight = SingleFlight()
     
-    async def check_claim(self, claim: str) -> Dict:
-        """Main fact-checking method"""
+    async def check_claim(self, claim: str, on_event: Optional[EventCallback] = None) -> Dict:
+        """Main fact-checking method.
+        
+        Served from the verdict cache when possible; concurrent requests for the
+        same canonical claim share one in-flight pipeline run. With `on_event`
+        (streaming) the request runs its own pipeline so it receives every stage
+        event and cancelling it stops the downstream work.
+        """
         start_time = time.time()
+        cache_key = self.normalizer.canonicalize(claim)
+        
+        cached = self._get_cached_verdict(claim, cache_key, start_time)
+        if cached is not None:
+            return cached
+        
+        if on_event is not None:
+            response = await self._run_pipeline(claim, on_event)
+            self._cache_verdict(cache_key, response)
+            return response
+        
+        async def run() -> Dict:
+            response = await self._run_pipeline(claim)
+            self._cache_verdict(cache_key, response)
+            return response
+        
+        response, shared = await self.single_flight.do(cache_key, run)
+        if shared:
+            print(f"[COALESCE] Shared in-flight result for: {claim}")
+            response = {
+                **response,
+                'claim': claim,
+                'processing_time': time.time() - start_time,
+                'coalesced': True
+            }
+        return response
+    
+    def _get_cached_verdict(self, claim: str, cache_key: str, start_time: float) -> Optional[Dict]:
+        """Look up a previous verdict for the canonical claim"""
+        if not self.cache_cfg.enabled:
+            return None
+        cached = self.verdict_cache.get(cache_key)
+        if cached is None:
+            return None
+        print(f"[CACHE] Verdict cache hit for: {claim}")
+        cached.update({
+            'claim': claim,
+            'processing_time': time.time() - start_time,
+            'cache_hit': True
+        })
+        return cached
+    
+    def _cache_verdict(self, cache_key: str, response: Dict):
+        """Cache complete successful verdicts only (errors and partial results are retried)"""
+        if (self.cache_cfg.enabled and response.get('error') is None and response.get('verdict') != 'ERROR'
+                and not response.get('partial')):
+            self.verdict_cache.set(cache_key, response)
+    
+    async def _run_pipeline(self, claim: str, on_event: Optional[EventCallback] = None) -> Dict:
+        """Run search, translation and MiniCheck for one claim.
+        
+        Independent stages overlap: the claim is translated while the search is in
+        flight, page fetches start as soon as URLs are known, and each evidence group
+        is translated and verified as soon as it is ready.
+        
+        The whole run is bounded by a request deadline split into stage budgets. A
+        stage that runs out of budget is dropped and the verdict is built from what
+        finished in time (e.g. snippet-only when page fetches are slow).
+        
+        `on_event` is called with intermediate results as each stage completes.
+        """
+        start_time = time.time()
+        timer = PipelineTimer()
+        deadline = Deadline(min(self.perf_cfg.max_total_time, self.perf_cfg.request_timeout),
+                            stage_reserve=self.perf_cfg.stage_reserve)
+        timed_out: List[str] = []
+        pending: List[asyncio.Task] = []
         
         try:
             print(f"[INFO] Starting fact check for: {claim}")
             
-            # Step 1: Web search for Vietnamese evidence
-            print("[STEP 1] Web search using Brave Search baseline...")
-            search_results = await self.web_search.search_vietnamese(claim)
+            # Step 1: Translate claim in parallel with the web search
+            print("[STEP 1] Web search using Brave Search baseline (claim translation in parallel)...")
+            print(f"   Original Vietnamese claim: {claim}")
+            claim_task = asyncio.ensure_future(self._translate_claim(claim, timer, deadline, timed_out, on_event))
+            pending.append(claim_task)
+            
+            with timer.stage("search"):
+                budget = deadline.budget(stages_after=2)  # evidence translation, MiniCheck
+                search_results = await deadline.run(
+                    "search", self.web_search.search_vietnamese(claim, timeout=budget), budget, timed_out
+                ) or []
             print(f"[OK] Found {len(search_results)} search results")
+            self._emit(on_event, "search_results", {
+                "count": len(search_results),
+                "results": [
+                    {"title": r.get('title', ''), "url": r.get('url', ''), "snippet": r.get('snippet', '')}
+                    for r in search_results
+                ]
+            })
             
             if not search_results:
+                if timed_out:
+                    return self._build_error_response(
+                        claim,
+                        "Hết thời gian xử lý",
+                        "DEADLINE_EXCEEDED",
+                        time.time() - start_time,
+                        partial=True,
+                        timed_out_stages=timed_out
+                    )
                 return self._build_error_response(
                     claim, 
                     "Không tìm thấy bằng chứng", 
@@ -53,146 +167,91 @@ class VietnameseFactChecker:
                     time.time() - start_time
                 )
             
-            # Step 2: Fetch full content (if enabled)
-            print("[STEP 2] Fetching content...")
+            # Step 3: Snippet evidence is ready right away
+            print("[STEP 3] Preparing evidence...")
+            dedup = self.evidence_fetcher.new_dedup_index()
+            snippet_chunks = self.evidence_fetcher.prepare_evidence_chunks(search_results, [], claim, dedup)
+            print(f"[OK] Prepared {len(snippet_chunks)} evidence chunks")
+            
+            # Steps 4-5: Translate and verify each evidence group as it becomes ready
+            print("[STEP 4-5] Translation + MiniCheck per evidence group...")
+            group_tasks = [asyncio.ensure_future(
+                self._verify_group("snippets", "search", snippet_chunks, claim_task, timer, deadline,
+                                   timed_out, on_event)
+            )]
+            pending.extend(group_tasks)
+            
+            # Step 2: Fetch full pages concurrently; each page is verified as soon as it arrives
             if self.evidence_cfg.fetch_full_content:
+                print("[STEP 2] Fetching content (pages verified as they complete)...")
                 urls = [result['url'] for result in search_results[:self.evidence_cfg.max_chunks]]
-                full_contents = await self.evidence_fetcher.fetch_evidence(urls)
-            else:
-                full_contents = [None] * len(search_results)
+                
+                def on_page(index: int, evidence: Dict, ready_stage: str):
+                    content_chunks = self.evidence_fetcher.prepare_content_chunks([evidence], claim, dedup)
+                    if not content_chunks:
+                        return
+                    page_task = asyncio.ensure_future(
+                        self._verify_group(f"page{index}", ready_stage, content_chunks, claim_task, timer,
+                                           deadline, timed_out, on_event)
+                    )
+                    pending.append(page_task)
+                    group_tasks.append(page_task)
+                
+                fetch_task = asyncio.ensure_future(self._fetch_contents(urls, timer, deadline, timed_out, on_page))
+                pending.append(fetch_task)
+                await fetch_task
             
-            # Step 3: Prepare evidence chunks
-            print("[STEP 3] Preparing evidence...")
-            evidence_chunks = self.evidence_fetcher.prepare_evidence_chunks(
-                search_results, full_contents
-            )
-            print(f"[OK] Prepared {len(evidence_chunks)} evidence chunks")
+            groups = [group for group in await asyncio.gather(*group_tasks) if group is not None]
+            english_claim = await claim_task
             
-            # Step 4: Translate claim AND evidence in SINGLE BATCH request (GPU optimized)
-            print("[STEP 4] BATCH translation (single request, GPU optimized)...")
-            print(f"   Original Vietnamese claim: {claim}")
-            vietnamese_texts = [ev['text'] for ev in evidence_chunks]
-            
-            # Combine claim + all evidence for batch translation
-            all_texts_to_translate = [claim] + vietnamese_texts
-            
-            translation_start = time.time()
-            
-            # Use BATCH API - single request for all texts
-            all_translations = self.translation_client.translate_multiple_vi_to_en(all_texts_to_translate)
-            
-            # Split results: first is claim, rest are evidence
-            english_claim = all_translations[0] if all_translations else claim
-            english_evidence = all_translations[1:] if len(all_translations) > 1 else []
-            
-            translation_time = time.time() - translation_start
-            print(f"   [OK] Translated claim: {english_claim}")
-            print(f"   [PERF] Batch translated {len(all_texts_to_translate)} texts in {translation_time:.2f}s")
-            for i, text in enumerate(english_evidence):
-                print(f"   {i+1}. EN: {text[:100]}...")
-            
-            # Store translation debug info
-            translation_debug = {
-                "translation_api": self.translation_client.translation_api_url,
-                "translation_model": "facebook/nllb-200-distilled-600M",
-                "cache_directory": "D:/huggingface_cache",
-                "translation_method": "Baseline Translation System API",
-                "original_claim": claim,
-                "english_claim": english_claim,
-                "vietnamese_evidence": vietnamese_texts,
-                "english_evidence": english_evidence
-            }
+            if not groups and not timed_out:
+                return self._build_error_response(
+                    claim, 
+                    "Không tìm thấy bằng chứng", 
+                    "NO_EVIDENCE", 
+                    time.time() - start_time,
+                    stage_timings=timer.to_dict()
+                )
+            if not groups:
+                # Nothing finished within the deadline: return the search hits only
+                return self._build_error_response(
+                    claim,
+                    "Hết thời gian xử lý",
+                    "DEADLINE_EXCEEDED",
+                    time.time() - start_time,
+                    evidence_chunks=snippet_chunks,
+                    partial=True,
+                    timed_out_stages=timed_out,
+                    stage_timings=timer.to_dict()
+                )
             
-            # Step 5: MiniCheck verification with ALL evidence at once
-            print("[STEP 5] MiniCheck verification with ALL evidence")
+            evidence_chunks = [chunk for group in groups for chunk in group['chunks']]
+            english_evidence = [text for group in groups for text in group['english_evidence']]
             
-            if english_evidence:
-                print(f"[INFO] Testing {len(english_evidence)} evidence items together...")
-                
-                minicheck_start = time.time()
-                
-                # Call MiniCheck ONCE with ALL evidence (correct approach)
-                try:
-                    result = await self.minicheck.verify(english_claim, english_evidence)
-                    minicheck_result = result
-                    
-                    minicheck_time = time.time() - minicheck_start
-                    print(f"   [PERF] MiniCheck completed in {minicheck_time:.2f}s")
-                    
-                    # Show individual scores from raw result
-                    if "raw_result" in result and "all_scores" in result["raw_result"]:
-                        all_scores = result["raw_result"]["all_scores"]
-                        print(f"   [SCORES] Individual evidence results:")
-                        for i, score_info in enumerate(all_scores):
-                            label = score_info.get("label", "N/A")
-                            score = score_info.get("score", 0)
-                            print(f"      {i+1}. {label}: {score:.3f}")
-                    
-                except Exception as e:
-                    print(f"[ERROR] MiniCheck verification failed: {e}")
-                    minicheck_result = {
-                        "label": "ERROR",
-                        "score": 0.0,
-                        "explanation": f"MiniCheck error: {str(e)}",
-                        "processing_time": 0.0
+            # Combine group verdicts with the configured aggregation strategy
+            with timer.stage("aggregate", depends_on=[f"minicheck[{g['name']}]" for g in groups]):
+                if len(groups) == 1:
+                    parsed_result = groups[0]['result']
+                    minicheck_raw = parsed_result.get('raw_result', parsed_result)
+                else:
+                    parsed_result = self.minicheck.aggregate_results([g['result'] for g in groups])
+                    minicheck_raw = {
+                        g['name']: g['result'].get('raw_result', g['result']) for g in groups
                     }
-            else:
-                # No evidence available
-                print("[WARN] No evidence available for MiniCheck verification")
-                minicheck_result = {
-                    "label": "ERROR",
-                    "score": 0.0,
-                    "explanation": "No evidence available for verification",
-                    "processing_time": 0.0
-                }
-            
-            # Parse MiniCheck result to get verdict and confidence
-            # Note: if best_result was found, minicheck_result is already parsed (has 'verdict'/'confidence')
-            # Only call _parse_minicheck_result if it's a raw result (has 'label'/'score')
-            if 'verdict' in minicheck_result:
-                # Already parsed result from verify()
-                parsed_result = minicheck_result
-            else:
-                # Raw result needs parsing
-                parsed_result = self.minicheck._parse_minicheck_result(minicheck_result)
             print(f"[OK] MiniCheck result: {parsed_result['verdict']} ({parsed_result['confidence']:.4f})")
+            if dedup and dedup.duplicates:
+                print(f"[DEDUP] Collapsed {dedup.duplicates} near-duplicate evidence texts")
             
-            # Step 6: Translate rationale back to Vietnamese
-            print("[STEP 6] Translating rationale...")
-            # For now, keep rationale in English since baseline system doesn't support EN->VI
-            vietnamese_rationale = f"[English rationale: {parsed_result['rationale']}]"
-            
-            # Step 7: Build response
+            # Steps 6-7: Rationale and response
             total_time = time.time() - start_time
-            print(f"[TIME] Total time: {total_time:.2f}s")
+            stage_timings = timer.to_dict()
+            print(f"[TIME] Total time: {total_time:.2f}s (critical path: {' -> '.join(stage_timings['critical_path'])})")
             
-            response = {
-                'claim': claim,
-                'verdict': parsed_result['verdict'],
-                'confidence': parsed_result['confidence'],
-                'rationale': vietnamese_rationale,
-                'evidence': [
-                    Evidence(
-                        text=chunk['text'],
-                        url=chunk['url'],
-                        title=chunk['title']
-                    ) for chunk in evidence_chunks
-                ],
-                'evidence_count': len(evidence_chunks),
-                'processing_time': total_time,
-                'method': 'minicheck_web_search',
-                'sources': [chunk['url'] for chunk in evidence_chunks],
-                'error': None,
-                'debug_info': {
-                    'translation': translation_debug,
-                    'minicheck_input': {
-                        'claim': english_claim,
-                        'evidence': english_evidence
-                    },
-                    'minicheck_raw_output': minicheck_result.get('raw_result', minicheck_result),
-                    'minicheck_parsed_output': parsed_result
-                }
-            }
+            response = self._build_response(
+                claim, parsed_result, evidence_chunks, english_claim, english_evidence,
+                minicheck_raw, total_time, stage_timings, timed_out,
+                dedup.duplicates if dedup else 0
+            )
             
             print("[OK] Fact check completed successfully!")
             return response
@@ -207,20 +266,403 @@ class VietnameseFactChecker:
                 "SYSTEM_ERROR",
                 time.time() - start_time
             )
+        finally:
+            for task in pending:
+                if not task.done():
+                    task.cancel()
+    
+    async def check_claims_batch(self, claims: List[str]) -> List[Dict]:
+        """Fact-check many claims with cross-claim batching.
+        
+        Searches (and page fetches) run with bounded concurrency, then the claims and
+        the evidence of all claims are translated together in large /translate_batch
+        calls, and MiniCheck requests run concurrently. Results keep the input order;
+        a claim that fails gets its own error response.
+        """
+        start_time = time.time()
+        results: List[Optional[Dict]] = [None] * len(claims)
+        print(f"[BATCH] Starting batch fact check for {len(claims)} claims")
+        
+        # Serve repeated claims from the verdict cache
+        cache_keys = [self.normalizer.canonicalize(claim) for claim in claims]
+        for i, claim in enumerate(claims):
+            results[i] = self._get_cached_verdict(claim, cache_keys[i], start_time)
+        pending_indices = [i for i, result in enumerate(results) if result is None]
+        
+        # Step 1-3: Search + evidence preparation per claim, bounded concurrency
+        search_semaphore = asyncio.Semaphore(self.perf_cfg.batch_search_concurrency)
+        
+        dedup_counts: Dict[int, int] = {}
+        
+        async def gather_evidence(i: int) -> List[Dict]:
+            claim = claims[i]
+            async with search_semaphore:
+                search_results = await self.web_search.search_vietnamese(claim)
+                if not search_results:
+                    return []
+                dedup = self.evidence_fetcher.new_dedup_index()
+                chunks = self.evidence_fetcher.prepare_evidence_chunks(search_results, [], claim, dedup)
+                if self.evidence_cfg.fetch_full_content:
+                    urls = [result['url'] for result in search_results[:self.evidence_cfg.max_chunks]]
+                    full_contents = await self.evidence_fetcher.fetch_evidence(urls)
+                    chunks.extend(self.evidence_fetcher.prepare_content_chunks(full_contents, claim, dedup))
+                dedup_counts[i] = dedup.duplicates if dedup else 0
+                return chunks
+        
+        gathered = await asyncio.gather(
+            *[gather_evidence(i) for i in pending_indices], return_exceptions=True
+        )
+        evidence_per_claim: Dict[int, List[Dict]] = dict(zip(pending_indices, gathered))
+        
+        active = []
+        for i, chunks in evidence_per_claim.items():
+            claim = claims[i]
+            if isinstance(chunks, BaseException):
+                results[i] = self._build_error_response(
+                    claim, f"Lỗi hệ thống: {str(chunks)}", "SYSTEM_ERROR", time.time() - start_time
+                )
+            elif not chunks:
+                results[i] = self._build_error_response(
+                    claim, "Không tìm thấy bằng chứng", "NO_EVIDENCE", time.time() - start_time
+                )
+            else:
+                active.append(i)
+        print(f"[BATCH] Evidence ready for {len(active)}/{len(pending_indices)} uncached claims "
+              f"({len(claims) - len(pending_indices)} cache hits)")
+        
+        # Step 4: Translate claims + evidence of ALL claims in large batches (unique texts only),
+        # claims and evidence with their own decoding profiles
+        claim_profile = self.translation_client.config.claim_profile
+        evidence_profile = self.translation_client.config.evidence_profile
+        unique_texts: Dict[str, Dict[str, None]] = {}  # profile -> texts in first-seen order
+        for i in active:
+            unique_texts.setdefault(claim_profile, {})[claims[i]] = None
+            for chunk in evidence_per_claim[i]:
+                unique_texts.setdefault(evidence_profile, {})[chunk['text']] = None
+        
+        chunk_size = self.perf_cfg.batch_translation_chunk_size
+        translation_batches = []
+        for profile, profile_texts in unique_texts.items():
+            texts = list(profile_texts)
+            translation_batches += [(profile, texts[j:j + chunk_size]) for j in range(0, len(texts), chunk_size)]
+        translation_start = time.time()
+        translated_batches = await asyncio.gather(
+            *[self.translation_client.translate_multiple_vi_to_en_async(batch, profile=profile)
+              for profile, batch in translation_batches],
+            return_exceptions=True
+        )
+        translations: Dict[Tuple[str, str], str] = {}
+        for (profile, batch), translated in zip(translation_batches, translated_batches):
+            if isinstance(translated, BaseException):
+                continue
+            translations.update(((profile, text), english) for text, english in zip(batch, translated))
+        text_count = sum(len(profile_texts) for profile_texts in unique_texts.values())
+        print(f"[BATCH] Translated {text_count} unique texts in {len(translation_batches)} "
+              f"batch call(s) in {time.time() - translation_start:.2f}s")
+        
+        # Step 5: MiniCheck for ALL claims through /verify_many (pairs of all claims share batches)
+        ready = []
+        for i in active:
+            claim = claims[i]
+            needed = [(claim_profile, claim)] + [(evidence_profile, chunk['text']) for chunk in evidence_per_claim[i]]
+            if any(key not in translations for key in needed):
+                results[i] = self._build_error_response(
+                    claim, "Lỗi dịch thuật", "TRANSLATION_ERROR", time.time() - start_time
+                )
+                self._cache_verdict(cache_keys[i], results[i])
+                continue
+            ready.append((i, translations[needed[0]], [translations[key] for key in needed[1:]]))
+        
+        minicheck_start = time.time()
+        try:
+            verified = await self.minicheck.verify_many(
+                [(english_claim, english_evidence) for _, english_claim, english_evidence in ready],
+                concurrency=self.perf_cfg.batch_minicheck_concurrency
+            )
+        except Exception as e:
+            verified = [e] * len(ready)
+        print(f"[BATCH] MiniCheck scored {sum(len(evidence) for _, _, evidence in ready)} pairs of "
+              f"{len(ready)} claims in {time.time() - minicheck_start:.2f}s")
+        
+        for (i, english_claim, english_evidence), parsed_result in zip(ready, verified):
+            if isinstance(parsed_result, BaseException):
+                result = self._build_error_response(
+                    claims[i], f"Lỗi hệ thống: {str(parsed_result)}", "SYSTEM_ERROR", time.time() - start_time
+                )
+            else:
+                result = self._build_response(
+                    claims[i], parsed_result, evidence_per_claim[i], english_claim, english_evidence,
+                    parsed_result.get('raw_result', parsed_result), time.time() - start_time,
+                    deduplicated_count=dedup_counts.get(i, 0)
+                )
+            results[i] = result
+            self._cache_verdict(cache_keys[i], result)
+        
+        print(f"[BATCH] Completed {len(claims)} claims in {time.time() - start_time:.2f}s")
+        return results
+    
+    async def _translate_claim(self, claim: str, timer: PipelineTimer, deadline: Deadline,
+                               timed_out: List[str], on_event: Optional[EventCallback] = None) -> Optional[str]:
+        """Translate the claim on its own so it can overlap with the search"""
+        with timer.stage("translate_claim"):
+            budget = deadline.budget(stages_after=1)  # MiniCheck
+            translations = await deadline.run(
+                "translate_claim",
+                self.translation_client.translate_multiple_vi_to_en_async(
+                    [claim], timeout=budget, profile=self.translation_client.config.claim_profile
+                ),
+                budget, timed_out
+            )
+        if translations is None:
+            return None
+        english_claim = translations[0] if translations else claim
+        print(f"   [OK] Translated claim: {english_claim}")
+        self._emit(on_event, "translated_claim", {"claim": claim, "english_claim": english_claim})
+        return english_claim
+    
+    async def _fetch_contents(self, urls: List[str], timer: PipelineTimer, deadline: Deadline,
+                              timed_out: List[str],
+                              on_page: Callable[[int, Dict, str], None]) -> int:
+        """Fetch full page contents for the search result URLs, handing each page to
+        `on_page` as soon as it has been extracted. Returns the number of pages fetched."""
+        fetched = 0
+        
+        async def consume():
+            nonlocal fetched
+            async for evidence in self.evidence_fetcher.iter_evidence(urls, timeout=budget):
+                fetched += 1
+                ready_stage = f"fetch[page{fetched}]"
+                timer.record(ready_stage, start, timer.elapsed(), depends_on=["search"])
+                on_page(fetched, evidence, ready_stage)
+        
+        with timer.stage("fetch_content", depends_on=["search"]):
+            start = timer.elapsed()
+            budget = deadline.budget(stages_after=2)  # evidence translation, MiniCheck
+            await deadline.run("fetch_content", consume(), budget, timed_out)
+        print(f"   [OK] Fetched {fetched}/{len(urls)} pages")
+        return fetched
+    
+    async def _verify_group(self, name: str, ready_stage: str, chunks: List[Dict],
+                            claim_task: asyncio.Future, timer: PipelineTimer,
+                            deadline: Deadline, timed_out: List[str],
+                            on_event: Optional[EventCallback] = None) -> Optional[Dict]:
+        """Translate one evidence group and verify it once the claim translation is ready.
+        
+        Returns None when a stage of this group ran out of budget or it has no evidence.
+        """
+        if not chunks:
+            return None
+        vietnamese_texts = [chunk['text'] for chunk in chunks]
+        
+        translation_stage = f"translate_evidence[{name}]"
+        with timer.stage(translation_stage, depends_on=[ready_stage]):
+            budget = deadline.budget(stages_after=1)  # MiniCheck
+            english_evidence = await deadline.run(
+                translation_stage,
+                self.translation_client.translate_multiple_vi_to_en_async(
+                    vietnamese_texts, timeout=budget, profile=self.translation_client.config.evidence_profile
+                ),
+                budget, timed_out
+            )
+        if english_evidence is None:
+            return None
+        print(f"   [PERF] Translated {len(vietnamese_texts)} {name} evidence texts")
+        for i, text in enumerate(english_evidence):
+            print(f"   {i+1}. EN: {text[:100]}...")
+        self._emit(on_event, "translated_evidence", {
+            "group": name,
+            "evidence": [
+                {"url": chunk['url'], "vietnamese": chunk['text'], "english": english}
+                for chunk, english in zip(chunks, english_evidence)
+            ]
+        })
+        
+        english_claim = await claim_task
+        if english_claim is None:
+            return None
+        
+        minicheck_stage = f"minicheck[{name}]"
+        with timer.stage(minicheck_stage, depends_on=[translation_stage, "translate_claim"]):
+            budget = deadline.budget()
+            result = await deadline.run(
+                minicheck_stage, self._run_minicheck(english_claim, english_evidence, timeout=budget),
+                budget, timed_out
+            )
+        if result is None:
+            return None
+        self._emit(on_event, "minicheck_scores", {
+            "group": name,
+            "verdict": result.get('verdict'),
+            "confidence": result.get('confidence'),
+            "scores": result.get('raw_result', {}).get('all_scores', [])
+        })
+        
+        return {
+            'name': name,
+            'chunks': chunks,
+            'english_evidence': english_evidence,
+            'result': result
+        }
+    
+    def _emit(self, on_event: Optional[EventCallback], event: str, data: Dict):
+        """Report an intermediate stage result to a streaming caller"""
+        if on_event is None:
+            return
+        try:
+            on_event(event, data)
+        except Exception as e:
+            print(f"[WARN] Event callback failed for '{event}': {e}")
+    
+    async def _run_minicheck(self, english_claim: str, english_evidence: List[str],
+                             timeout: Optional[float] = None) -> Dict:
+        """MiniCheck verification with ALL evidence of a group at once"""
+        if english_evidence:
+            print(f"[INFO] Testing {len(english_evidence)} evidence items together...")
+            
+            minicheck_start = time.time()
+            
+            # Call MiniCheck ONCE with ALL evidence (correct approach)
+            try:
+                minicheck_result = await self.minicheck.verify(english_claim, english_evidence, timeout=timeout)
+                
+                minicheck_time = time.time() - minicheck_start
+                print(f"   [PERF] MiniCheck completed in {minicheck_time:.2f}s")
+                
+                # Show individual scores from raw result
+                if "raw_result" in minicheck_result and "all_scores" in minicheck_result["raw_result"]:
+                    all_scores = minicheck_result["raw_result"]["all_scores"]
+                    print("   [SCORES] Individual evidence results:")
+                    for i, score_info in enumerate(all_scores):
+                        label = score_info.get("label", "N/A")
+                        score = score_info.get("score", 0)
+                        print(f"      {i+1}. {label}: {score:.3f}")
+                
+            except asyncio.TimeoutError:
+                raise  # Deadline budget exhausted
+            except Exception as e:
+                print(f"[ERROR] MiniCheck verification failed: {e}")
+                minicheck_result = {
+                    "label": "ERROR",
+                    "score": 0.0,
+                    "explanation": f"MiniCheck error: {str(e)}",
+                    "processing_time": 0.0
+                }
+        else:
+            # No evidence available
+            print("[WARN] No evidence available for MiniCheck verification")
+            minicheck_result = {
+                "label": "ERROR",
+                "score": 0.0,
+                "explanation": "No evidence available for verification",
+                "processing_time": 0.0
+            }
+        
+        # Parse MiniCheck result to get verdict and confidence
+        # Note: verify() already returns a parsed result (has 'verdict'/'confidence')
+        # Only call _parse_minicheck_result if it's a raw result (has 'label'/'score')
+        if 'verdict' in minicheck_result:
+            return minicheck_result
+        return self.minicheck._parse_minicheck_result(minicheck_result)
+    
+    def _build_response(self, claim: str, parsed_result: Dict, evidence_chunks: List[Dict],
+                        english_claim: str, english_evidence: List[str], minicheck_raw: Dict,
+                        processing_time: float, stage_timings: Optional[Dict] = None,
+                        timed_out_stages: Optional[List[str]] = None, deduplicated_count: int = 0) -> Dict:
+        """Build successful response (partial when some stages ran out of budget)"""
+        # Store translation debug info
+        translation_debug = {
+            "translation_api": self.translation_client.translation_api_url,
+            "translation_model": "facebook/nllb-200-distilled-600M",
+            "cache_directory": "D:/huggingface_cache",
+            "translation_method": "Baseline Translation System API",
+            "original_claim": claim,
+            "english_claim": english_claim,
+            "vietnamese_evidence": [chunk['text'] for chunk in evidence_chunks],
+            "english_evidence": english_evidence
+        }
+        
+        # Translate rationale back to Vietnamese
+        # For now, keep rationale in English since baseline system doesn't support EN->VI
+        vietnamese_rationale = f"[English rationale: {parsed_result['rationale']}]"
+        error = self._result_error(parsed_result, english_claim, english_evidence)
+        
+        return {
+            'claim': claim,
+            'verdict': 'ERROR' if error else parsed_result['verdict'],
+            'confidence': parsed_result['confidence'],
+            'rationale': vietnamese_rationale,
+            'evidence': [
+                Evidence(
+                    text=chunk['text'],
+                    url=chunk['url'],
+                    title=chunk['title'],
+                    duplicate_urls=chunk.get('duplicate_urls', [])
+                ) for chunk in evidence_chunks
+            ],
+            'evidence_count': len(evidence_chunks),
+            'processing_time': processing_time,
+            'method': 'minicheck_web_search',
+            'sources': self._sources(evidence_chunks),
+            'error': error,
+            'partial': bool(timed_out_stages),
+            'timed_out_stages': timed_out_stages or [],
+            'stage_timings': stage_timings,
+            'deduplicated_count': deduplicated_count,
+            'debug_info': {
+                'translation': translation_debug,
+                'minicheck_input': {
+                    'claim': english_claim,
+                    'evidence': english_evidence
+                },
+                'minicheck_raw_output': minicheck_raw,
+                'minicheck_parsed_output': parsed_result
+            }
+        }
+    
+    @staticmethod
+    def _result_error(parsed_result: Dict, english_claim: str, english_evidence: List[str]) -> Optional[str]:
+        """Error type of a result whose translation or MiniCheck step failed, else None"""
+        if is_translation_failure(english_claim) or (
+                english_evidence and all(is_translation_failure(text) for text in english_evidence)):
+            return "TRANSLATION_ERROR"
+        if parsed_result.get('verdict') == 'ERROR':
+            return "MINICHECK_ERROR"
+        return None
+    
+    @staticmethod
+    def _sources(evidence_chunks: List[Dict]) -> List[str]:
+        """Every source URL of the evidence, including near-duplicate copies, without repeats"""
+        urls = [url for chunk in evidence_chunks for url in [chunk['url']] + chunk.get('duplicate_urls', [])]
+        return list(dict.fromkeys(url for url in urls if url))
     
     def _build_error_response(self, claim: str, 
                             error_message: str, error_type: str, 
-                            processing_time: float) -> Dict:
+                            processing_time: float,
+                            evidence_chunks: Optional[List[Dict]] = None,
+                            partial: bool = False,
+                            timed_out_stages: Optional[List[str]] = None,
+                            stage_timings: Optional[Dict] = None) -> Dict:
         """Build error response"""
+        evidence_chunks = evidence_chunks or []
         return {
             'claim': claim,
             'verdict': 'ERROR',
             'confidence': 0.0,
             'rationale': error_message,
-            'evidence': [],
-            'evidence_count': 0,
+            'evidence': [
+                Evidence(
+                    text=chunk['text'],
+                    url=chunk['url'],
+                    title=chunk['title'],
+                    duplicate_urls=chunk.get('duplicate_urls', [])
+                ) for chunk in evidence_chunks
+            ],
+            'evidence_count': len(evidence_chunks),
             'processing_time': processing_time,
             'method': 'minicheck_web_search',
-            'sources': [],
-            'error': error_type
+            'sources': self._sources(evidence_chunks),
+            'error': error_type,
+            'partial': partial,
+            'timed_out_stages': timed_out_stages or [],
+            'stage_timings': stage_timings
         }
@@ -0,0 +1,175 @@
+"""
+HTML Extractor - Title and main-text extraction for fetched evidence pages
+Plain module-level functions so they can run in a worker process.
+
+Parsers:
+  - "html.parser": BeautifulSoup with the stdlib parser (pure Python)
+  - "lxml":        native lxml.html tree and XPath (much faster; needs lxml)
+"""
+
+import re
+from typing import Dict
+
+from bs4 import BeautifulSoup
+
+try:
+    import lxml.html
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+# Common content containers, tried in order
+CONTENT_SELECTORS = [
+    'article',
+    'main',
+    '.content',
+    '#content',
+    '.post-content',
+    '.entry-content',
+    '.article-content'
+]
+
+
+def _selector_to_xpath(selector: str) -> str:
+    if selector.startswith('.'):
+        return f"//*[contains(concat(' ', normalize-space(@class), ' '), ' {selector[1:]} ')]"
+    if selector.startswith('#'):
+        return f"//*[@id='{selector[1:]}']"
+    return f"//{selector}"
+
+
+CONTENT_XPATHS = [_selector_to_xpath(selector) for selector in CONTENT_SELECTORS]
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def resolve_parser(parser: str) -> str:
+    """Fall back to the stdlib parser when lxml is requested but not installed"""
+    if parser == "lxml" and not LXML_AVAILABLE:
+        return "html.parser"
+    return parser
+
+
+def title_from_url(url: str) -> str:
+    """Readable title from the URL's domain"""
+    try:
+        # Remove protocol and www
+        clean_url = url.replace('https://', '').replace('http://', '').replace('www.', '')
+
+        # Split by / and take first part
+        parts = clean_url.split('/')
+        if parts:
+            domain = parts[0]
+            # Convert domain to readable title
+            return domain.replace('-', ' ').replace('_', ' ').title()
+
+        return "Web Source"
+
+    except Exception:
+        return "Web Source"
+
+
+def clean_text(text: str, max_length: int = 1000) -> str:
+    """Collapse whitespace and limit length"""
+    if not text:
+        return ""
+
+    text = _WHITESPACE.sub(' ', text)
+
+    if len(text) > max_length:
+        text = text[:max_length] + "..."
+
+    return text.strip()
+
+
+def _extract_bs4(html: str, url: str) -> Dict:
+    soup = BeautifulSoup(html, 'html.parser')
+
+    # Remove script and style elements
+    for script in soup(["script", "style"]):
+        script.decompose()
+
+    # Title: <title>, then <h1>, then og:title
+    title = ""
+    for tag in (soup.find('title'), soup.find('h1')):
+        if tag:
+            title = tag.get_text().strip()
+            if title:
+                break
+    if not title:
+        meta_title = soup.find('meta', property='og:title')
+        if meta_title:
+            title = meta_title.get('content', '').strip()
+
+    content = None
+    for selector in CONTENT_SELECTORS:
+        content_element = soup.select_one(selector)
+        if content_element:
+            content = content_element.get_text()
+            break
+    if content is None:
+        body = soup.find('body')
+        content = body.get_text() if body else soup.get_text()
+
+    return {"title": title, "content": content}
+
+
+def _extract_lxml(html: str, url: str) -> Dict:
+    tree = lxml.html.document_fromstring(html)
+
+    # Remove script and style elements
+    for element in tree.xpath('//script | //style'):
+        element.drop_tree()
+
+    title = ""
+    for path in ('//title', '//h1'):
+        found = tree.xpath(path)
+        if found:
+            title = found[0].text_content().strip()
+            if title:
+                break
+    if not title:
+        found = tree.xpath("//meta[@property='og:title']/@content")
+        if found:
+            title = found[0].strip()
+
+    content = None
+    for path in CONTENT_XPATHS:
+        found = tree.xpath(path)
+        if found:
+            content = found[0].text_content()
+            break
+    if content is None:
+        body = tree.find('body')
+        content = body.text_content() if body is not None else tree.text_content()
+
+    return {"title": title, "content": content}
+
+
+def extract_page(html: str, url: str, parser: str = "html.parser", max_length: int = 1000) -> Dict:
+    """Extract title and cleaned main text from a page.
+
+    Returns an evidence dict with source "web_fetch", or source "error" when the
+    page could not be parsed.
+    """
+    try:
+        if resolve_parser(parser) == "lxml":
+            extracted = _extract_lxml(html, url)
+        else:
+            extracted = _extract_bs4(html, url)
+
+        return {
+            "title": extracted["title"] or title_from_url(url),
+            "url": url,
+            "content": clean_text(extracted["content"], max_length),
+            "source": "web_fetch"
+        }
+
+    except Exception as e:
+        print(f"Error extracting content from {url}: {e}")
+        return {
+            "title": title_from_url(url),
+            "url": url,
+            "content": f"Error extracting content from {url}",
+            "source": "error"
+        }
@@ -0,0 +1,89 @@
+"""
+HTTP Session Manager - Shared pooled aiohttp sessions for all downstream clients
+One keep-alive session per downstream, closed once on app shutdown.
+"""
+
+import aiohttp
+import asyncio
+from typing import Dict
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.system_config import performance_config
+
+
+class HTTPSessionManager:
+    """Owns one pooled aiohttp session per downstream and tracks connection reuse"""
+
+    def __init__(self):
+        self.perf_config = performance_config
+        self._sessions: Dict[str, aiohttp.ClientSession] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def get_session(self, name: str, limit: int = 100, limit_per_host: int = 0,
+                    keepalive_timeout: float = 30) -> aiohttp.ClientSession:
+        """Get the shared session for a downstream, creating it on first use"""
+        session = self._sessions.get(name)
+        if session is not None and not session.closed:
+            return session
+
+        connector = aiohttp.TCPConnector(
+            limit=limit,
+            limit_per_host=limit_per_host,
+            keepalive_timeout=keepalive_timeout,
+            use_dns_cache=True,
+            ttl_dns_cache=self.perf_config.dns_cache_ttl
+        )
+        session = aiohttp.ClientSession(
+            connector=connector,
+            trace_configs=[self._build_trace_config(name)]
+        )
+        self._sessions[name] = session
+        return session
+
+    def _build_trace_config(self, name: str) -> aiohttp.TraceConfig:
+        """Count requests, new and reused connections and DNS cache hits for a downstream"""
+        stats = self._stats.setdefault(name, {
+            "requests": 0,
+            "new_connections": 0,
+            "reused_connections": 0,
+            "dns_cache_hits": 0,
+            "dns_cache_misses": 0
+        })
+
+        def counter(key: str):
+            async def on_event(session, trace_config_ctx, params):
+                stats[key] += 1
+            return on_event
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(counter("requests"))
+        trace_config.on_connection_create_end.append(counter("new_connections"))
+        trace_config.on_connection_reuseconn.append(counter("reused_connections"))
+        trace_config.on_dns_cache_hit.append(counter("dns_cache_hits"))
+        trace_config.on_dns_cache_miss.append(counter("dns_cache_misses"))
+        return trace_config
+
+    def get_stats(self) -> Dict:
+        """Per-downstream connection reuse statistics"""
+        result = {}
+        for name, stats in self._stats.items():
+            connections = stats["new_connections"] + stats["reused_connections"]
+            session = self._sessions.get(name)
+            result[name] = {
+                **stats,
+                "reuse_rate": stats["reused_connections"] / connections if connections else 0.0,
+                "open": session is not None and not session.closed
+            }
+        return result
+
+    async def close(self):
+        """Close every session (called from the app lifespan on shutdown)"""
+        sessions = [s for s in self._sessions.values() if not s.closed]
+        self._sessions.clear()
+        if sessions:
+            await asyncio.gather(*[s.close() for s in sessions], return_exceptions=True)
+
+# Singleton instance
+http_session_manager = HTTPSessionManager()
@@ -1,17 +1,21 @@
 """
 MiniCheck Client - Uses MiniCheck Baseline API
 Now with configurable thresholds and aggregation strategies.
+Pair scores already seen are served from a bounded cache; only uncached pairs are sent.
+With early_exit under the "best" strategy, scoring stops once the verdict is fixed.
 """
 
 import aiohttp
 import asyncio
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import json
 import sys
 import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from core.system_config import minicheck_config, logging_config
+from services.http_session import http_session_manager
+from services.score_cache import ScoreCache
 
 class MiniCheckClient:
     """Client for MiniCheck Baseline API with configurable thresholds"""
@@ -20,45 +24,188 @@ class MiniCheckClient:
         self.config = minicheck_config
         self.log_config = logging_config
         self.api_url = f"{self.config.api_url}{self.config.verify_endpoint}"
+        self.verify_many_url = f"{self.config.api_url}{self.config.verify_many_endpoint}"
         self.health_check_url = f"{self.config.api_url}/"
         self.timeout = float(self.config.timeout)
+        self._score_cache: Optional[ScoreCache] = None
         
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared pooled keep-alive session for this service"""
+        return http_session_manager.get_session(
+            "minicheck",
+            limit=self.config.connection_limit,
+            limit_per_host=self.config.connection_limit,
+            keepalive_timeout=self.config.keepalive_timeout
+        )
+    
+    def _effective_timeout(self, timeout: Optional[float]) -> float:
+        return self.timeout if timeout is None else min(self.timeout, timeout)
+    
+    def _get_score_cache(self) -> Optional[ScoreCache]:
+        """The pair score cache, or None when caching is disabled"""
+        if not self.config.cache_scores:
+            return None
+        if self._score_cache is None:
+            self._score_cache = ScoreCache(
+                max_entries=self.config.score_cache_max_entries,
+                ttl=self.config.score_cache_ttl
+            )
+        return self._score_cache
+    
+    def _lookup_scores(self, claim: str, evidence: List[str]) -> Dict[int, float]:
+        """Cached scores of the claim's evidence as {position: score}"""
+        cache = self._get_score_cache()
+        if cache is None or not evidence:
+            return {}
+        return cache.get_many(self.config.model_name, claim, evidence)
+    
+    def _early_exit_enabled(self) -> bool:
+        """Early exit only applies to max ("best") aggregation"""
+        return self.config.early_exit and self.config.aggregation_strategy == "best"
+    
+    def _verdict_fixed(self, cached: Dict[int, float]) -> bool:
+        """A cached score at the support threshold fixes the "best" verdict"""
+        return self._early_exit_enabled() and any(
+            score >= self.config.threshold_supported for score in cached.values()
+        )
+    
+    def _request_item(self, claim: str, evidence: List[str]) -> Dict:
+        item = {"claim": claim, "evidence": evidence}
+        if self._early_exit_enabled():
+            item.update(
+                early_exit=True,
+                early_exit_threshold=self.config.threshold_supported,
+                early_exit_batch_size=self.config.early_exit_batch_size
+            )
+        return item
+    
+    def _store_scores(self, claim: str, evidence: List[str], positions: List[int], fresh: Dict):
+        """Cache the scores of a server result computed for evidence[positions]"""
+        cache = self._get_score_cache()
+        if cache is None:
+            return
+        cache.put_many(self.config.model_name, claim, {
+            evidence[positions[entry["evidence_index"]]]: entry["score"] for entry in fresh.get("all_scores", [])
+        })
+    
+    def _merge_scores(self, claim: str, evidence: List[str], cached: Dict[int, float],
+                      missing: List[int], fresh: Optional[Dict]) -> Dict:
+        """Server-shaped result for all evidence: fresh scores of the `missing`
+        positions merged with the cached ones, each in its original position
+        
+        With early exit, evidence left unscored is counted in `pairs_skipped`.
+        """
+        all_scores: List[Optional[Dict]] = [None] * len(evidence)
+        for i, score in cached.items():
+            all_scores[i] = {
+                "evidence_index": i,
+                "evidence_preview": evidence[i][:100],
+                "label": "SUPPORTED" if score >= self.config.threshold_supported else "REFUTED",
+                "score": score,
+                "cached": True
+            }
+        
+        for entry in (fresh or {}).get("all_scores", []):
+            i = missing[entry["evidence_index"]]
+            all_scores[i] = {**entry, "evidence_index": i}
+        
+        skipped = sum(entry is None for entry in all_scores)
+        all_scores = [entry for entry in all_scores if entry is not None]
+        if not all_scores or (skipped and not self._early_exit_enabled()):
+            return {"label": "ERROR", "score": 0.0, "explanation": "MiniCheck returned incomplete scores"}
+        
+        scores = [entry["score"] for entry in all_scores]
+        best = max(scores)
+        avg = sum(scores) / len(scores)
+        label = "SUPPORTED" if best >= self.config.threshold_supported else "REFUTED"
+        return {
+            **(fresh or {"model": self.config.model_name, "processing_time": 0.0}),
+            "label": label,
+            "score": best,
+            "avg_score": avg,
+            "explanation": f"MiniCheck verified {len(scores)} evidence(s) ({len(cached)} cached"
+                           + (f", {skipped} skipped by early exit" if skipped else "") + "). "
+                           f"Best score: {best:.3f} ({label}), Avg score: {avg:.3f}",
+            "all_scores": all_scores,
+            "evidence_count": len(evidence),
+            "cached_pairs": len(cached),
+            "pairs_scored": len(scores) - len(cached),
+            "pairs_skipped": skipped
+        }
+    
+    def get_cache_stats(self) -> Optional[Dict]:
+        """Pair score cache statistics, or None when caching is disabled"""
+        cache = self._get_score_cache()
+        return cache.get_stats() if cache is not None else None
+    
     async def check_health(self) -> bool:
         """Check if MiniCheck baseline is running"""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.health_check_url, timeout=5) as response:
-                    return response.status == 200
+            session = self._get_session()
+            async with session.get(self.health_check_url, timeout=aiohttp.ClientTimeout(total=5)) as response:
+                return response.status == 200
         except:
             return False
     
-    async def verify(self, claim: str, evidence: List[str]) -> Dict:
-        """Verify claim using MiniCheck baseline API"""
+    async def verify(self, claim: str, evidence: List[str], timeout: Optional[float] = None) -> Dict:
+        """Verify claim using MiniCheck baseline API
+        
+        `timeout` (seconds) caps the configured timeout, e.g. with a deadline budget.
+        Only evidence without a cached score is sent to the server, none at all
+        when a cached score already fixes the early-exit verdict.
+        """
+        cached = self._lookup_scores(claim, evidence)
+        if not cached:
+            result = await self._verify_remote(claim, evidence, timeout)
+            if "raw_result" in result:
+                self._store_scores(claim, evidence, list(range(len(evidence))), result["raw_result"])
+            return result
+        
+        missing = [i for i in range(len(evidence)) if i not in cached]
+        fresh = None
+        if missing and not self._verdict_fixed(cached):
+            result = await self._verify_remote(claim, [evidence[i] for i in missing], timeout)
+            if "raw_result" not in result:
+                return result
+            fresh = result["raw_result"]
+            self._store_scores(claim, evidence, missing, fresh)
+        if self.log_config.log_minicheck_all_scores:
+            print(f"      [CACHE] {len(cached)}/{len(evidence)} MiniCheck scores from cache")
+        return self._parse_minicheck_result(self._merge_scores(claim, evidence, cached, missing, fresh))
+    
+    async def _verify_remote(self, claim: str, evidence: List[str], timeout: Optional[float] = None) -> Dict:
+        """POST /verify; parsed result with the server response in `raw_result`"""
         try:
-            request_data = {
-                "claim": claim,
-                "evidence": evidence
-            }
+            request_data = self._request_item(claim, evidence)
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.api_url,
-                    json=request_data,
-                    timeout=aiohttp.ClientTimeout(total=self.timeout)
-                ) as response:
+            session = self._get_session()
+            async with session.post(
+                self.api_url,
+                json=request_data,
+                timeout=aiohttp.ClientTimeout(total=self._effective_timeout(timeout))
+            ) as response:
+                
+                if response.status == 200:
+                    result = await response.json()
+                    return self._parse_minicheck_result(result)
+                else:
+                    error_text = await response.text()
+                    return {
+                        "verdict": "ERROR",
+                        "confidence": 0.0,
+                        "rationale": f"API error: {response.status} - {error_text}",
+                        "processing_time": 0.0
+                    }
                     
-                    if response.status == 200:
-                        result = await response.json()
-                        return self._parse_minicheck_result(result)
-                    else:
-                        error_text = await response.text()
-                        return {
-                            "verdict": "ERROR",
-                            "confidence": 0.0,
-                            "rationale": f"API error: {response.status} - {error_text}",
-                            "processing_time": 0.0
-                        }
-                        
+        except asyncio.TimeoutError:
+            if timeout is not None:
+                raise  # Deadline budget exhausted: the caller builds a partial result
+            return {
+                "verdict": "ERROR",
+                "confidence": 0.0,
+                "rationale": f"Timeout after {self.timeout}s",
+                "processing_time": 0.0
+            }
         except aiohttp.ClientError as e:
             return {
                 "verdict": "ERROR",
@@ -74,6 +221,114 @@ class MiniCheckClient:
                 "processing_time": 0.0
             }
     
+    def _chunk_items(self, items: List[Tuple[str, List[str]]]) -> List[List[int]]:
+        """Group item indices into requests of at most verify_many_max_pairs pairs"""
+        chunks: List[List[int]] = []
+        pairs = 0
+        for i, (_, evidence) in enumerate(items):
+            if chunks and pairs + len(evidence) <= self.config.verify_many_max_pairs:
+                chunks[-1].append(i)
+                pairs += len(evidence)
+            else:
+                chunks.append([i])
+                pairs = len(evidence)
+        return chunks
+    
+    async def verify_many(self, items: List[Tuple[str, List[str]]], timeout: Optional[float] = None,
+                          concurrency: int = 4) -> List[Dict]:
+        """Verify many claims, each with its own evidence list, through /verify_many
+        
+        Returns one parsed result per item, in order; `raw_result` holds the
+        server's per-claim result with the raw per-pair scores in `all_scores`.
+        Only pairs without a cached score are sent; claims whose pairs are all
+        cached, or whose early-exit verdict a cached score fixes, are answered locally.
+        """
+        if not items:
+            return []
+        
+        cached = [self._lookup_scores(claim, evidence) for claim, evidence in items]
+        missing = [[i for i in range(len(evidence)) if i not in found] for (_, evidence), found in zip(items, cached)]
+        to_send = [k for k, (_, evidence) in enumerate(items)
+                   if (missing[k] and not self._verdict_fixed(cached[k])) or not evidence]
+        fresh = await self._verify_many_remote(
+            [(items[k][0], [items[k][1][i] for i in missing[k]]) for k in to_send], timeout, concurrency
+        )
+        
+        sent = dict(zip(to_send, fresh))
+        results: List[Dict] = []
+        for k, (claim, evidence) in enumerate(items):
+            result = sent.get(k)
+            if result is not None:
+                if "raw_result" not in result or not evidence:
+                    results.append(result)  # error, or no evidence to score
+                    continue
+                self._store_scores(claim, evidence, missing[k], result["raw_result"])
+                if not cached[k]:
+                    results.append(result)
+                    continue
+            raw = result["raw_result"] if result is not None else None
+            results.append(self._parse_minicheck_result(self._merge_scores(claim, evidence, cached[k], missing[k], raw)))
+        
+        hits = sum(len(found) for found in cached)
+        if hits and self.log_config.log_minicheck_all_scores:
+            print(f"      [CACHE] {hits}/{sum(len(e) for _, e in items)} MiniCheck scores from cache")
+        return results
+    
+    async def _verify_many_remote(self, items: List[Tuple[str, List[str]]], timeout: Optional[float],
+                                  concurrency: int) -> List[Dict]:
+        """POST /verify_many in requests of at most verify_many_max_pairs pairs, `concurrency` at a time
+        
+        Falls back to one /verify call per claim when the server has no /verify_many.
+        """
+        if not items:
+            return []
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def send(indices: List[int]) -> List[Dict]:
+            chunk = [items[i] for i in indices]
+            async with semaphore:
+                try:
+                    session = self._get_session()
+                    async with session.post(
+                        self.verify_many_url,
+                        json={"items": [self._request_item(claim, evidence) for claim, evidence in chunk]},
+                        timeout=aiohttp.ClientTimeout(total=self._effective_timeout(timeout))
+                    ) as response:
+                        if response.status == 200:
+                            result = await response.json()
+                            return [self._parse_minicheck_result(r) for r in result.get("results", [])]
+                        if response.status != 404:
+                            error = f"API error: {response.status} - {await response.text()}"
+                            return [self._error_result(error) for _ in chunk]
+                except asyncio.TimeoutError:
+                    if timeout is not None:
+                        raise  # Deadline budget exhausted
+                    return [self._error_result(f"Timeout after {self.timeout}s") for _ in chunk]
+                except aiohttp.ClientError as e:
+                    return [self._error_result(f"Network error: {str(e)}") for _ in chunk]
+            
+            # Older server without /verify_many
+            return list(await asyncio.gather(*[self._verify_remote(claim, evidence, timeout) for claim, evidence in chunk]))
+        
+        chunks = self._chunk_items(items)
+        responses = await asyncio.gather(*[send(indices) for indices in chunks])
+        
+        results: List[Dict] = [None] * len(items)
+        for indices, parsed in zip(chunks, responses):
+            for i, result in zip(indices, parsed):
+                results[i] = result
+        return [r if r is not None else self._error_result("Missing result") for r in results]
+    
+    @staticmethod
+    def _error_result(rationale: str) -> Dict:
+        return {
+            "verdict": "ERROR",
+            "confidence": 0.0,
+            "rationale": rationale,
+            "processing_time": 0.0
+        }
+    
     def _parse_minicheck_result(self, result: Dict) -> Dict:
         """Parse MiniCheck result with configurable thresholds"""
         label = result.get("label", "ERROR")
@@ -198,6 +453,7 @@ class MiniCheckClient:
             "threshold_supported": self.config.threshold_supported,
             "threshold_refuted": self.config.threshold_refuted,
             "aggregation_strategy": self.config.aggregation_strategy,
+            "early_exit": self._early_exit_enabled(),
             "min_evidence_confidence": self.config.min_evidence_confidence,
             "model": self.config.model_name
         }
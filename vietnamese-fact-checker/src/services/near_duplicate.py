@@ -0,0 +1,81 @@
+"""
+Near-Duplicate Detector - Collapse syndicated copies of the same evidence text
+Syllable shingles + MinHash signatures; two texts are near-duplicates when their
+estimated Jaccard similarity reaches the threshold. One index lives for one
+request so evidence already sent for translation is never sent again.
+"""
+
+import hashlib
+import random
+from typing import Dict, List, Optional, Tuple
+
+from services.passage_selector import syllables
+
+_MERSENNE_PRIME = (1 << 61) - 1
+
+
+class NearDuplicateIndex:
+    """MinHash index of the evidence chunks kept so far in a request"""
+
+    def __init__(self, threshold: float = 0.8, num_perm: int = 64, shingle_size: int = 3, seed: int = 1):
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        rng = random.Random(seed)
+        self._perms = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME)) for _ in range(num_perm)
+        ]
+        self._entries: List[Tuple[List[int], Dict]] = []
+        self.duplicates = 0
+
+    def _shingles(self, text: str) -> set:
+        tokens = syllables(text)
+        k = self.shingle_size
+        if len(tokens) <= k:
+            return {" ".join(tokens)}
+        return {" ".join(tokens[i:i + k]) for i in range(len(tokens) - k + 1)}
+
+    def signature(self, text: str) -> List[int]:
+        hashes = [
+            int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+            for shingle in self._shingles(text)
+        ]
+        return [min((a * h + b) % _MERSENNE_PRIME for h in hashes) for a, b in self._perms]
+
+    @staticmethod
+    def similarity(sig_a: List[int], sig_b: List[int]) -> float:
+        """Estimated Jaccard similarity of two signatures"""
+        return sum(1 for x, y in zip(sig_a, sig_b) if x == y) / len(sig_a)
+
+    def _find(self, signature: List[int], entries: List[Tuple[List[int], Dict]]) -> Optional[Dict]:
+        for other, chunk in entries:
+            if self.similarity(signature, other) >= self.threshold:
+                return chunk
+        return None
+
+    @staticmethod
+    def _merge_source(kept: Dict, duplicate: Dict):
+        """Record the duplicate's URL(s) on the chunk that is kept"""
+        urls = [duplicate.get('url', '')] + duplicate.get('duplicate_urls', [])
+        known = {kept.get('url', '')} | set(kept.get('duplicate_urls', []))
+        new_urls = [url for url in urls if url and url not in known]
+        if new_urls:
+            kept['duplicate_urls'] = kept.get('duplicate_urls', []) + new_urls
+
+    def collapse(self, chunks: List[Dict]) -> List[Dict]:
+        """Drop chunks that near-duplicate an earlier chunk in the list or one already
+        indexed; their URLs are merged into the chunk that is kept."""
+        survivors: List[Tuple[List[int], Dict]] = []
+        for chunk in chunks:
+            signature = self.signature(chunk['text'])
+            kept = self._find(signature, self._entries) or self._find(signature, survivors)
+            if kept is not None:
+                self._merge_source(kept, chunk)
+                self.duplicates += 1
+            else:
+                survivors.append((signature, chunk))
+        return [chunk for _, chunk in survivors]
+
+    def add(self, chunks: List[Dict]):
+        """Index chunks that are being sent on, so later groups are checked against them"""
+        for chunk in chunks:
+            self._entries.append((self.signature(chunk['text']), chunk))
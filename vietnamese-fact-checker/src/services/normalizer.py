@@ -1,4 +1,5 @@
 import re
+import unicodedata
 from typing import List
 
 class VietnameseNormalizer:
@@ -6,6 +7,8 @@ class VietnameseNormalizer:
         # Pre-compiled patterns for speed
         self.whitespace_pattern = re.compile(r'\s+')
         self.punctuation_pattern = re.compile(r'[^\w\s]')
+        # Sentence punctuation and quotes only: %, signs and currency symbols change the claim
+        self.edge_punctuation_pattern = re.compile(r'^[\s.,!?…;:"\'“”‘’()\[\]]+|[\s.,!?…;:"\'“”‘’()\[\]]+$')
         
     def normalize(self, text: str) -> str:
         """Fast Vietnamese text normalization"""
@@ -20,6 +23,18 @@ class VietnameseNormalizer:
         
         return text
     
+    def canonicalize(self, text: str) -> str:
+        """Canonical claim form for cache keys: NFC, casefolded, whitespace collapsed
+        
+        Diacritics, inner punctuation (e.g. "1.5" vs "1,5"), %, signs and currency
+        symbols are kept: they change the meaning of a claim. Only sentence
+        punctuation and quotes at the start and end are dropped.
+        """
+        # Composed and decomposed Vietnamese diacritics must map to the same key
+        text = unicodedata.normalize('NFC', unicodedata.normalize('NFC', text).casefold())
+        text = self.whitespace_pattern.sub(' ', text).strip()
+        return self.edge_punctuation_pattern.sub('', text)
+    
     def _normalize_vietnamese_chars(self, text: str) -> str:
         """Normalize Vietnamese characters (basic version)"""
         # Handle common Vietnamese character variations
@@ -0,0 +1,163 @@
+"""
+Passage Selector - Claim-aware selection of evidence passages before translation
+Splits Vietnamese text into sentence-aligned passages and ranks them against the
+claim with BM25 over syllable unigrams and bigrams (Vietnamese words are mostly
+one or two syllables). Token counts are syllable counts.
+"""
+
+import math
+import re
+import unicodedata
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+# Abbreviations whose trailing period does not end a sentence
+ABBREVIATIONS = {
+    "tp", "tt", "ts", "ths", "pgs", "gs", "bs", "ks", "ls", "q", "p", "tx", "h", "ng", "st", "mr", "mrs", "dr"
+}
+
+# Sentence end: . ! ? … (optionally followed by closing quotes/brackets) then whitespace
+_SENTENCE_END = re.compile(r'([.!?…]+["”’)\]]*)\s+')
+_SYLLABLE = re.compile(r'\w+')
+
+
+def syllables(text: str) -> List[str]:
+    """Lowercased syllables of a text (NFC so tone marks are single code points)"""
+    return _SYLLABLE.findall(unicodedata.normalize('NFC', text).lower())
+
+
+def count_tokens(text: str) -> int:
+    return len(syllables(text))
+
+
+def _terms(tokens: List[str]) -> List[str]:
+    """Syllable unigrams plus bigrams"""
+    return tokens + [f"{a}_{b}" for a, b in zip(tokens, tokens[1:])]
+
+
+def split_sentences(text: str) -> List[str]:
+    """Split Vietnamese text into sentences, keeping abbreviations like "TP." intact"""
+    sentences = []
+    start = 0
+    for match in _SENTENCE_END.finditer(text):
+        end = match.end(1)
+        last_word = text[start:match.start(1)].rsplit(None, 1)[-1:] or [""]
+        if match.group(1) == "." and last_word[0].lower() in ABBREVIATIONS:
+            continue
+        # Only split when the next sentence starts like one (capital letter, digit or quote)
+        following = text[match.end():match.end() + 1]
+        if following and not (following.isupper() or following.isdigit() or following in '"“‘('):
+            continue
+        sentence = text[start:end].strip()
+        if sentence:
+            sentences.append(sentence)
+        start = match.end()
+    tail = text[start:].strip()
+    if tail:
+        sentences.append(tail)
+    return sentences
+
+
+def split_passages(text: str, max_tokens: int = 64) -> List[str]:
+    """Group consecutive sentences into passages of at most `max_tokens` syllables.
+
+    A single sentence longer than the limit is cut into windows of `max_tokens` words.
+    """
+    passages = []
+    current: List[str] = []
+    current_tokens = 0
+
+    for sentence in split_sentences(text):
+        tokens = count_tokens(sentence)
+        if current and current_tokens + tokens > max_tokens:
+            passages.append(" ".join(current))
+            current, current_tokens = [], 0
+        if tokens > max_tokens:
+            words = sentence.split()
+            for i in range(0, len(words), max_tokens):
+                passages.append(" ".join(words[i:i + max_tokens]))
+            continue
+        current.append(sentence)
+        current_tokens += tokens
+
+    if current:
+        passages.append(" ".join(current))
+    return passages
+
+
+def bm25_scores(query: str, documents: List[str], k1: float = 1.5, b: float = 0.75) -> List[float]:
+    """BM25 score of each document for the query; IDF is computed over `documents`"""
+    doc_terms = [Counter(_terms(syllables(doc))) for doc in documents]
+    if not doc_terms:
+        return []
+    lengths = [sum(terms.values()) for terms in doc_terms]
+    avg_length = sum(lengths) / len(lengths) or 1.0
+    n_docs = len(doc_terms)
+
+    query_terms = set(_terms(syllables(query)))
+    idf = {}
+    for term in query_terms:
+        df = sum(1 for terms in doc_terms if term in terms)
+        idf[term] = math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+
+    scores = []
+    for terms, length in zip(doc_terms, lengths):
+        score = 0.0
+        for term in query_terms:
+            tf = terms.get(term, 0)
+            if tf:
+                score += idf[term] * tf * (k1 + 1) / (tf + k1 * (1 - b + b * length / avg_length))
+        scores.append(score)
+    return scores
+
+
+def select_passages(claim: str, passages: List[str], top_k: int, token_budget: int,
+                    sources: Optional[List[str]] = None) -> List[Tuple[int, float]]:
+    """Indices and scores of the best passages for the claim, best first.
+
+    Passages that share no term with the claim (score 0) are never selected.
+    Passages are taken in score order (ties keep document order) until `top_k`
+    are chosen, skipping any that would exceed `token_budget` (the best passage
+    is always kept). With `sources` (e.g. the URL of each passage) the best
+    passage of each source is taken first, so one long page cannot crowd out
+    the others; the same `top_k` and `token_budget` bound these picks, so the
+    lowest-scoring sources are dropped once either is reached.
+    """
+    scores = bm25_scores(claim, passages)
+    ranked = [i for i in sorted(range(len(passages)), key=lambda i: (-scores[i], i)) if scores[i] > 0]
+
+    selected = []
+    used = 0
+
+    def take(candidates):
+        nonlocal used
+        for i in candidates:
+            if len(selected) >= top_k:
+                break
+            if i in selected:
+                continue
+            tokens = count_tokens(passages[i])
+            if selected and used + tokens > token_budget:
+                continue
+            selected.append(i)
+            used += tokens
+
+    if sources is not None:
+        best_of_source = {}
+        for i in ranked:
+            best_of_source.setdefault(sources[i], i)
+        take(best_of_source.values())
+    take(ranked)
+    selected.sort(key=lambda i: (-scores[i], i))
+    return [(i, scores[i]) for i in selected]
+
+
+def selection_stats(passages: List[str], selected: List[Tuple[int, float]]) -> Dict:
+    input_tokens = sum(count_tokens(p) for p in passages)
+    selected_tokens = sum(count_tokens(passages[i]) for i, _ in selected)
+    return {
+        "passages": len(passages),
+        "selected": len(selected),
+        "input_tokens": input_tokens,
+        "selected_tokens": selected_tokens
+    }
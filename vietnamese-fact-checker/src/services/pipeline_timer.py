@@ -0,0 +1,73 @@
+"""
+Pipeline Timer - Per-stage wall time and critical path of a fact-check run
+Stages may overlap; each stage declares the stages it waited on.
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+
+class PipelineTimer:
+    """Records stage start/end offsets relative to the start of a request"""
+
+    def __init__(self):
+        self._t0 = time.perf_counter()
+        self.stages: Dict[str, Dict] = {}
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self._t0
+
+    @contextmanager
+    def stage(self, name: str, depends_on: Optional[List[str]] = None):
+        """Time a stage; `depends_on` lists the stages whose output it needed"""
+        start = self.elapsed()
+        try:
+            yield
+        finally:
+            self.stages[name] = {
+                "start": start,
+                "end": self.elapsed(),
+                "depends_on": [d for d in (depends_on or []) if d]
+            }
+
+    def record(self, name: str, start: float, end: float, depends_on: Optional[List[str]] = None):
+        """Record a stage whose offsets were measured elsewhere (e.g. one page of a fetch)"""
+        self.stages[name] = {
+            "start": start,
+            "end": end,
+            "depends_on": [d for d in (depends_on or []) if d]
+        }
+
+    def critical_path(self) -> List[str]:
+        """Chain of stages that determined the total latency.
+
+        Starts from the stage that finished last and walks back through the
+        dependency that finished last at each step.
+        """
+        if not self.stages:
+            return []
+        current = max(self.stages, key=lambda n: self.stages[n]["end"])
+        path = [current]
+        while True:
+            deps = [d for d in self.stages[current]["depends_on"] if d in self.stages]
+            if not deps:
+                break
+            current = max(deps, key=lambda n: self.stages[n]["end"])
+            path.append(current)
+        return list(reversed(path))
+
+    def to_dict(self) -> Dict:
+        return {
+            "stages": {
+                name: {
+                    "start": round(info["start"], 4),
+                    "end": round(info["end"], 4),
+                    "duration": round(info["end"] - info["start"], 4),
+                    "depends_on": info["depends_on"]
+                }
+                for name, info in sorted(self.stages.items(), key=lambda kv: kv[1]["start"])
+            },
+            "critical_path": self.critical_path(),
+            "total_time": round(self.elapsed(), 4)
+        }
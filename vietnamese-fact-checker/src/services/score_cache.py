@@ -0,0 +1,71 @@
+"""
+Score Cache - bounded LRU + TTL cache of MiniCheck pair scores
+Keyed by sha256 of (model, claim, evidence) so rechecked claims and recurring
+top results are not scored again.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Dict, List, Tuple
+
+
+def score_key(model: str, claim: str, evidence: str) -> str:
+    return hashlib.sha256(f"{model}\0{claim}\0{evidence}".encode("utf-8")).hexdigest()
+
+
+class ScoreCache:
+    """In-memory LRU of support probabilities with TTL expiry"""
+
+    def __init__(self, max_entries: int = 50000, ttl: float = 86400):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_many(self, model: str, claim: str, evidence: List[str]) -> Dict[int, float]:
+        """Cached scores of the claim against each evidence text, as {position: score}"""
+        found: Dict[int, float] = {}
+        now = time.time()
+        for i, text in enumerate(evidence):
+            key = score_key(model, claim, text)
+            entry = self._entries.get(key)
+            if entry is not None and now - entry[0] >= self.ttl:
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                continue
+            self._entries.move_to_end(key)
+            self.hits += 1
+            found[i] = entry[1]
+        return found
+
+    def put_many(self, model: str, claim: str, scores: Dict[str, float]):
+        """Store {evidence: score} for the claim, evicting the least recently used over the bound"""
+        now = time.time()
+        for text, score in scores.items():
+            key = score_key(model, claim, text)
+            self._entries[key] = (now, score)
+            self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        self._entries.clear()
+
+    def get_stats(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions
+        }
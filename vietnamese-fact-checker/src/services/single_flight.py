@@ -0,0 +1,47 @@
+"""
+Single Flight - Coalesces identical concurrent requests into one pipeline run
+Followers await the leader's in-flight task instead of starting their own.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+
+class SingleFlight:
+    """One in-flight task per key; concurrent callers with the same key share its result"""
+
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.leaders = 0
+        self.followers = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """Run `fn` for `key` unless a run is already in flight.
+
+        Returns (result, shared) where shared is True for followers. The task is
+        shielded, so a caller that disconnects does not cancel the run for others.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._forget(key, t))
+            self.leaders += 1
+            shared = False
+        else:
+            self.followers += 1
+            shared = True
+        return await asyncio.shield(task), shared
+
+    def _forget(self, key: str, task: asyncio.Task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    def get_stats(self) -> Dict:
+        requests = self.leaders + self.followers
+        return {
+            "in_flight": len(self._inflight),
+            "pipeline_runs": self.leaders,
+            "coalesced_requests": self.followers,
+            "coalescing_rate": self.followers / requests if requests else 0.0
+        }
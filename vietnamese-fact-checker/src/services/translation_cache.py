@@ -0,0 +1,184 @@
+"""
+Translation Cache - Persistent, size-bounded cache of translations
+Entries are keyed on sha256(model, decoding profile, text) and stored in SQLite
+in WAL mode, so every uvicorn worker on the host reads and fills the same cache
+and hits survive restarts. Least recently used entries are evicted once the
+stored text exceeds max_bytes; the byte total is kept in a meta row by triggers,
+so a store never scans the table.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional
+
+# Rows evicted per DELETE while the cache is over its size bound
+_EVICT_BATCH = 100
+# Keys per SELECT (stays below SQLite's bound-parameter limit)
+_LOOKUP_BATCH = 500
+
+
+class TranslationCache:
+    """SQLite-backed LRU cache of translations shared between processes"""
+
+    def __init__(self, sqlite_path: str, max_bytes: int = 50_000_000, ttl: float = 3600):
+        self.sqlite_path = sqlite_path
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.stores = 0
+        self.evictions = 0
+        self._lock = threading.Lock()  # one statement sequence at a time on the shared connection
+
+        directory = os.path.dirname(sqlite_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # timeout: wait for another worker's write transaction instead of failing
+        self._db = sqlite3.connect(sqlite_path, timeout=5, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript("""
+            CREATE TABLE IF NOT EXISTS translations (
+                key TEXT PRIMARY KEY,
+                translation TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS translations_accessed ON translations (accessed_at);
+            CREATE TABLE IF NOT EXISTS cache_meta (name TEXT PRIMARY KEY, value INTEGER NOT NULL);
+            CREATE TRIGGER IF NOT EXISTS translations_bytes_insert AFTER INSERT ON translations BEGIN
+                UPDATE cache_meta SET value = value + NEW.size WHERE name = 'total_bytes';
+            END;
+            CREATE TRIGGER IF NOT EXISTS translations_bytes_delete AFTER DELETE ON translations BEGIN
+                UPDATE cache_meta SET value = value - OLD.size WHERE name = 'total_bytes';
+            END;
+            CREATE TRIGGER IF NOT EXISTS translations_bytes_update AFTER UPDATE OF size ON translations BEGIN
+                UPDATE cache_meta SET value = value + NEW.size - OLD.size WHERE name = 'total_bytes';
+            END;
+        """)
+        # Seeds the total once for a cache file created before the meta row existed
+        self._db.execute(
+            "INSERT OR IGNORE INTO cache_meta (name, value) "
+            "SELECT 'total_bytes', COALESCE(SUM(size), 0) FROM translations"
+        )
+        self._db.commit()
+
+    @staticmethod
+    def make_key(text: str, model: str, profile: str) -> str:
+        return hashlib.sha256(f"{model}\x00{profile}\x00{text}".encode("utf-8")).hexdigest()
+
+    def get_many(self, texts: List[str], model: str, profile: str) -> Dict[str, str]:
+        """Return {text: translation} for the texts that are cached and not expired"""
+        keys = {self.make_key(text, model, profile): text for text in dict.fromkeys(texts)}
+        if not keys:
+            return {}
+
+        now = time.time()
+        key_list = list(keys)
+        found: Dict[str, str] = {}
+        with self._lock:
+            rows = []
+            for i in range(0, len(key_list), _LOOKUP_BATCH):
+                batch = key_list[i:i + _LOOKUP_BATCH]
+                rows += self._db.execute(
+                    f"SELECT key, translation, created_at FROM translations WHERE key IN ({','.join('?' * len(batch))})",
+                    batch
+                ).fetchall()
+
+            hit_keys = []
+            for key, translation, created_at in rows:
+                if now - created_at < self.ttl:
+                    found[keys[key]] = translation
+                    hit_keys.append(key)
+                else:
+                    self.expired += 1
+            if hit_keys:
+                self._db.executemany("UPDATE translations SET accessed_at = ? WHERE key = ?",
+                                     [(now, key) for key in hit_keys])
+                self._db.commit()
+
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return found
+
+    def get(self, text: str, model: str, profile: str) -> Optional[str]:
+        return self.get_many([text], model, profile).get(text)
+
+    def put_many(self, translations: Dict[str, str], model: str, profile: str):
+        """Store {text: translation}, evicting least recently used entries over the size bound"""
+        if not translations:
+            return
+        now = time.time()
+        with self._lock:
+            # Upsert (not REPLACE) so the size triggers see a replaced row as an update
+            self._db.executemany(
+                "INSERT INTO translations (key, translation, size, created_at, accessed_at) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET translation = excluded.translation, size = excluded.size, "
+                "created_at = excluded.created_at, accessed_at = excluded.accessed_at",
+                [
+                    (self.make_key(text, model, profile), translation,
+                     len(text.encode("utf-8")) + len(translation.encode("utf-8")), now, now)
+                    for text, translation in translations.items()
+                ]
+            )
+            self._db.commit()
+            self.stores += len(translations)
+            self._evict()
+
+    def put(self, text: str, translation: str, model: str, profile: str):
+        self.put_many({text: translation}, model, profile)
+
+    def _total_bytes(self) -> int:
+        return self._db.execute("SELECT value FROM cache_meta WHERE name = 'total_bytes'").fetchone()[0]
+
+    def _evict(self):
+        excess = self._total_bytes() - self.max_bytes
+        if excess <= 0:
+            return
+        while excess > 0:
+            oldest = self._db.execute(
+                "SELECT key, size FROM translations ORDER BY accessed_at LIMIT ?", (_EVICT_BATCH,)
+            ).fetchall()
+            if not oldest:
+                break
+            victims = []
+            for key, size in oldest:
+                if excess <= 0:
+                    break
+                victims.append((key,))
+                excess -= size
+            self._db.executemany("DELETE FROM translations WHERE key = ?", victims)
+            self.evictions += len(victims)
+        self._db.commit()
+
+    def clear(self):
+        with self._lock:
+            self._db.execute("DELETE FROM translations")
+            self._db.commit()
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def get_stats(self) -> Dict:
+        lookups = self.hits + self.misses
+        with self._lock:
+            entries = self._db.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+            total_bytes = self._total_bytes()
+        return {
+            "entries": entries,
+            "bytes": total_bytes,
+            "max_bytes": self.max_bytes,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "expired": self.expired,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "stores": self.stores,
+            "evictions": self.evictions
+        }
@@ -1,18 +1,29 @@
 """
 Translation Client - Uses Baseline Translation System API
-Now with configurable settings and caching support.
+Now with configurable settings and a persistent translation cache.
 """
 
 import requests
+import aiohttp
 import asyncio
 from typing import List, Dict, Optional
-from concurrent.futures import ThreadPoolExecutor
 import sys
 import os
 import time
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from core.system_config import translation_config, logging_config, performance_config
+from services.http_session import http_session_manager
+from services.translation_cache import TranslationCache
+from services.passage_selector import split_sentences
+
+# Placeholders returned instead of a translation; never cached
+_FAILURE_PREFIXES = ("[Translation failed", "[Translation error", "[Translation timeout",
+                     "[API error", "[Model not loaded")
+
+def is_translation_failure(text: Optional[str]) -> bool:
+    """True for a failure placeholder (or no text) instead of a translation"""
+    return not text or text.startswith(_FAILURE_PREFIXES)
 
 class TranslationClient:
     """Client for Baseline Translation System API with configuration"""
@@ -27,9 +38,11 @@ class TranslationClient:
         self.health_check_url = f"{self.config.api_url}/"
         self.timeout = self.config.timeout
         
-        # Simple cache (if enabled)
-        self._cache: Dict[str, str] = {}
-        self._cache_times: Dict[str, float] = {}
+        # Persistent translation cache (opened on first use while enabled)
+        self._cache: Optional[TranslationCache] = None
+        
+        # Sentence memoization counters
+        self.sentence_stats = {"texts": 0, "sentences": 0, "unique_sentences": 0}
         
     def check_health(self) -> bool:
         """Check if translation system is running"""
@@ -39,33 +52,72 @@ class TranslationClient:
         except:
             return False
     
-    def _get_from_cache(self, text: str) -> Optional[str]:
-        """Get translation from cache if enabled and valid"""
+    @staticmethod
+    def _payload(payload: Dict, profile: Optional[str]) -> Dict:
+        """Add the decoding profile to a request body (backend default when None)"""
+        if profile:
+            payload["profile"] = profile
+        return payload
+    
+    def _get_cache(self) -> Optional[TranslationCache]:
+        """The shared translation cache, or None when caching is disabled"""
         if not self.config.cache_translations:
             return None
-        
-        if text in self._cache:
-            cache_time = self._cache_times.get(text, 0)
-            if time.time() - cache_time < self.config.cache_ttl:
-                if self.log_config.log_translation_details:
-                    print(f"      [CACHE] Cache hit: {text[:30]}...")
-                return self._cache[text]
-            else:
-                # Cache expired
-                del self._cache[text]
-                del self._cache_times[text]
-        return None
+        if self._cache is None:
+            self._cache = TranslationCache(
+                self.config.cache_sqlite_path,
+                max_bytes=self.config.cache_max_bytes,
+                ttl=self.config.cache_ttl
+            )
+        return self._cache
+    
+    def _lookup_cached(self, texts: List[str], profile: Optional[str] = None) -> Dict[str, str]:
+        """Cached translations of `texts` as {text: translation} (model + profile specific)"""
+        cache = self._get_cache()
+        if cache is None:
+            return {}
+        found = cache.get_many(texts, self.config.model_name, profile or "default")
+        if found and self.log_config.log_translation_details:
+            print(f"      [CACHE] {len(found)}/{len(set(texts))} translations from cache")
+        return found
     
-    def _save_to_cache(self, text: str, translation: str):
+    def _store_cached(self, translations: Dict[str, str], profile: Optional[str] = None):
+        """Cache successful translations"""
+        cache = self._get_cache()
+        if cache is None:
+            return
+        cache.put_many(
+            {text: translation for text, translation in translations.items()
+             if not translation.startswith(_FAILURE_PREFIXES)},
+            self.config.model_name, profile or "default"
+        )
+    
+    async def _lookup_cached_async(self, texts: List[str], profile: Optional[str] = None) -> Dict[str, str]:
+        """_lookup_cached on a worker thread so SQLite I/O never blocks the event loop"""
+        if not self.config.cache_translations:
+            return {}
+        return await asyncio.to_thread(self._lookup_cached, texts, profile)
+    
+    async def _store_cached_async(self, translations: Dict[str, str], profile: Optional[str] = None):
+        """_store_cached on a worker thread"""
+        if self.config.cache_translations and translations:
+            await asyncio.to_thread(self._store_cached, translations, profile)
+    
+    def _get_from_cache(self, text: str, profile: Optional[str] = None) -> Optional[str]:
+        """Get translation from cache if enabled and valid"""
+        return self._lookup_cached([text], profile).get(text)
+    
+    def _save_to_cache(self, text: str, translation: str, profile: Optional[str] = None):
         """Save translation to cache if enabled"""
-        if self.config.cache_translations:
-            self._cache[text] = translation
-            self._cache_times[text] = time.time()
+        self._store_cached({text: translation}, profile)
     
-    def translate_vi_to_en(self, text: str) -> str:
-        """Translate Vietnamese to English using baseline API"""
+    def translate_vi_to_en(self, text: str, profile: Optional[str] = None) -> str:
+        """Translate Vietnamese to English using baseline API
+        
+        `profile` selects the backend decoding profile (fast/balanced/accurate).
+        """
         # Check cache first
-        cached = self._get_from_cache(text)
+        cached = self._get_from_cache(text, profile)
         if cached:
             return cached
         
@@ -73,7 +125,7 @@ class TranslationClient:
             start_time = time.time()
             response = requests.post(
                 self.translation_api_url,
-                json={"text": text},
+                json=self._payload({"text": text}, profile),
                 timeout=self.timeout
             )
             
@@ -85,7 +137,7 @@ class TranslationClient:
                     elapsed = time.time() - start_time
                     print(f"      [OK] Translated in {elapsed:.2f}s: {text[:30]}... -> {translation[:30]}...")
                 
-                self._save_to_cache(text, translation)
+                self._save_to_cache(text, translation, profile)
                 return translation
             else:
                 return f"[API error {response.status_code}: {text}]"
@@ -95,8 +147,48 @@ class TranslationClient:
         except Exception as e:
             return f"[Translation error: {text}]"
     
-    def translate_multiple_vi_to_en(self, texts: List[str]) -> List[str]:
-        """Translate multiple Vietnamese texts to English using BATCH API (GPU optimized)"""
+    def _split_sentences(self, texts: List[str]):
+        """Split texts into their unique sentences.
+        
+        Returns the sentences to translate and, per text, the indices of its
+        sentences, so overlapping snippets of one article share cache entries.
+        """
+        index: Dict[str, int] = {}
+        plan = []
+        total = 0
+        for text in texts:
+            parts = split_sentences(text) or [text]
+            plan.append([index.setdefault(sentence, len(index)) for sentence in parts])
+            total += len(parts)
+        
+        self.sentence_stats["texts"] += len(texts)
+        self.sentence_stats["sentences"] += total
+        self.sentence_stats["unique_sentences"] += len(index)
+        if self.log_config.log_translation_details:
+            print(f"      [CACHE] Sentence memoization: {len(texts)} texts -> {total} sentences ({len(index)} unique)")
+        return list(index), plan
+    
+    @staticmethod
+    def _stitch(plan: List[List[int]], translations: List[str]) -> List[str]:
+        """Join the sentence translations of every text back together
+        
+        A text with a missing or failed sentence translation becomes one failure
+        placeholder rather than a partial translation.
+        """
+        stitched = []
+        for indices in plan:
+            parts = [translations[i] if i < len(translations) else None for i in indices]
+            if any(is_translation_failure(part) for part in parts):
+                stitched.append("[Translation failed]")
+            else:
+                stitched.append(" ".join(parts).strip())
+        return stitched
+    
+    def translate_multiple_vi_to_en(self, texts: List[str], profile: Optional[str] = None) -> List[str]:
+        """Translate multiple Vietnamese texts to English using BATCH API (GPU optimized)
+        
+        With sentence_memoization the texts are translated and cached sentence by sentence.
+        """
         if not texts:
             return []
         
@@ -104,17 +196,24 @@ class TranslationClient:
         if not self.perf_config.batch_translation:
             if self.log_config.log_translation_details:
                 print(f"      [WARN] Batch translation disabled, using individual")
-            return [self.translate_vi_to_en(text) for text in texts]
+            return [self.translate_vi_to_en(text, profile) for text in texts]
         
+        if self.config.sentence_memoization:
+            sentences, plan = self._split_sentences(texts)
+            return self._stitch(plan, self._translate_batch(sentences, profile))
+        return self._translate_batch(texts, profile)
+    
+    def _translate_batch(self, texts: List[str], profile: Optional[str] = None) -> List[str]:
+        """Translate texts not in the cache with one /translate_batch call"""
         # Check cache for all texts first
         results = [None] * len(texts)
         texts_to_translate = []
         indices_to_translate = []
         
+        cached = self._lookup_cached(texts, profile)
         for i, text in enumerate(texts):
-            cached = self._get_from_cache(text)
-            if cached:
-                results[i] = cached
+            if text in cached:
+                results[i] = cached[text]
             else:
                 texts_to_translate.append(text)
                 indices_to_translate.append(i)
@@ -130,18 +229,25 @@ class TranslationClient:
             # Use batch API for single request (GPU optimized)
             response = requests.post(
                 self.batch_translation_api_url,
-                json={"texts": texts_to_translate},
+                json=self._payload({"texts": texts_to_translate}, profile),
                 timeout=self.timeout
             )
             
             if response.status_code == 200:
                 result = response.json()
                 translations = result.get("translations", [])
-                
+
+                if len(translations) != len(texts_to_translate):
+                    # Cannot tell which texts the partial response belongs to: cache none of it
+                    print(f"[WARN] Batch API returned {len(translations)} translations for "
+                          f"{len(texts_to_translate)} texts, falling back to individual")
+                    for idx in indices_to_translate:
+                        results[idx] = self.translate_vi_to_en(texts[idx], profile)
+                    return results
+
                 for idx, trans in zip(indices_to_translate, translations):
-                    translation = trans.get("english", f"[Translation failed]")
-                    results[idx] = translation
-                    self._save_to_cache(texts[idx], translation)
+                    results[idx] = trans.get("english", f"[Translation failed: {texts[idx]}]")
+                self._store_cached({texts[idx]: results[idx] for idx in indices_to_translate}, profile)
                 
                 if self.log_config.log_translation_details:
                     elapsed = time.time() - start_time
@@ -152,19 +258,151 @@ class TranslationClient:
             else:
                 print(f"[WARN] Batch API failed ({response.status_code}), falling back to individual")
                 for idx in indices_to_translate:
-                    results[idx] = self.translate_vi_to_en(texts[idx])
+                    results[idx] = self.translate_vi_to_en(texts[idx], profile)
                 return results
                 
         except Exception as e:
             print(f"[WARN] Batch translation error: {e}, falling back to individual")
             for idx in indices_to_translate:
-                results[idx] = self.translate_vi_to_en(texts[idx])
+                results[idx] = self.translate_vi_to_en(texts[idx], profile)
             return results
     
-    async def translate_multiple_vi_to_en_async(self, texts: List[str]) -> List[str]:
-        """Async version of multiple translation"""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.translate_multiple_vi_to_en, texts)
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared pooled keep-alive session for the translation service"""
+        return http_session_manager.get_session(
+            "translation",
+            limit=self.config.connection_limit,
+            limit_per_host=self.config.connection_limit,
+            keepalive_timeout=self.config.keepalive_timeout
+        )
+    
+    def _effective_timeout(self, timeout: Optional[float]) -> float:
+        return self.timeout if timeout is None else min(self.timeout, timeout)
+    
+    async def translate_vi_to_en_async(self, text: str, timeout: Optional[float] = None,
+                                       profile: Optional[str] = None) -> str:
+        """Async version of single translation (does not block the event loop)
+        
+        `timeout` (seconds) caps the configured timeout, e.g. with a deadline budget;
+        when it runs out asyncio.TimeoutError is raised instead of a placeholder.
+        `profile` selects the backend decoding profile.
+        """
+        cached = (await self._lookup_cached_async([text], profile)).get(text)
+        if cached:
+            return cached
+        
+        try:
+            start_time = time.time()
+            session = self._get_session()
+            async with session.post(
+                self.translation_api_url,
+                json=self._payload({"text": text}, profile),
+                timeout=aiohttp.ClientTimeout(total=self._effective_timeout(timeout))
+            ) as response:
+                
+                if response.status == 200:
+                    result = await response.json()
+                    translation = result.get("english", f"[Translation failed: {text}]")
+                    
+                    if self.log_config.log_translation_details:
+                        elapsed = time.time() - start_time
+                        print(f"      [OK] Translated in {elapsed:.2f}s: {text[:30]}... -> {translation[:30]}...")
+                    
+                    await self._store_cached_async({text: translation}, profile)
+                    return translation
+                else:
+                    return f"[API error {response.status}: {text}]"
+                    
+        except asyncio.TimeoutError:
+            if timeout is not None:
+                raise
+            return f"[Translation timeout: {text}]"
+        except Exception:
+            return f"[Translation error: {text}]"
+    
+    async def translate_multiple_vi_to_en_async(self, texts: List[str],
+                                                timeout: Optional[float] = None,
+                                                profile: Optional[str] = None) -> List[str]:
+        """Async version of multiple translation using the BATCH API over a pooled connection
+        
+        `timeout` and `profile` behave as in translate_vi_to_en_async; with
+        sentence_memoization the texts are translated and cached sentence by sentence.
+        """
+        if not texts:
+            return []
+        
+        if not self.perf_config.batch_translation:
+            if self.log_config.log_translation_details:
+                print("      [WARN] Batch translation disabled, using individual")
+            return list(await asyncio.gather(*[self.translate_vi_to_en_async(text, timeout, profile) for text in texts]))
+        
+        if self.config.sentence_memoization:
+            sentences, plan = self._split_sentences(texts)
+            return self._stitch(plan, await self._translate_batch_async(sentences, timeout, profile))
+        return await self._translate_batch_async(texts, timeout, profile)
+    
+    async def _translate_batch_async(self, texts: List[str], timeout: Optional[float] = None,
+                                     profile: Optional[str] = None) -> List[str]:
+        """Translate texts not in the cache with one /translate_batch call over the pooled session"""
+        # Check cache for all texts first
+        results = [None] * len(texts)
+        texts_to_translate = []
+        indices_to_translate = []
+        
+        cached = await self._lookup_cached_async(texts, profile)
+        for i, text in enumerate(texts):
+            if text in cached:
+                results[i] = cached[text]
+            else:
+                texts_to_translate.append(text)
+                indices_to_translate.append(i)
+        
+        if not texts_to_translate:
+            if self.log_config.log_translation_details:
+                print(f"      [CACHE] All {len(texts)} texts from cache")
+            return results
+        
+        try:
+            start_time = time.time()
+            session = self._get_session()
+            async with session.post(
+                self.batch_translation_api_url,
+                json=self._payload({"texts": texts_to_translate}, profile),
+                timeout=aiohttp.ClientTimeout(total=self._effective_timeout(timeout))
+            ) as response:
+                
+                if response.status == 200:
+                    result = await response.json()
+                    translations = result.get("translations", [])
+                    
+                    if len(translations) == len(texts_to_translate):
+                        for idx, trans in zip(indices_to_translate, translations):
+                            results[idx] = trans.get("english", f"[Translation failed: {texts[idx]}]")
+                        await self._store_cached_async({texts[idx]: results[idx] for idx in indices_to_translate}, profile)
+                        
+                        if self.log_config.log_translation_details:
+                            elapsed = time.time() - start_time
+                            cached_count = len(texts) - len(texts_to_translate)
+                            print(f"      [PERF] Batch translated {len(texts_to_translate)} texts in {elapsed:.2f}s (cached: {cached_count})")
+                        
+                        return results
+                    # Cannot tell which texts the partial response belongs to: cache none of it
+                    print(f"[WARN] Batch API returned {len(translations)} translations for "
+                          f"{len(texts_to_translate)} texts, falling back to individual")
+                else:
+                    print(f"[WARN] Batch API failed ({response.status}), falling back to individual")
+                    
+        except asyncio.TimeoutError:
+            if timeout is not None:
+                raise
+            print("[WARN] Batch translation timeout, falling back to individual")
+        except Exception as e:
+            print(f"[WARN] Batch translation error: {e}, falling back to individual")
+        
+        fallbacks = await asyncio.gather(*[self.translate_vi_to_en_async(texts[idx], timeout, profile) for idx in indices_to_translate])
+        for idx, translation in zip(indices_to_translate, fallbacks):
+            results[idx] = translation
+        return results
     
     def get_config_summary(self) -> Dict:
         """Get current configuration summary"""
@@ -174,15 +412,39 @@ class TranslationClient:
             "model": self.config.model_name,
             "cache_enabled": self.config.cache_translations,
             "cache_ttl": self.config.cache_ttl,
-            "cache_size": len(self._cache),
+            "cache_path": self.config.cache_sqlite_path,
+            "cache_max_bytes": self.config.cache_max_bytes,
+            "cache_size": self._cache.get_stats()["entries"] if self._cache else 0,
+            "sentence_memoization": self.config.sentence_memoization,
+            "claim_profile": self.config.claim_profile,
+            "evidence_profile": self.config.evidence_profile,
             "batch_enabled": self.perf_config.batch_translation,
+            "connection_limit": self.config.connection_limit,
+            "keepalive_timeout": self.config.keepalive_timeout,
             "use_gpu": self.config.use_gpu
         }
     
+    def get_cache_stats(self) -> Optional[Dict]:
+        """Hit-rate and size statistics of the translation cache (None when disabled)"""
+        cache = self._get_cache()
+        if cache is None:
+            return None
+        stats = cache.get_stats()
+        stats["sentence_memoization"] = self.config.sentence_memoization
+        stats.update(self.sentence_stats)
+        return stats
+    
     def clear_cache(self):
         """Clear translation cache"""
-        self._cache.clear()
-        self._cache_times.clear()
+        cache = self._get_cache()
+        if cache:
+            cache.clear()
+    
+    def close(self):
+        """Close the translation cache database"""
+        if self._cache is not None:
+            self._cache.close()
+            self._cache = None
 
 # Singleton instance
 translation_client = TranslationClient()
@@ -0,0 +1,110 @@
+"""
+Verdict Cache - LRU + TTL cache of fact-check responses keyed by canonical claim
+Optional SQLite persistence so cached verdicts survive restarts.
+"""
+
+import json
+import sqlite3
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+
+def _json_default(value):
+    """Serialize pydantic models (e.g. Evidence) inside responses"""
+    if hasattr(value, "model_dump"):
+        return value.model_dump()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class VerdictCache:
+    """Bounded in-memory LRU with TTL expiry, optionally written through to SQLite"""
+
+    def __init__(self, max_entries: int = 10000, ttl: float = 3600, sqlite_path: Optional[str] = None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.sqlite_path = sqlite_path
+        self._entries: "OrderedDict[str, Tuple[float, Dict]]" = OrderedDict()
+        self._db: Optional[sqlite3.Connection] = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        if sqlite_path:
+            self._open_db(sqlite_path)
+
+    def _open_db(self, path: str):
+        """Open the SQLite store and warm the in-memory LRU from it"""
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS verdicts (key TEXT PRIMARY KEY, value TEXT NOT NULL, stored_at REAL NOT NULL)"
+        )
+        self._db.execute("DELETE FROM verdicts WHERE stored_at < ?", (time.time() - self.ttl,))
+        self._db.commit()
+
+        rows = self._db.execute(
+            "SELECT key, value, stored_at FROM verdicts ORDER BY stored_at DESC LIMIT ?", (self.max_entries,)
+        ).fetchall()
+        for key, value, stored_at in reversed(rows):
+            self._entries[key] = (stored_at, json.loads(value))
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return a copy of the cached response, or None on miss/expiry"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        stored_at, value = entry
+        if time.time() - stored_at >= self.ttl:
+            self._delete(key)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return json.loads(json.dumps(value))
+
+    def set(self, key: str, value: Dict):
+        """Store a response, evicting the least recently used entries over the size bound"""
+        serialized = json.dumps(value, default=_json_default, ensure_ascii=False)
+        stored_at = time.time()
+        self._entries[key] = (stored_at, json.loads(serialized))
+        self._entries.move_to_end(key)
+
+        if self._db is not None:
+            self._db.execute(
+                "INSERT OR REPLACE INTO verdicts (key, value, stored_at) VALUES (?, ?, ?)",
+                (key, serialized, stored_at)
+            )
+            self._db.commit()
+
+        while len(self._entries) > self.max_entries:
+            oldest = next(iter(self._entries))
+            self._delete(oldest)
+            self.evictions += 1
+
+    def _delete(self, key: str):
+        self._entries.pop(key, None)
+        if self._db is not None:
+            self._db.execute("DELETE FROM verdicts WHERE key = ?", (key,))
+            self._db.commit()
+
+    def clear(self):
+        self._entries.clear()
+        if self._db is not None:
+            self._db.execute("DELETE FROM verdicts")
+            self._db.commit()
+
+    def get_stats(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "persistent": self._db is not None
+        }
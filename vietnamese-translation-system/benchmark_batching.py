@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+CPU benchmark: length-bucketed batching vs one padded batch (VinAI vi2en)
+
+Translates a mix of short claims and long evidence texts from test_50_cases.csv
+with the model on CPU and reports source tokens/sec, output tokens/sec, wall
+time and peak RSS for:
+  - single:   all texts in one padded generate() call (previous behaviour)
+  - bucketed: translate_batch_with_vinai (length-sorted, token-budgeted batches)
+
+Each mode runs in its own process. RSS is measured with psutil (portable,
+Windows included): once the model is loaded, then sampled while the texts are
+translated, the highest sample being the mode's peak.
+
+Usage:
+    python benchmark_batching.py --texts 32 --threads 4
+"""
+
+import argparse
+import csv
+import multiprocessing
+import os
+import threading
+import time
+
+# Benchmark the CPU path even on GPU machines
+os.environ.setdefault("CUDA_VISIBLE_DEVICES", "")
+
+import torch
+
+import clean_backend
+from config import BATCH_TOKEN_BUDGET
+
+DATASET = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "test_50_cases.csv")
+
+
+def load_texts(path: str, count: int):
+    """Alternate short claims and long evidence texts"""
+    texts = []
+    with open(path, encoding="utf-8-sig") as f:
+        for row in csv.DictReader(f):
+            texts.append(row["Statement"])
+            texts.append(row["Evidence"])
+    return texts[:count]
+
+
+def rss_mb() -> float:
+    """Current resident set size of this process (psutil: works on Windows too)"""
+    import psutil
+    return psutil.Process().memory_info().rss / (1024 * 1024)
+
+
+class RssSampler:
+    """Highest RSS of this process (psutil) seen while the block runs"""
+
+    def __init__(self, interval: float = 0.05):
+        import psutil
+        self.process = psutil.Process()
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+
+    def _sample(self):
+        while True:
+            self.peak = max(self.peak, self.process.memory_info().rss)
+            if self._stop.wait(self.interval):
+                break
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, self.process.memory_info().rss)
+
+    @property
+    def peak_mb(self) -> float:
+        return self.peak / (1024 * 1024)
+
+
+def count_tokens(texts):
+    return sum(len(ids) for ids in clean_backend.tokenizer(texts, truncation=True, max_length=512)["input_ids"])
+
+
+def run(name: str, texts, threads: int, results):
+    """Load the model, translate the texts in one mode and report (child process)"""
+    torch.set_num_threads(threads)
+    if not clean_backend.load_vinai_model():
+        raise SystemExit("VinAI model could not be loaded")
+    translate = clean_backend.translate_batch_with_vinai if name == "bucketed" else clean_backend.generate_batch
+
+    # Warm-up
+    clean_backend.generate_batch(texts[:2])
+
+    loaded_rss_mb = rss_mb()
+    with RssSampler() as rss:
+        start = time.time()
+        outputs = translate(texts)
+        elapsed = time.time() - start
+    source_tokens = count_tokens(texts)
+    output_tokens = count_tokens(outputs)
+    results.put({
+        "mode": name,
+        "wall_time": elapsed,
+        "source_tokens_per_sec": source_tokens / elapsed,
+        "output_tokens_per_sec": output_tokens / elapsed,
+        "rss_mb": loaded_rss_mb,
+        "peak_rss_mb": rss.peak_mb,
+        "outputs": outputs,
+        "source_lengths": [len(ids) for ids in clean_backend.tokenizer(texts, truncation=True, max_length=512)["input_ids"]],
+    })
+
+
+def measure(name: str, texts, threads: int):
+    ctx = multiprocessing.get_context("spawn")
+    results = ctx.Queue()
+    process = ctx.Process(target=run, args=(name, texts, threads, results))
+    process.start()
+    result = results.get()
+    process.join()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark length-bucketed batching on CPU")
+    parser.add_argument("--texts", type=int, default=32)
+    parser.add_argument("--threads", type=int, default=torch.get_num_threads())
+    parser.add_argument("--csv", default=DATASET)
+    args = parser.parse_args()
+
+    texts = load_texts(args.csv, args.texts)
+    bucketed = measure("bucketed", texts, args.threads)
+    single = measure("single", texts, args.threads)
+
+    lengths = bucketed["source_lengths"]
+    print(f"\n{len(texts)} texts, source tokens min/avg/max: {min(lengths)}/{sum(lengths) / len(lengths):.0f}/{max(lengths)}")
+    print(f"CPU threads: {args.threads}, token budget: {BATCH_TOKEN_BUDGET}, padded single batch: {len(texts) * max(lengths)} tokens")
+
+    print(f"\n{'mode':<10}{'wall (s)':>10}{'src tok/s':>12}{'out tok/s':>12}{'RSS (MB)':>10}{'peak RSS (MB)':>15}")
+    for r in (single, bucketed):
+        print(f"{r['mode']:<10}{r['wall_time']:>10.2f}{r['source_tokens_per_sec']:>12.1f}"
+              f"{r['output_tokens_per_sec']:>12.1f}{r['rss_mb']:>10.0f}{r['peak_rss_mb']:>15.0f}")
+
+    same = sum(a == b for a, b in zip(single["outputs"], bucketed["outputs"]))
+    print(f"\nSpeed-up: {single['wall_time'] / bucketed['wall_time']:.2f}x")
+    print(f"Identical outputs: {same}/{len(texts)} (padding can change beam search slightly)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+CPU benchmark: decoding profiles (VinAI vi2en)
+
+Translates claims and evidence texts from test_50_cases.csv with every
+decoding profile and reports per profile:
+  - wall time per text and latency gain against "accurate"
+  - quality delta against "accurate": exact match and corpus BLEU with the
+    full-beam translations as references (no human references exist)
+  - texts whose output reached the max_new_tokens limit (possible truncation)
+
+Claims and evidence are reported separately since the orchestrator uses
+different profiles for them.
+
+Usage:
+    python benchmark_decoding.py --texts 20 --threads 4
+"""
+
+import argparse
+import csv
+import os
+import time
+
+# Benchmark the CPU path even on GPU machines
+os.environ.setdefault("CUDA_VISIBLE_DEVICES", "")
+
+import torch
+
+import clean_backend
+from benchmark_quantization import corpus_bleu
+from config import DECODING_PROFILES
+from decoding import max_new_tokens
+
+DATASET = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "test_50_cases.csv")
+
+
+def load_texts(path: str, count: int):
+    claims, evidence = [], []
+    with open(path, encoding="utf-8-sig") as f:
+        for row in csv.DictReader(f):
+            claims.append(row["Statement"])
+            evidence.append(row["Evidence"])
+    return {"claims": claims[:count], "evidence": evidence[:count]}
+
+
+def token_counts(texts):
+    return [len(ids) for ids in clean_backend.tokenizer(texts, truncation=True, max_length=512)["input_ids"]]
+
+
+def run(profile: str, texts):
+    start = time.perf_counter()
+    outputs = clean_backend.translate_batch_with_vinai(texts, profile)
+    elapsed = time.perf_counter() - start
+    capped = sum(
+        out_len - 1 >= max_new_tokens(src_len)  # minus the end-of-sequence token
+        for src_len, out_len in zip(token_counts(texts), token_counts(outputs))
+    )
+    return {"profile": profile, "time": elapsed, "outputs": outputs, "capped": capped}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark decoding profiles on CPU")
+    parser.add_argument("--texts", type=int, default=20, help="Claims and evidence texts per set")
+    parser.add_argument("--threads", type=int, default=torch.get_num_threads())
+    parser.add_argument("--csv", default=DATASET)
+    args = parser.parse_args()
+
+    torch.set_num_threads(args.threads)
+    if not clean_backend.load_vinai_model():
+        raise SystemExit("VinAI model could not be loaded")
+
+    # Warm-up
+    clean_backend.generate_batch(["Xin chào"], "fast")
+
+    for name, texts in load_texts(args.csv, args.texts).items():
+        print(f"\n{name}: {len(texts)} texts, avg {sum(token_counts(texts)) / len(texts):.0f} source tokens")
+        results = {profile: run(profile, texts) for profile in DECODING_PROFILES}
+        reference = results["accurate"]
+
+        print(f"{'profile':<10}{'beams':>6}{'ms/text':>10}{'gain':>8}{'exact':>8}{'BLEU':>8}{'capped':>8}")
+        for profile, r in results.items():
+            exact = sum(a.strip() == b.strip() for a, b in zip(r["outputs"], reference["outputs"]))
+            print(f"{profile:<10}{DECODING_PROFILES[profile]:>6}{r['time'] / len(texts) * 1000:>10.0f}"
+                  f"{reference['time'] / r['time']:>7.2f}x{exact:>5}/{len(texts):<2}"
+                  f"{corpus_bleu(r['outputs'], reference['outputs']):>8.1f}{r['capped']:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+CPU benchmark: int8 dynamic quantization vs fp32 (VinAI vi2en or NLLB)
+
+Translates a fixed Vietnamese set (the first N claims of test_50_cases.csv)
+one text at a time, as /translate does, and reports for each precision:
+  - per-text latency (mean / p50 / p90)
+  - serialized model size and steady-state RSS once the model is loaded
+    (and quantized), measured with psutil
+  - parity of the int8 outputs with fp32: exact match and corpus BLEU,
+    with the fp32 translations as references
+
+Each precision runs in its own process so one model's memory is never
+counted for the other.
+
+Usage:
+    python benchmark_quantization.py --model vinai --texts 30 --threads 4
+    python benchmark_quantization.py --model nllb
+"""
+
+import argparse
+import collections
+import csv
+import gc
+import math
+import multiprocessing
+import os
+import statistics
+import time
+
+# Benchmark the CPU path even on GPU machines
+os.environ.setdefault("CUDA_VISIBLE_DEVICES", "")
+
+DATASET = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "test_50_cases.csv")
+
+
+def load_texts(path: str, count: int):
+    with open(path, encoding="utf-8-sig") as f:
+        return [row["Statement"] for row in csv.DictReader(f) if row.get("Statement")][:count]
+
+
+def rss_mb() -> float:
+    """Current resident set size of this process (psutil: works on Windows too)"""
+    import psutil
+    gc.collect()
+    return psutil.Process().memory_info().rss / (1024 * 1024)
+
+
+def corpus_bleu(hypotheses, references, max_n: int = 4) -> float:
+    """Corpus BLEU (0-100) with one reference per hypothesis and brevity penalty"""
+    matches = [0] * max_n
+    totals = [0] * max_n
+    hyp_len = ref_len = 0
+    for hyp, ref in zip(hypotheses, references):
+        hyp_tokens, ref_tokens = hyp.lower().split(), ref.lower().split()
+        hyp_len += len(hyp_tokens)
+        ref_len += len(ref_tokens)
+        for n in range(1, max_n + 1):
+            hyp_ngrams = collections.Counter(tuple(hyp_tokens[i:i + n]) for i in range(len(hyp_tokens) - n + 1))
+            ref_ngrams = collections.Counter(tuple(ref_tokens[i:i + n]) for i in range(len(ref_tokens) - n + 1))
+            matches[n - 1] += sum((hyp_ngrams & ref_ngrams).values())
+            totals[n - 1] += sum(hyp_ngrams.values())
+    if not hyp_len or min(matches) == 0:
+        return 0.0
+    log_precision = sum(math.log(m / t) for m, t in zip(matches, totals)) / max_n
+    brevity = 1.0 if hyp_len > ref_len else math.exp(1 - ref_len / hyp_len)
+    return 100 * brevity * math.exp(log_precision)
+
+
+def run_precision(model_name: str, quantize: bool, texts, threads: int, results):
+    """Load the model at one precision, translate the texts and report (child process)"""
+    import torch
+    from quantization import model_size_mb
+
+    torch.set_num_threads(threads)
+
+    if model_name == "vinai":
+        import clean_backend
+        if not clean_backend.load_vinai_model(quantize=quantize):
+            raise SystemExit("VinAI model could not be loaded")
+        model = clean_backend.model
+
+        def translate(text):
+            return clean_backend.generate_batch([text])[0]
+    else:
+        from facebook_backend import FacebookNLLBTranslator
+        translator = FacebookNLLBTranslator(quantize=quantize)
+        translator.load_model()
+        model = translator.model
+        translate = translator.translate_vi_to_en
+
+    # After load and in-place quantization, so the freed fp32 weights are not counted
+    loaded_rss_mb = rss_mb()
+
+    # Warm-up
+    translate(texts[0])
+
+    outputs = []
+    latencies = []
+    for text in texts:
+        start = time.perf_counter()
+        outputs.append(translate(text))
+        latencies.append(time.perf_counter() - start)
+
+    results.put({
+        "precision": "int8" if quantize else "fp32",
+        "outputs": outputs,
+        "latencies": latencies,
+        "model_size_mb": model_size_mb(model),
+        "rss_mb": loaded_rss_mb,
+    })
+
+
+def measure(model_name: str, quantize: bool, texts, threads: int):
+    ctx = multiprocessing.get_context("spawn")
+    results = ctx.Queue()
+    process = ctx.Process(target=run_precision, args=(model_name, quantize, texts, threads, results))
+    process.start()
+    result = results.get()
+    process.join()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark int8 dynamic quantization against fp32 on CPU")
+    parser.add_argument("--model", choices=["vinai", "nllb"], default="vinai")
+    parser.add_argument("--texts", type=int, default=30)
+    parser.add_argument("--threads", type=int, default=os.cpu_count())
+    parser.add_argument("--csv", default=DATASET)
+    args = parser.parse_args()
+
+    texts = load_texts(args.csv, args.texts)
+    print(f"{args.model}: {len(texts)} claims from {os.path.basename(args.csv)}, CPU threads: {args.threads}")
+
+    fp32 = measure(args.model, False, texts, args.threads)
+    int8 = measure(args.model, True, texts, args.threads)
+
+    print(f"\n{'precision':<10}{'mean (ms)':>11}{'p50 (ms)':>10}{'p90 (ms)':>10}{'model (MB)':>12}{'RSS (MB)':>10}")
+    for r in (fp32, int8):
+        latencies = sorted(r["latencies"])
+        p90 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.9))]
+        print(f"{r['precision']:<10}{statistics.mean(latencies) * 1000:>11.0f}"
+              f"{statistics.median(latencies) * 1000:>10.0f}{p90 * 1000:>10.0f}"
+              f"{r['model_size_mb']:>12.0f}{r['rss_mb']:>10.0f}")
+
+    exact = sum(a.strip() == b.strip() for a, b in zip(fp32["outputs"], int8["outputs"]))
+    speedup = sum(fp32["latencies"]) / sum(int8["latencies"])
+    print(f"\nSpeed-up: {speedup:.2f}x")
+    print(f"Parity with fp32: exact match {exact}/{len(texts)}, "
+          f"BLEU {corpus_bleu(int8['outputs'], fp32['outputs']):.1f}")
+
+    # Show a few translations that changed
+    changed = [(vi, a, b) for vi, a, b in zip(texts, fp32["outputs"], int8["outputs"]) if a.strip() != b.strip()]
+    for vi, a, b in changed[:3]:
+        print(f"\n  vi:   {vi}\n  fp32: {a}\n  int8: {b}")
+
+
+if __name__ == "__main__":
+    main()
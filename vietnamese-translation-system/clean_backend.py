@@ -11,6 +11,11 @@ from transformers import AutoTokenizer, AutoModelForSeq2SeqLM
 import time
 import os
 
+from config import BATCH_MAX_SIZE, BATCH_MAX_WAIT_MS, BATCH_TOKEN_BUDGET, DEFAULT_PROFILE, QUANTIZE_INT8
+from decoding import Profile, generation_kwargs
+from micro_batcher import MicroBatcher, length_bucketed_batches
+from quantization import model_size_mb, quantize_int8
+
 app = FastAPI(title="VinAI Translation Backend", version="2.0.0")
 
 # Set cache directory to D: drive
@@ -30,13 +35,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-from typing import List
+from typing import Dict, List, Tuple
 
 class TranslationRequest(BaseModel):
     text: str
+    profile: Profile = DEFAULT_PROFILE
 
 class BatchTranslationRequest(BaseModel):
     texts: List[str]
+    profile: Profile = DEFAULT_PROFILE
 
 class TranslationResponse(BaseModel):
     vietnamese: str
@@ -45,6 +52,7 @@ class TranslationResponse(BaseModel):
     model: str
     using_facebook_model: bool
     model_loaded: bool
+    profile: str = DEFAULT_PROFILE
 
 class BatchTranslationResponse(BaseModel):
     translations: List[dict]
@@ -52,16 +60,21 @@ class BatchTranslationResponse(BaseModel):
     count: int
     device: str
     model: str
+    profile: str = DEFAULT_PROFILE
 
 # Global model variables
 tokenizer = None
 model = None
 model_loaded = False
 device_used = "cpu"
+quantized = False
 
-def load_vinai_model():
-    """Load VinAI Vietnamese-English translation model from D: cache with GPU support"""
-    global tokenizer, model, model_loaded, device_used
+def load_vinai_model(quantize: bool = QUANTIZE_INT8):
+    """Load VinAI Vietnamese-English translation model from D: cache with GPU support
+    
+    With quantize=True (TRANSLATION_INT8=1) the CPU model is converted to int8.
+    """
+    global tokenizer, model, model_loaded, device_used, quantized
     
     if model_loaded:
         return True
@@ -95,10 +108,19 @@ def load_vinai_model():
         # Move to GPU if available
         model = model.to(device_used)
         model.eval()
+        
+        if quantize and device_used == "cpu":
+            fp32_size = model_size_mb(model)
+            model = quantize_int8(model)
+            quantized = True
+            print(f" Quantized to int8: {fp32_size:.0f} MB -> {model_size_mb(model):.0f} MB")
+        elif quantize:
+            print(" int8 quantization is CPU-only, keeping fp32 on GPU")
+        
         model_loaded = True
         
         load_time = time.time() - start_time
-        print(f" VinAI model loaded on {device_used.upper()} in {load_time:.2f} seconds")
+        print(f" VinAI model loaded on {device_used.upper()}{' (int8)' if quantized else ''} in {load_time:.2f} seconds")
         return True
         
     except Exception as e:
@@ -106,7 +128,7 @@ def load_vinai_model():
         print(" Using fallback translations...")
         return False
 
-def translate_with_vinai(text: str) -> str:
+def translate_with_vinai(text: str, profile: str = DEFAULT_PROFILE) -> str:
     """Translate Vietnamese to English using VinAI model"""
     if not model_loaded:
         return f"[Model not loaded: {text}]"
@@ -127,8 +149,7 @@ def translate_with_vinai(text: str) -> str:
                 **input_ids,
                 decoder_start_token_id=tokenizer.lang_code_to_id["en_XX"],
                 num_return_sequences=1,
-                num_beams=5,
-                early_stopping=True
+                **generation_kwargs(profile, input_ids["input_ids"].shape[1])
             )
         
         # Decode
@@ -139,39 +160,84 @@ def translate_with_vinai(text: str) -> str:
         print(f" VinAI translation error: {e}")
         return f"[Translation failed: {text}]"
 
-def translate_batch_with_vinai(texts: List[str]) -> List[str]:
-    """Translate multiple Vietnamese texts to English in a single batch (GPU optimized)"""
+def generate_batch(texts: List[str], profile: str = DEFAULT_PROFILE) -> List[str]:
+    """Translate texts in one padded generate() call
+    
+    max_new_tokens follows the longest (padded) source of the batch.
+    """
+    inputs = tokenizer(
+        texts,
+        return_tensors="pt",
+        truncation=True,
+        max_length=512,
+        padding=True
+    ).to(device_used)
+    
+    with torch.no_grad():
+        outputs = model.generate(
+            **inputs,
+            decoder_start_token_id=tokenizer.lang_code_to_id["en_XX"],
+            num_return_sequences=1,
+            **generation_kwargs(profile, inputs["input_ids"].shape[1])
+        )
+    
+    return tokenizer.batch_decode(outputs, skip_special_tokens=True)
+
+def translate_batch_with_vinai(texts: List[str], profile: str = DEFAULT_PROFILE) -> List[str]:
+    """Translate multiple Vietnamese texts to English in length-bucketed batches
+    
+    Texts are sorted by token length and split into batches capped by
+    BATCH_TOKEN_BUDGET padded tokens, so short texts are not padded to the
+    longest one and large requests cannot exhaust memory. Order is preserved.
+    """
     if not model_loaded:
         return [f"[Model not loaded: {text}]" for text in texts]
     
     try:
-        # Prepare batch input - all texts at once
-        inputs = tokenizer(
-            texts,
-            return_tensors="pt",
-            truncation=True,
-            max_length=512,
-            padding=True
-        ).to(device_used)
+        lengths = [len(ids) for ids in tokenizer(texts, truncation=True, max_length=512)["input_ids"]]
+        translations = [None] * len(texts)
         
-        # Generate translations for entire batch at once
-        with torch.no_grad():
-            outputs = model.generate(
-                **inputs,
-                decoder_start_token_id=tokenizer.lang_code_to_id["en_XX"],
-                num_return_sequences=1,
-                num_beams=5,
-                early_stopping=True
-            )
+        for batch in length_bucketed_batches(lengths, BATCH_TOKEN_BUDGET, BATCH_MAX_SIZE):
+            outputs = generate_batch([texts[i] for i in batch], profile)
+            for i, translation in zip(batch, outputs):
+                translations[i] = translation
         
-        # Decode all translations
-        translations = tokenizer.batch_decode(outputs, skip_special_tokens=True)
         return translations
         
     except Exception as e:
         print(f" VinAI batch translation error: {e}")
         # Fallback to individual translation
-        return [translate_with_vinai(text) for text in texts]
+        return [translate_with_vinai(text, profile) for text in texts]
+
+def translate_requests(items: List[Tuple[str, str]]) -> List[str]:
+    """Translate (text, profile) items of one micro-batch, one generation pass per profile"""
+    by_profile: Dict[str, List[int]] = {}
+    for i, (_, profile) in enumerate(items):
+        by_profile.setdefault(profile, []).append(i)
+    
+    translations = [None] * len(items)
+    for profile, indices in by_profile.items():
+        outputs = translate_batch_with_vinai([items[i][0] for i in indices], profile)
+        for i, translation in zip(indices, outputs):
+            translations[i] = translation
+    return translations
+
+# Shared micro-batcher: one worker thread runs all model calls
+batcher = MicroBatcher(
+    translate_requests,
+    max_batch_size=BATCH_MAX_SIZE,
+    max_wait=BATCH_MAX_WAIT_MS / 1000,
+    name="vinai"
+)
+
+@app.on_event("startup")
+async def startup_event():
+    """Start the batching worker"""
+    batcher.start()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    batcher.stop()
 
 @app.get("/")
 async def root():
@@ -181,6 +247,7 @@ async def root():
         "using_vinai_model": True,
         "model_loaded": model_loaded,
         "device": device_used,
+        "quantized": quantized,
         "gpu_available": torch.cuda.is_available(),
         "cache_dir": CACHE_DIR,
         "message": "VinAI Translation Backend ready"
@@ -195,9 +262,9 @@ async def translate(request: TranslationRequest):
     if not model_loaded:
         load_vinai_model()
     
-    # Use VinAI model if available
+    # Use VinAI model if available (batched with concurrent requests)
     if model_loaded:
-        english_text = translate_with_vinai(request.text)
+        english_text = (await batcher.translate([(request.text, request.profile)]))[0]
     else:
         english_text = f"[Model not loaded: {request.text}]"
     
@@ -209,7 +276,8 @@ async def translate(request: TranslationRequest):
         translation_time=translation_time,
         model="VinAI/vinai-translate-vi2en-v2",
         using_facebook_model=False,
-        model_loaded=model_loaded
+        model_loaded=model_loaded,
+        profile=request.profile
     )
 
 @app.post("/translate_batch", response_model=BatchTranslationResponse)
@@ -227,12 +295,13 @@ async def translate_batch(request: BatchTranslationRequest):
             total_time=0.0,
             count=0,
             device=device_used,
-            model="VinAI/vinai-translate-vi2en-v2"
+            model="VinAI/vinai-translate-vi2en-v2",
+            profile=request.profile
         )
     
-    # Use batch translation for GPU optimization
+    # Texts join the shared micro-batches with those of concurrent requests
     if model_loaded:
-        english_texts = translate_batch_with_vinai(request.texts)
+        english_texts = await batcher.translate([(text, request.profile) for text in request.texts])
     else:
         english_texts = [f"[Model not loaded: {text}]" for text in request.texts]
     
@@ -244,16 +313,22 @@ async def translate_batch(request: BatchTranslationRequest):
         for vi, en in zip(request.texts, english_texts)
     ]
     
-    print(f" Batch translated {len(request.texts)} texts in {total_time:.2f}s on {device_used.upper()}")
+    print(f" Batch translated {len(request.texts)} texts ({request.profile}) in {total_time:.2f}s on {device_used.upper()}")
     
     return BatchTranslationResponse(
         translations=translations,
         total_time=total_time,
         count=len(translations),
         device=device_used,
-        model="VinAI/vinai-translate-vi2en-v2"
+        model="VinAI/vinai-translate-vi2en-v2",
+        profile=request.profile
     )
 
+@app.get("/stats/batching")
+async def batching_stats():
+    """Micro-batching metrics: queue depth, batch fill, deduplicated texts"""
+    return batcher.get_stats()
+
 if __name__ == "__main__":
     import uvicorn
     print(" Starting VinAI Translation Backend")
@@ -2,6 +2,8 @@
 Configuration for Vietnamese Translation System
 """
 
+import os
+
 # Backend Configuration
 BACKEND_URL = "http://localhost:8003"
 BACKEND_HOST = "0.0.0.0"
@@ -22,6 +24,25 @@ TRANSLATION_TIMEOUT = 30
 BEAM_SIZE = 4
 EARLY_STOPPING = True
 
+# Dynamic micro-batching (texts of concurrent requests share one model call)
+BATCH_MAX_SIZE = 32
+BATCH_MAX_WAIT_MS = 10
+
+# Length-bucketed generation: padded source tokens per generate() call
+BATCH_TOKEN_BUDGET = 4096
+
+# Decoding profiles (num_beams): greedy, small beam, full beam
+DECODING_PROFILES = {"fast": 1, "balanced": 2, "accurate": 5}
+DEFAULT_PROFILE = "accurate"
+
+# Output length limit derived from the source: tokens * ratio + margin (capped at MAX_LENGTH)
+MAX_NEW_TOKENS_RATIO = 1.5
+MAX_NEW_TOKENS_MARGIN = 10
+
+# Quantized CPU inference: int8 dynamic quantization of the Linear layers.
+# Opt-in (TRANSLATION_INT8=1); ignored when the model runs on GPU.
+QUANTIZE_INT8 = os.getenv("TRANSLATION_INT8", "0") == "1"
+
 # Web Configuration
 WEB_TITLE = "Vietnamese to English Translation"
 WEB_DESCRIPTION = "Vietnamese to English Translation using Facebook NLLB Model"
@@ -0,0 +1,38 @@
+"""
+Decoding profiles for generate().
+
+A profile trades quality for latency through the beam width:
+  fast      greedy search (1 beam)
+  balanced  small beam (2)
+  accurate  full beam (5 for VinAI, BEAM_SIZE for NLLB)
+
+Generation length is bounded by max_new_tokens derived from the source length
+instead of a fixed max_length, so short claims cannot decode up to 512 tokens.
+"""
+
+import math
+from typing import Dict, Literal, Optional
+
+from config import (
+    DECODING_PROFILES, MAX_LENGTH, MAX_NEW_TOKENS_MARGIN, MAX_NEW_TOKENS_RATIO
+)
+
+Profile = Literal["fast", "balanced", "accurate"]
+
+
+def max_new_tokens(source_tokens: int) -> int:
+    """Output token limit for a source of `source_tokens` tokens"""
+    return min(MAX_LENGTH, math.ceil(source_tokens * MAX_NEW_TOKENS_RATIO) + MAX_NEW_TOKENS_MARGIN)
+
+
+def generation_kwargs(profile: str, source_tokens: int, max_beams: Optional[int] = None) -> Dict:
+    """generate() arguments for a profile; `max_beams` caps the beam width for models
+    whose full beam is narrower than the default"""
+    num_beams = DECODING_PROFILES[profile]
+    if max_beams is not None:
+        num_beams = min(num_beams, max_beams)
+    return {
+        "num_beams": num_beams,
+        "early_stopping": num_beams > 1,
+        "max_new_tokens": max_new_tokens(source_tokens),
+    }
@@ -12,6 +12,10 @@ from transformers import AutoTokenizer, AutoModelForSeq2SeqLM
 import time
 import os
 
+from config import BEAM_SIZE, DEFAULT_PROFILE, QUANTIZE_INT8
+from decoding import Profile, generation_kwargs
+from quantization import quantize_int8
+
 app = FastAPI(title="Facebook NLLB Backend", version="1.0.0")
 
 # Enable CORS
@@ -25,6 +29,7 @@ app.add_middleware(
 class TranslationRequest(BaseModel):
     text: str
     max_length: int = 512
+    profile: Profile = DEFAULT_PROFILE
 
 class TranslationResponse(BaseModel):
     vietnamese: str
@@ -35,12 +40,13 @@ class TranslationResponse(BaseModel):
 
 # Facebook NLLB Translator
 class FacebookNLLBTranslator:
-    def __init__(self):
+    def __init__(self, quantize: bool = QUANTIZE_INT8):
         self.model_path = "facebook/nllb-200-distilled-600M"
         self.device = torch.device("cpu")
         self.model = None
         self.tokenizer = None
         self.is_loaded = False
+        self.quantize = quantize  # int8 dynamic quantization (CPU)
         
         # Cache directory
         self.cache_dir = "D:/huggingface_cache"
@@ -68,9 +74,11 @@ class FacebookNLLBTranslator:
             )
             self.model.eval()
             self.model.to(self.device)
+            if self.quantize and self.device.type == "cpu":
+                self.model = quantize_int8(self.model)
             
             load_time = time.time() - start_time
-            print(f" Facebook NLLB model loaded in {load_time:.2f} seconds")
+            print(f" Facebook NLLB model loaded{' (int8)' if self.quantize else ''} in {load_time:.2f} seconds")
             
             # Language codes
             self.vi_lang_code = "vie_Latn"
@@ -81,7 +89,7 @@ class FacebookNLLBTranslator:
             print(f" Failed to load Facebook model: {e}")
             raise Exception(f"Facebook model loading failed: {e}")
     
-    def translate_vi_to_en(self, text: str) -> str:
+    def translate_vi_to_en(self, text: str, profile: str = DEFAULT_PROFILE) -> str:
         """Translate using Facebook NLLB model"""
         if not self.is_loaded:
             self.load_model()
@@ -106,9 +114,7 @@ class FacebookNLLBTranslator:
                 outputs = self.model.generate(
                     **inputs,
                     forced_bos_token_id=self.tokenizer.convert_tokens_to_ids(self.en_lang_code),
-                    max_length=512,
-                    num_beams=4,
-                    early_stopping=True
+                    **generation_kwargs(profile, inputs["input_ids"].shape[1], max_beams=BEAM_SIZE)
                 )
             
             # Decode
@@ -140,6 +146,7 @@ async def root():
         "status": "healthy", 
         "model": "facebook/nllb-200-distilled-600M",
         "using_facebook_model": facebook_translator is not None,
+        "quantized": facebook_translator.quantize if facebook_translator else False,
         "facebook_model_loaded": facebook_translator.is_loaded if facebook_translator else False
     }
 
@@ -156,7 +163,7 @@ async def translate(request: TranslationRequest):
         start_time = time.time()
         
         # Call REAL Facebook model
-        english_text = facebook_translator.translate_vi_to_en(request.text)
+        english_text = facebook_translator.translate_vi_to_en(request.text, request.profile)
         
         translation_time = time.time() - start_time
         
@@ -0,0 +1,166 @@
+"""
+Dynamic micro-batching for the translation backends.
+
+Texts from concurrent /translate and /translate_batch requests go into one
+queue. A dedicated worker thread takes the first waiting text, keeps collecting
+until the batch is full or the wait budget runs out, translates the unique
+texts of the batch in one model call and resolves every waiting request.
+
+Queued items are usually texts, but any hashable request works, e.g.
+(text, decoding profile) pairs that `process_batch` groups itself.
+"""
+
+import asyncio
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Dict, Hashable, List, Optional
+
+
+def length_bucketed_batches(lengths: List[int], token_budget: int, max_batch_size: int) -> List[List[int]]:
+    """Split item indices into batches of similar length.
+
+    Items are sorted by token length and a batch is closed when its padded size
+    (items x longest item) would exceed `token_budget`, or when it holds
+    `max_batch_size` items. An item longer than the budget gets a batch of its own.
+    """
+    order = sorted(range(len(lengths)), key=lambda i: lengths[i])
+    batches: List[List[int]] = []
+    batch: List[int] = []
+    for i in order:
+        # Sorted ascending, so the new item is the longest of the batch
+        if batch and ((len(batch) + 1) * lengths[i] > token_budget or len(batch) >= max_batch_size):
+            batches.append(batch)
+            batch = []
+        batch.append(i)
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+class MicroBatcher:
+    """Coalesces texts from concurrent requests into batched model calls"""
+
+    def __init__(self, process_batch: Callable[[List[Hashable]], List[str]],
+                 max_batch_size: int = 32, max_wait: float = 0.01, name: str = "translation"):
+        self.process_batch = process_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.name = name
+
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+        # Metrics
+        self.submitted_texts = 0
+        self.batches = 0
+        self.batched_texts = 0
+        self.deduplicated_texts = 0
+        self.max_queue_depth = 0
+        self.total_queue_wait = 0.0
+        self.total_batch_time = 0.0
+        self.total_fill = 0.0
+
+    def start(self):
+        """Start the worker thread (idempotent)"""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name=f"{self.name}-batcher", daemon=True)
+                self._thread.start()
+
+    def stop(self):
+        """Stop the worker thread once the queued texts are processed"""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def submit(self, item: Hashable) -> Future:
+        """Queue one text (or request item); the future resolves to its translation"""
+        self.start()
+        future: Future = Future()
+        self._queue.put((item, future, time.perf_counter()))
+        self.submitted_texts += 1
+        self.max_queue_depth = max(self.max_queue_depth, self._queue.qsize())
+        return future
+
+    async def translate(self, items: List[Hashable]) -> List[str]:
+        """Translate texts (or request items) through the shared batches, keeping their order"""
+        futures = [asyncio.wrap_future(self.submit(item)) for item in items]
+        return list(await asyncio.gather(*futures))
+
+    def _collect(self, first) -> Dict[Hashable, List]:
+        """Group waiting items by text until the batch is full or max_wait has passed"""
+        pending: Dict[Hashable, List] = {}
+        item = first
+        deadline = time.perf_counter() + self.max_wait
+        while True:
+            text, future, enqueued_at = item
+            # Skip requests that were cancelled while queued (e.g. client disconnected)
+            if future.set_running_or_notify_cancel():
+                self.total_queue_wait += time.perf_counter() - enqueued_at
+                pending.setdefault(text, []).append(future)
+            if len(pending) >= self.max_batch_size:
+                break
+            remaining = deadline - time.perf_counter()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                self._queue.put(None)  # stop after this batch
+                break
+        return pending
+
+    def _run(self):
+        while True:
+            first = self._queue.get()
+            if first is None:
+                break
+
+            pending = self._collect(first)
+            if not pending:
+                continue
+
+            texts = list(pending)
+            start = time.perf_counter()
+            try:
+                results = self.process_batch(texts)
+                if len(results) != len(texts):
+                    raise RuntimeError(f"Batch returned {len(results)} results for {len(texts)} texts")
+            except Exception as e:
+                for futures in pending.values():
+                    for future in futures:
+                        future.set_exception(e)
+                continue
+            finally:
+                self.total_batch_time += time.perf_counter() - start
+
+            for text, result in zip(texts, results):
+                for future in pending[text]:
+                    future.set_result(result)
+
+            waiting = sum(len(futures) for futures in pending.values())
+            self.batches += 1
+            self.batched_texts += len(texts)
+            self.deduplicated_texts += waiting - len(texts)
+            self.total_fill += len(texts) / self.max_batch_size
+
+    def get_stats(self) -> Dict:
+        batches = self.batches or 1
+        return {
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait * 1000,
+            "queue_depth": self._queue.qsize(),
+            "max_queue_depth": self.max_queue_depth,
+            "submitted_texts": self.submitted_texts,
+            "batches": self.batches,
+            "batched_texts": self.batched_texts,
+            "deduplicated_texts": self.deduplicated_texts,
+            "avg_batch_size": round(self.batched_texts / batches, 2),
+            "avg_batch_fill": round(self.total_fill / batches, 3),
+            "avg_queue_wait_ms": round(self.total_queue_wait / max(1, self.submitted_texts) * 1000, 2),
+            "avg_batch_time_ms": round(self.total_batch_time / batches * 1000, 2),
+        }
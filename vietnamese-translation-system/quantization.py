@@ -0,0 +1,24 @@
+"""
+Int8 dynamic quantization for CPU inference.
+
+Weights of every nn.Linear are stored as int8 and activations are quantized on
+the fly, which shrinks the model roughly 4x and speeds up the matrix products
+that dominate encoder-decoder generation on CPU. Embeddings and layer norms
+stay fp32. Only used on CPU: PyTorch dynamic quantization has no CUDA kernels.
+"""
+
+import io
+
+import torch
+
+
+def quantize_int8(model: torch.nn.Module) -> torch.nn.Module:
+    """Quantize an eval-mode CPU model to int8 in place (no second fp32 copy in memory)"""
+    return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True)
+
+
+def model_size_mb(model: torch.nn.Module) -> float:
+    """Serialized size of the model weights in MB"""
+    buffer = io.BytesIO()
+    torch.save(model.state_dict(), buffer)
+    return buffer.tell() / 1024 ** 2